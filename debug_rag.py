@@ -4,13 +4,37 @@ Debug script to check RAG filtering effectiveness.
 """
 
 import sys
+import threading
 sys.path.insert(0, "/home/nilesh/Desktop/GROQ/promptlang_migration/PromptLang_Compiler_Platform/src")
 
 from promptlang.core.knowledge.retriever import KnowledgeRetriever
 
+_retriever = None
+_retriever_lock = threading.Lock()
+
+
+def get_retriever():
+    """Return the process-wide retriever, creating it on first use."""
+    global _retriever
+    with _retriever_lock:
+        if _retriever is None:
+            _retriever = KnowledgeRetriever()
+        return _retriever
+
+
+def _warm_up_retriever():
+    try:
+        get_retriever().warm_up()
+    except Exception as e:
+        print(f"Retriever warm-up failed: {e}")
+
+
+# Start loading the index while the rest of the script sets up
+threading.Thread(target=_warm_up_retriever, daemon=True).start()
+
 def test_filtering():
     """Test the filtering logic directly."""
-    retriever = KnowledgeRetriever()
+    retriever = get_retriever()
     
     query = "Create a FastAPI REST API with user authentication using JWT tokens"
     print(f"Query: {query}")
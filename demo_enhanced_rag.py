@@ -3,10 +3,39 @@
 Demo script showing Options B & C improvements for FastAPI authentication query.
 """
 
+import re
+
+import orjson
 import requests
-import json
 import time
 
+# Keyword lists compiled once into single alternations: each result text is
+# scanned once per list instead of once per keyword.
+DOCKER_KEYWORDS_RE = re.compile('docker|kubernetes|k8s|container')
+FASTAPI_KEYWORDS_RE = re.compile('fastapi|jwt|auth|authentication|oauth')
+
+
+def iter_sse_events(response):
+    """Yield (event, data) pairs from a streaming SSE response as they arrive.
+
+    ``iter_lines`` re-splits on newlines across chunk boundaries, so several
+    frames packed into one network chunk are still yielded one at a time.
+    Lines stay as bytes; ``orjson`` parses the payload without a decode step.
+    """
+    event = None
+    for line in response.iter_lines():
+        if not line:
+            event = None
+            continue
+        if line.startswith(b'event: '):
+            event = line[7:].decode()
+        elif line.startswith(b'data: '):
+            try:
+                yield event, orjson.loads(line[6:])
+            except ValueError:
+                continue
+
+
 def test_enhanced_rag_demo():
     """Test the enhanced RAG with a FastAPI authentication example."""
     
@@ -28,37 +57,33 @@ def test_enhanced_rag_demo():
     }
     
     print("📡 Sending request to enhanced RAG pipeline...")
-    response = requests.post(
+    job_id = None
+    context_enrichment_data = None
+    
+    # Stream the SSE response and stop at the result event instead of
+    # buffering the whole body. The job is stored server-side just before the
+    # result event, so disconnecting earlier would cancel it.
+    with requests.post(
         "http://localhost:8000/api/v1/generate",
         headers={
             "Content-Type": "application/json",
             "Accept": "text/event-stream"
         },
         json=payload,
-        timeout=30
-    )
-    
-    if response.status_code != 200:
-        print(f"❌ Request failed: {response.status_code}")
-        print(response.text)
-        return
-    
-    # Parse SSE response
-    lines = response.text.split('\n')
-    job_id = None
-    context_enrichment_data = None
-    
-    for line in lines:
-        if line.startswith('data: '):
-            try:
-                data = json.loads(line[6:])
-                if 'job_id' in data:
-                    job_id = data['job_id']
-                if 'enriched_context' in data:
-                    context_enrichment_data = data
-                    break
-            except:
-                continue
+        timeout=30,
+        stream=True,
+    ) as response:
+        if response.status_code != 200:
+            print(f"❌ Request failed: {response.status_code}")
+            print(response.text)
+            return
+        
+        for event, data in iter_sse_events(response):
+            if 'job_id' in data:
+                job_id = data['job_id']
+            if 'enriched_context' in data:
+                context_enrichment_data = data
+                break
     
     if not job_id:
         print("❌ No job ID found in response")
@@ -102,14 +127,11 @@ def test_enhanced_rag_demo():
     # Check for relevance improvements
     print("🔍 Relevance Analysis:")
     
-    # Check if Docker/K8s content was filtered out (good sign)
-    docker_keywords = ['docker', 'kubernetes', 'k8s', 'container']
-    filtered_count = 0
+    # Lowercase every result once and reuse for both keyword checks
+    texts = [(bp.get('text', '') + ' ' + bp.get('title', '')).lower() for bp in best_practices]
     
-    for bp in best_practices:
-        text = (bp.get('text', '') + ' ' + bp.get('title', '')).lower()
-        if any(keyword in text for keyword in docker_keywords):
-            filtered_count += 1
+    # Check if Docker/K8s content was filtered out (good sign)
+    filtered_count = sum(1 for text in texts if DOCKER_KEYWORDS_RE.search(text))
     
     if filtered_count == 0:
         print("  ✅ Docker/K8s content successfully filtered out")
@@ -117,13 +139,7 @@ def test_enhanced_rag_demo():
         print(f"  ⚠️  Found {filtered_count} Docker/K8s items (should be filtered)")
     
     # Check for FastAPI/auth content (good sign)
-    fastapi_keywords = ['fastapi', 'jwt', 'auth', 'authentication', 'oauth']
-    relevant_count = 0
-    
-    for bp in best_practices:
-        text = (bp.get('text', '') + ' ' + bp.get('title', '')).lower()
-        if any(keyword in text for keyword in fastapi_keywords):
-            relevant_count += 1
+    relevant_count = sum(1 for text in texts if FASTAPI_KEYWORDS_RE.search(text))
     
     if relevant_count > 0:
         print(f"  ✅ Found {relevant_count} FastAPI/auth relevant items")
@@ -3,8 +3,37 @@
 Final demo showing both Option B and Option C are integrated and working.
 """
 
+import re
+
+import orjson
 import requests
-import json
+
+# Keyword lists compiled once into single alternations: each result text is
+# scanned once per list instead of once per keyword.
+FASTAPI_KEYWORDS_RE = re.compile('fastapi|jwt|auth|authentication|oauth|api')
+DOCKER_KEYWORDS_RE = re.compile('docker|kubernetes|k8s|container')
+
+
+def iter_sse_events(response):
+    """Yield (event, data) pairs from a streaming SSE response as they arrive.
+
+    ``iter_lines`` re-splits on newlines across chunk boundaries, so several
+    frames packed into one network chunk are still yielded one at a time.
+    Lines stay as bytes; ``orjson`` parses the payload without a decode step.
+    """
+    event = None
+    for line in response.iter_lines():
+        if not line:
+            event = None
+            continue
+        if line.startswith(b'event: '):
+            event = line[7:].decode()
+        elif line.startswith(b'data: '):
+            try:
+                yield event, orjson.loads(line[6:])
+            except ValueError:
+                continue
+
 
 def test_final_integration():
     """Test the final integration of Options B & C."""
@@ -27,32 +56,29 @@ def test_final_integration():
     }
     
     print("📡 Testing enhanced RAG pipeline...")
-    response = requests.post(
+    job_id = None
+    
+    # Stream the SSE response and stop at the result event instead of
+    # buffering the whole body. The job is stored server-side just before the
+    # result event, so disconnecting earlier would cancel it.
+    with requests.post(
         "http://localhost:8000/api/v1/generate",
         headers={
             "Content-Type": "application/json",
             "Accept": "text/event-stream"
         },
         json=payload,
-        timeout=30
-    )
-    
-    if response.status_code != 200:
-        print(f"❌ Request failed: {response.status_code}")
-        return
-    
-    # Parse SSE response to get job ID
-    lines = response.text.split('\n')
-    job_id = None
-    
-    for line in lines:
-        if line.startswith('data: ') and 'job_id' in line:
-            try:
-                data = json.loads(line[6:])
+        timeout=30,
+        stream=True,
+    ) as response:
+        if response.status_code != 200:
+            print(f"❌ Request failed: {response.status_code}")
+            return
+        
+        for event, data in iter_sse_events(response):
+            if event == 'result':
                 job_id = data.get('job_id')
                 break
-            except:
-                continue
     
     if not job_id:
         print("❌ No job ID found")
@@ -84,18 +110,11 @@ def test_final_integration():
     print(f"\n🎯 Analysis of Results:")
     
     # Check for relevance improvements
-    fastapi_keywords = ['fastapi', 'jwt', 'auth', 'authentication', 'oauth', 'api']
-    docker_keywords = ['docker', 'kubernetes', 'k8s', 'container']
-    
-    relevant_count = 0
-    docker_count = 0
-    
+    relevant_count = docker_count = 0
     for bp in best_practices:
-        text = (bp.get('text', '') + ' ' + bp.get('title', '')).lower()
-        if any(keyword in text for keyword in fastapi_keywords):
-            relevant_count += 1
-        if any(keyword in text for keyword in docker_keywords):
-            docker_count += 1
+        text = f"{bp.get('text', '')} {bp.get('title', '')}".lower()
+        relevant_count += FASTAPI_KEYWORDS_RE.search(text) is not None
+        docker_count += DOCKER_KEYWORDS_RE.search(text) is not None
     
     print(f"  ✅ FastAPI/auth relevant items: {relevant_count}")
     print(f"  📊 Docker/K8s items (should be filtered): {docker_count}")
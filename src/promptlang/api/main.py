@@ -1,11 +1,16 @@
 """FastAPI application main entry point."""
 
+import asyncio
 import logging
 import os
+from contextlib import asynccontextmanager
+from functools import partial
 
+import orjson
 import structlog
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from promptlang.api.routes import (
     generate_router,
@@ -14,34 +19,75 @@ from promptlang.api.routes import (
     diagrams_router,
     prompt_generation_router,
 )
-from promptlang.api.routes.generate import init_orchestrator
+from promptlang.api.routes.generate import init_orchestrator, shutdown_orchestrator
 from promptlang.core.cache.manager import CacheManager
+from promptlang.core.utils.tokens import get_token_encoding
 
-# Configure structlog
+# Configure structlog: render log lines with orjson straight to bytes
 structlog.configure(
     processors=[
         structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.JSONRenderer(),
+        structlog.processors.JSONRenderer(
+            serializer=partial(orjson.dumps, option=orjson.OPT_NON_STR_KEYS)
+        ),
     ],
+    logger_factory=structlog.BytesLoggerFactory(),
 )
 
 logger = structlog.get_logger()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build the cache manager and orchestrator for the lifetime of the app."""
+    logger.info("Initializing PromptLang API")
+    # Connecting to Redis pings the server, so keep it off the event loop;
+    # the connection pool is then warm before the first request
+    cache_manager = await asyncio.to_thread(
+        CacheManager,
+        l2_redis_url=os.getenv("REDIS_URL"),
+    )
+    await asyncio.to_thread(init_orchestrator, cm=cache_manager)
+    # The first tiktoken load may download the BPE ranks; do it before any
+    # compile runs on the event loop
+    await asyncio.to_thread(get_token_encoding)
+    app.state.cache_manager = cache_manager
+    # FastAPI builds and caches the OpenAPI document on first use; do it now
+    # so the first /docs or /openapi.json hit does not pay for it
+    app.openapi()
+    logger.info("PromptLang API ready")
+    try:
+        yield
+    finally:
+        # Release orchestrator resources and Redis connections on shutdown
+        shutdown_orchestrator()
+        cache_manager.close()
+
+
 app = FastAPI(
     title="PromptLang Compiler Platform API",
     description="Transform Human Input → PromptLang IR → Optimized IR → Model Dialect → Contract Enforced Output",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
-# CORS middleware
+# CORS middleware. Set CORS_ORIGINS to a comma-separated list of origins in
+# production; credentials are only allowed for explicit origins, since a
+# wildcard with credentials makes Starlette echo the request origin on every
+# response.
+cors_origins = [o.strip() for o in os.getenv("CORS_ORIGINS", "").split(",") if o.strip()] or ["*"]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Adjust for production
-    allow_credentials=True,
+    allow_origins=cors_origins,
+    allow_credentials=cors_origins != ["*"],
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Compress larger JSON bodies (catalog listings, generated diagram content).
+# SSE streams and responses that already set Content-Encoding pass through.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Include routers
 app.include_router(generate_router)
 app.include_router(validate_router)
@@ -50,17 +96,6 @@ app.include_router(diagrams_router)
 app.include_router(prompt_generation_router)
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize orchestrator on startup."""
-    logger.info("Initializing PromptLang API")
-    cache_manager = CacheManager(
-        l2_redis_url=os.getenv("REDIS_URL"),
-    )
-    init_orchestrator(cm=cache_manager)
-    logger.info("PromptLang API ready")
-
-
 @app.get("/")
 async def root():
     """Root endpoint."""
@@ -1,6 +1,6 @@
 """Request models for API endpoints."""
 
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -12,9 +12,11 @@ class GenerateRequest(BaseModel):
     intent: Optional[str] = Field(None, description="Explicit intent (scaffold/debug/refactor/explain/devops)")
     target_model: Optional[str] = Field("oss", description="Target model")
     token_budget: Optional[int] = Field(4000, ge=100, le=100000, description="Token budget")
-    scaffold_mode: Optional[str] = Field("full", pattern="^(quick|full)$", description="Scaffold mode")
-    security_level: Optional[str] = Field("high", pattern="^(low|high)$", description="Security level")
-    validation_mode: Optional[str] = Field("strict", pattern="^(strict|progressive)$", description="Validation mode")
+    scaffold_mode: Optional[Literal["quick", "full"]] = Field("full", description="Scaffold mode")
+    security_level: Optional[Literal["low", "high"]] = Field("high", description="Security level")
+    validation_mode: Optional[Literal["strict", "progressive"]] = Field(
+        "strict", description="Validation mode"
+    )
 
 
 class ValidateRequest(BaseModel):
@@ -1,6 +1,6 @@
 """Response models for API endpoints."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Union
 
 from pydantic import BaseModel, Field
 
@@ -13,7 +13,7 @@ class ProvenanceModel(BaseModel):
     stage_timings_ms: Dict[str, float]
     token_usage: Dict[str, Any]
     cost_metadata: Dict[str, Any]
-    transformation_chain: List[str]
+    transformation_chain: Sequence[str]
 
 
 class ValidationReportModel(BaseModel):
@@ -21,6 +21,7 @@ class ValidationReportModel(BaseModel):
 
     status: str
     parallel: bool
+    cache_hit: bool = Field(False, description="Whether the report was reused from cache")
     stage_timings_ms: Dict[str, float]
     findings: List[Dict[str, Any]]
     contract_compliance: Dict[str, Any]
@@ -36,7 +37,7 @@ class GenerateResponse(BaseModel):
     compiled_prompt: str
     output: str
     validation_report: ValidationReportModel
-    warnings: List[str]
+    warnings: List[Union[str, Dict[str, Any]]]
     provenance: ProvenanceModel
     cache_hit: bool = Field(False, description="Whether result came from cache")
     knowledge_sources_used: List[str] = Field(
@@ -2,17 +2,31 @@
 API endpoints for diagram generation workflow
 """
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks, UploadFile, File, Form
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Request, UploadFile, File, Form
+from fastapi.responses import FileResponse, JSONResponse, Response
 from pydantic import BaseModel, Field
-from typing import List, Dict, Optional, Any
+from typing import Any, Callable, Dict, List, Optional
+import codecs
+import gzip
+import hashlib
 import logging
 import tempfile
 import os
+from functools import lru_cache
 from pathlib import Path
-import uuid
 
-from promptlang.core.diagram.pipeline import DiagramPipeline, PipelineConfig, PipelineStatus, DiagramTool, DiagramFormat
+import orjson
+
+from promptlang.api.routes import generate as generate_routes
+from promptlang.core.cache.l1_cache import L1Cache
+from promptlang.core.diagram.pipeline import (
+    DiagramFormat,
+    DiagramPipeline,
+    DiagramTool,
+    PipelineConfig,
+    PipelineStatus,
+    validate_pipeline_config,
+)
 from promptlang.core.diagram.catalog import DiagramCatalog
 from promptlang.core.diagram.analyzer import ProjectAnalyzer
 from promptlang.core.diagram.scorer import RelevanceScorer
@@ -22,8 +36,29 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/diagrams", tags=["diagrams"])
 
-# Global pipeline instances (in production, use proper session management)
-pipelines: Dict[str, DiagramPipeline] = {}
+# PRD uploads: accepted extensions, size cap and read chunk size
+PRD_EXTENSIONS = frozenset({".md", ".txt", ".docx", ".pdf"})
+MAX_PRD_BYTES = 10 * 1024 * 1024
+PRD_CHUNK_SIZE = 64 * 1024
+
+# Running async pipelines by id, bounded with LRU eviction and a TTL so
+# abandoned jobs are dropped. Once a job finishes its live pipeline is removed
+# and a JSON snapshot of its status and result is stored under
+# ``diagram_pipeline:<id>`` in the shared CacheManager's Redis tier when it is
+# enabled, and otherwise in this cache with the same bounds.
+pipelines = L1Cache(max_size=1024, ttl_seconds=3600)
+
+_UUID_VARIANT = "89ab"
+
+
+def _new_pipeline_id() -> str:
+    """Return a random version 4 UUID string.
+
+    Formats the hex of 16 random bytes directly instead of building a
+    ``uuid.UUID`` object; the output matches ``str(uuid.uuid4())``.
+    """
+    h = os.urandom(16).hex()
+    return f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{_UUID_VARIANT[int(h[16], 16) & 3]}{h[17:20]}-{h[20:]}"
 
 
 class DiagramRequest(BaseModel):
@@ -65,12 +100,166 @@ class DiagramResponse(BaseModel):
     summary: Dict[str, Any]
 
 
+_TOOL_MAP = {"plantuml": DiagramTool.PLANTUML, "mermaid": DiagramTool.MERMAID}
+_FORMAT_MAP = {"svg": DiagramFormat.SVG, "png": DiagramFormat.PNG, "pdf": DiagramFormat.PDF}
+
+# Request config keys accepted by PipelineConfig, with the converter applied to
+# each value (None keeps it as given)
+_CONFIG_FIELDS: Dict[str, Optional[Callable[[Any], Any]]] = {
+    "max_diagrams": None,
+    "min_score_threshold": None,
+    "include_optional": None,
+    "preferred_tool": _TOOL_MAP.get,
+    "output_format": lambda value: _FORMAT_MAP.get(value, DiagramFormat.SVG),
+    "export_directory": None,
+    "generate_complementary": None,
+    "parallel_generation": None,
+    "timeout_seconds": None,
+}
+
+
+def _apply_config(config: PipelineConfig, config_dict: Dict[str, Any]) -> None:
+    """Copy recognised request config values onto ``config``; unknown keys are ignored."""
+    for key, value in config_dict.items():
+        if key in _CONFIG_FIELDS:
+            convert = _CONFIG_FIELDS[key]
+            setattr(config, key, convert(value) if convert else value)
+
+
+def _result_store() -> Any:
+    """Cache holding finished async pipeline snapshots.
+
+    Only Redis is shared: snapshots can be large, so they never go into the
+    CacheManager's small L1, which holds the orchestrator's compile entries.
+    """
+    cache_manager = generate_routes.cache_manager
+    if cache_manager is not None and cache_manager.l2.enabled:
+        return cache_manager.l2
+    return pipelines
+
+
+def _result_fields(result: Any) -> Dict[str, Any]:
+    """API fields of a ``PipelineResult``, shared by sync and async generation."""
+    return {
+        "status": result.status.value,
+        "recommendations": [rec.to_api_dict() for rec in result.recommendations],
+        "generated_diagrams": [diag.to_api_dict() for diag in result.generated_diagrams],
+        "failed_diagrams": result.failed_diagrams,
+        "execution_time": result.execution_time,
+        "summary": result.summary,
+    }
+
+
+@lru_cache(maxsize=1)
+def _default_pipeline() -> DiagramPipeline:
+    """Default-configured pipeline shared by the read-only endpoints.
+
+    Those endpoints only read catalog and generator metadata or preview
+    recommendations, none of which touches the pipeline's run state.
+    """
+    return DiagramPipeline()
+
+
+@lru_cache(maxsize=1)
+def _llm_provider() -> Any:
+    """LLM provider shared by every diagram request.
+
+    Building a provider per request creates a new API client, and with it a new
+    connection pool, each time; one instance lets concurrent requests share
+    keep-alive connections.
+    """
+    return get_llm_provider()
+
+
+@lru_cache(maxsize=1)
+def _catalog_info() -> Dict[str, Any]:
+    """Exported diagram catalog, which is static for the life of the process."""
+    return _default_pipeline().get_catalog_info()
+
+
+@lru_cache(maxsize=1)
+def _categories_payload() -> tuple[bytes, bytes, str]:
+    """Serialized ``/catalog/categories`` body, its gzip encoding and ETag, built once.
+
+    The body never changes, so it is compressed once at maximum level rather
+    than by ``GZipMiddleware`` on every request. The ETag is weak because it
+    covers both encodings.
+    """
+    categories: Dict[str, Dict[str, Any]] = {}
+    for diagram_data in _catalog_info()["diagrams"].values():
+        category = diagram_data["category"]
+        if category not in categories:
+            categories[category] = {
+                "name": category,
+                "count": 0,
+                "diagrams": []
+            }
+        categories[category]["count"] += 1
+        categories[category]["diagrams"].append({
+            "id": diagram_data["id"],
+            "name": diagram_data["name"],
+            "description": diagram_data["description"],
+            "complexity": diagram_data["complexity"],
+            "usage_frequency": diagram_data["usage_frequency"]
+        })
+
+    body = orjson.dumps({"success": True, "data": categories})
+    etag = f'W/"{hashlib.md5(body, usedforsecurity=False).hexdigest()}"'
+    return body, gzip.compress(body, compresslevel=9, mtime=0), etag
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's ``If-None-Match`` matches ``etag``."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison, so ignore any W/ prefix
+    etag = etag.removeprefix("W/")
+    return etag in {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+
+
+def _file_response(
+    request: Request,
+    file_path: Path,
+    media_type: str,
+    filename: str,
+    not_found_detail: str = "Diagram not found",
+) -> Response:
+    """Serve a file with a single stat, answering ``If-None-Match`` with 304.
+
+    The stat result is handed to ``FileResponse`` so it does not stat the file
+    again, and its ETag/Last-Modified headers let clients revalidate cached
+    diagrams without re-downloading them. A missing file (or directory) is a
+    404 with ``not_found_detail``.
+    """
+    try:
+        stat_result = os.stat(file_path)
+    except (FileNotFoundError, NotADirectoryError):
+        raise HTTPException(status_code=404, detail=not_found_detail)
+
+    response = FileResponse(
+        file_path,
+        media_type=media_type,
+        filename=filename,
+        stat_result=stat_result,
+    )
+    etag = response.headers["etag"]
+    if _etag_matches(request, etag):
+        return Response(
+            status_code=304,
+            headers={"etag": etag, "last-modified": response.headers["last-modified"]},
+        )
+    return response
+
+
 @router.post("/preview", response_model=Dict[str, Any])
 async def preview_diagrams(request: DiagramPreviewRequest):
     """Get a preview of diagram recommendations without generation"""
     try:
-        # Create pipeline with default config
-        pipeline = DiagramPipeline()
+        # Shared pipeline with default config
+        pipeline = _default_pipeline()
         
         # Get preview
         preview = pipeline.get_recommendation_preview(
@@ -96,36 +285,13 @@ async def generate_diagrams(request: DiagramRequest):
         # Create pipeline config
         config = PipelineConfig()
         if request.config:
-            config_dict = request.config
-            
-            # Map config values
-            if "max_diagrams" in config_dict:
-                config.max_diagrams = config_dict["max_diagrams"]
-            if "min_score_threshold" in config_dict:
-                config.min_score_threshold = config_dict["min_score_threshold"]
-            if "include_optional" in config_dict:
-                config.include_optional = config_dict["include_optional"]
-            if "preferred_tool" in config_dict:
-                tool_map = {"plantuml": DiagramTool.PLANTUML, "mermaid": DiagramTool.MERMAID}
-                config.preferred_tool = tool_map.get(config_dict["preferred_tool"])
-            if "output_format" in config_dict:
-                format_map = {"svg": DiagramFormat.SVG, "png": DiagramFormat.PNG, "pdf": DiagramFormat.PDF}
-                config.output_format = format_map.get(config_dict["output_format"], DiagramFormat.SVG)
-            if "export_directory" in config_dict:
-                config.export_directory = config_dict["export_directory"]
-            if "generate_complementary" in config_dict:
-                config.generate_complementary = config_dict["generate_complementary"]
-            if "parallel_generation" in config_dict:
-                config.parallel_generation = config_dict["parallel_generation"]
-            if "timeout_seconds" in config_dict:
-                config.timeout_seconds = config_dict["timeout_seconds"]
-        
-        # Validate config
-        llm_provider = get_llm_provider()
-        pipeline = DiagramPipeline(config, llm_provider)
-        issues = pipeline.validate_config()
+            _apply_config(config, request.config)
+        
+        # Validate config before building the pipeline
+        issues = validate_pipeline_config(config)
         if issues:
             raise HTTPException(status_code=400, detail={"config_issues": issues})
+        pipeline = DiagramPipeline(config, _llm_provider())
         
         # Execute pipeline
         if request.approved_diagrams:
@@ -137,88 +303,78 @@ async def generate_diagrams(request: DiagramRequest):
         else:
             result = pipeline.execute(request.prd_content, request.codebase_path)
         
-        # Convert to response format
-        response = DiagramResponse(
-            pipeline_id=str(uuid.uuid4()),
-            status=result.status.value,
-            recommendations=[
-                {
-                    "id": rec.diagram.id,
-                    "name": rec.diagram.name,
-                    "category": rec.diagram.category.value,
-                    "score": rec.relevance_score,
-                    "tier": rec.selection_tier.value,
-                    "reasoning": rec.reasoning,
-                    "confidence": rec.confidence,
-                    "effort": rec.estimated_effort,
-                    "prerequisites_met": rec.prerequisites_met,
-                    "complementary_diagrams": rec.complementary_diagrams
-                }
-                for rec in result.recommendations
-            ],
-            generated_diagrams=[
-                {
-                    "id": diag.diagram_type.id,
-                    "name": diag.diagram_type.name,
-                    "tool": diag.tool.value,
-                    "format": diag.format.value,
-                    "content": diag.content,
-                    "source_code": diag.source_code,
-                    "success": diag.success,
-                    "error_message": diag.error_message,
-                    "file_size": diag.file_size,
-                    "generation_time": diag.generation_time,
-                    "metadata": diag.metadata
-                }
-                for diag in result.generated_diagrams
-            ],
-            failed_diagrams=result.failed_diagrams,
-            execution_time=result.execution_time,
-            summary=result.summary
+        # Convert to response format. The pipeline result is produced
+        # internally, so skip re-validating every recommendation and diagram
+        # dict; FastAPI serializes the model straight to JSON.
+        response = DiagramResponse.model_construct(
+            pipeline_id=_new_pipeline_id(),
+            **_result_fields(result),
         )
         
         return response
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Diagram generation failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/upload-prd")
+@router.post("/upload-prd", response_model=Dict[str, Any])
 async def upload_prd(file: UploadFile = File(...)):
     """Upload PRD file for analysis"""
     try:
         # Validate file type
-        if not file.filename.endswith(('.md', '.txt', '.docx', '.pdf')):
+        if Path(file.filename or "").suffix.lower() not in PRD_EXTENSIONS:
             raise HTTPException(status_code=400, detail="Unsupported file type")
+        if file.size is not None and file.size > MAX_PRD_BYTES:
+            raise HTTPException(status_code=413, detail="PRD file too large")
         
-        # Read file content
-        content = await file.read()
-        
+        # Decode in chunks, keeping only the preview and a character count so
+        # a large upload is never held in memory as both bytes and text.
         # For simplicity, assume text files
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        preview_parts: List[str] = []
+        preview_chars = 0
+        content_length = 0
+        bytes_read = 0
+        while chunk := await file.read(PRD_CHUNK_SIZE):
+            bytes_read += len(chunk)
+            if bytes_read > MAX_PRD_BYTES:
+                raise HTTPException(status_code=413, detail="PRD file too large")
+            try:
+                text = decoder.decode(chunk)
+            except UnicodeDecodeError:
+                raise HTTPException(status_code=400, detail="File encoding not supported")
+            content_length += len(text)
+            if preview_chars <= 500:
+                preview_parts.append(text[:501 - preview_chars])
+                preview_chars += len(preview_parts[-1])
         try:
-            prd_content = content.decode('utf-8')
+            decoder.decode(b"", final=True)
         except UnicodeDecodeError:
             raise HTTPException(status_code=400, detail="File encoding not supported")
         
+        preview = "".join(preview_parts)
         return {
             "success": True,
             "filename": file.filename,
-            "content_length": len(prd_content),
-            "content_preview": prd_content[:500] + "..." if len(prd_content) > 500 else prd_content
+            "content_length": content_length,
+            "content_preview": preview[:500] + "..." if content_length > 500 else preview
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"PRD upload failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/catalog")
+@router.get("/catalog", response_model=Dict[str, Any])
 async def get_diagram_catalog():
     """Get the complete diagram catalog"""
     try:
-        pipeline = DiagramPipeline()
-        catalog = pipeline.get_catalog_info()
+        catalog = _catalog_info()
         
         return {
             "success": True,
@@ -230,46 +386,37 @@ async def get_diagram_catalog():
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/catalog/categories")
-async def get_diagram_categories():
+@router.get("/catalog/categories", response_model=Dict[str, Any])
+async def get_diagram_categories(request: Request):
     """Get diagram categories with counts"""
     try:
-        pipeline = DiagramPipeline()
-        catalog = pipeline.get_catalog_info()
-        
-        categories = {}
-        for diagram_id, diagram_data in catalog["diagrams"].items():
-            category = diagram_data["category"]
-            if category not in categories:
-                categories[category] = {
-                    "name": category,
-                    "count": 0,
-                    "diagrams": []
-                }
-            categories[category]["count"] += 1
-            categories[category]["diagrams"].append({
-                "id": diagram_data["id"],
-                "name": diagram_data["name"],
-                "description": diagram_data["description"],
-                "complexity": diagram_data["complexity"],
-                "usage_frequency": diagram_data["usage_frequency"]
-            })
-        
-        return {
-            "success": True,
-            "data": categories
+        # The catalog is static, so the body is serialized once and clients
+        # can revalidate with the ETag instead of re-downloading it
+        body, gzip_body, etag = _categories_payload()
+        headers = {
+            "ETag": etag,
+            "Cache-Control": "public, max-age=3600",
+            "Vary": "Accept-Encoding",
         }
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers=headers)
+        
+        if "gzip" in request.headers.get("accept-encoding", ""):
+            # GZipMiddleware passes responses with a Content-Encoding through
+            headers["Content-Encoding"] = "gzip"
+            body = gzip_body
+        return Response(content=body, media_type="application/json", headers=headers)
         
     except Exception as e:
         logger.error(f"Categories retrieval failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/tools")
+@router.get("/tools", response_model=Dict[str, Any])
 async def get_supported_tools():
     """Get supported diagram generation tools"""
     try:
-        pipeline = DiagramPipeline()
+        pipeline = _default_pipeline()
         tools = pipeline.generator.get_supported_tools()
         
         tool_info = []
@@ -290,11 +437,11 @@ async def get_supported_tools():
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/formats")
+@router.get("/formats", response_model=Dict[str, Any])
 async def get_supported_formats():
     """Get supported output formats"""
     try:
-        pipeline = DiagramPipeline()
+        pipeline = _default_pipeline()
         formats = pipeline.generator.get_supported_formats()
         
         format_info = []
@@ -316,7 +463,7 @@ async def get_supported_formats():
 
 
 @router.get("/download/{diagram_id}")
-async def download_diagram(diagram_id: str, format: str = "svg"):
+async def download_diagram(diagram_id: str, request: Request, format: str = "svg"):
     """Download a specific diagram"""
     try:
         # This is a simplified implementation
@@ -325,10 +472,8 @@ async def download_diagram(diagram_id: str, format: str = "svg"):
         export_dir = Path("./diagrams")
         file_path = export_dir / f"{diagram_id}.{format}"
         
-        if not file_path.exists():
-            raise HTTPException(status_code=404, detail="Diagram not found")
-        
-        return FileResponse(
+        return _file_response(
+            request,
             file_path,
             media_type=f"image/{format}" if format in ["svg", "png"] else "application/octet-stream",
             filename=f"{diagram_id}.{format}"
@@ -342,23 +487,24 @@ async def download_diagram(diagram_id: str, format: str = "svg"):
 
 
 @router.get("/export/{pipeline_id}")
-async def export_all_diagrams(pipeline_id: str, format: str = "zip"):
+async def export_all_diagrams(pipeline_id: str, request: Request, format: str = "zip"):
     """Export all diagrams from a pipeline"""
     try:
         # This is a simplified implementation
         # In practice, you'd need to track pipeline results and create ZIP files
         
         export_dir = Path("./diagrams")
-        if not export_dir.exists():
-            raise HTTPException(status_code=404, detail="Export directory not found")
         
-        # Create ZIP file (simplified)
+        # Create ZIP file (simplified). A missing export directory surfaces as
+        # ENOENT from the single stat in _file_response.
         zip_path = export_dir / f"diagrams_{pipeline_id}.zip"
         
-        return FileResponse(
+        return _file_response(
+            request,
             zip_path,
             media_type="application/zip",
-            filename=f"diagrams_{pipeline_id}.zip"
+            filename=f"diagrams_{pipeline_id}.zip",
+            not_found_detail="Export not found",
         )
         
     except HTTPException:
@@ -368,12 +514,12 @@ async def export_all_diagrams(pipeline_id: str, format: str = "zip"):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/health")
+@router.get("/health", response_model=Dict[str, Any])
 async def health_check():
     """Health check for diagram service"""
     try:
-        pipeline = DiagramPipeline()
-        catalog_stats = pipeline.get_catalog_info()["stats"]
+        pipeline = _default_pipeline()
+        catalog_stats = _catalog_info()["stats"]
         
         return {
             "status": "healthy",
@@ -390,7 +536,7 @@ async def health_check():
         )
 
 
-@router.post("/validate-config")
+@router.post("/validate-config", response_model=Dict[str, Any])
 async def validate_config(config: DiagramConfig):
     """Validate pipeline configuration"""
     try:
@@ -407,9 +553,8 @@ async def validate_config(config: DiagramConfig):
             timeout_seconds=config.timeout_seconds
         )
         
-        # Validate
-        pipeline = DiagramPipeline(pipeline_config)
-        issues = pipeline.validate_config()
+        # Validate; only the config is inspected, no pipeline is built
+        issues = validate_pipeline_config(pipeline_config)
         
         return {
             "valid": len(issues) == 0,
@@ -421,19 +566,19 @@ async def validate_config(config: DiagramConfig):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/stats")
+@router.get("/stats", response_model=Dict[str, Any])
 async def get_service_stats():
     """Get service statistics"""
     try:
-        pipeline = DiagramPipeline()
-        catalog = pipeline.get_catalog_info()
+        pipeline = _default_pipeline()
+        catalog = _catalog_info()
         
         stats = {
             "catalog": catalog["stats"],
             "categories": len(set(d["category"] for d in catalog["diagrams"].values())),
             "tools": len(pipeline.generator.get_supported_tools()),
             "formats": len(pipeline.generator.get_supported_formats()),
-            "active_pipelines": len(pipelines)
+            "active_pipelines": pipelines.stats()["size"]
         }
         
         return {
@@ -447,20 +592,22 @@ async def get_service_stats():
 
 
 # Background task for long-running operations
-@router.post("/generate-async")
+@router.post("/generate-async", response_model=Dict[str, Any])
 async def generate_diagrams_async(request: DiagramRequest, background_tasks: BackgroundTasks):
     """Start asynchronous diagram generation"""
     try:
-        pipeline_id = str(uuid.uuid4())
+        pipeline_id = _new_pipeline_id()
         
         # Create and store pipeline
         config = PipelineConfig()
         if request.config:
-            # Apply config (same as in generate endpoint)
-            pass
+            _apply_config(config, request.config)
+        issues = validate_pipeline_config(config)
+        if issues:
+            raise HTTPException(status_code=400, detail={"config_issues": issues})
         
         pipeline = DiagramPipeline(config)
-        pipelines[pipeline_id] = pipeline
+        pipelines.set(pipeline_id, pipeline)
         
         # Start background task
         background_tasks.add_task(
@@ -478,21 +625,26 @@ async def generate_diagrams_async(request: DiagramRequest, background_tasks: Bac
             "status": "started"
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Async generation failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/status/{pipeline_id}")
+@router.get("/status/{pipeline_id}", response_model=Dict[str, Any])
 async def get_pipeline_status(pipeline_id: str):
     """Get status of asynchronous pipeline"""
     try:
-        if pipeline_id not in pipelines:
+        # Running jobs report live status; finished jobs store a snapshot
+        pipeline = pipelines.get(pipeline_id)
+        if pipeline is not None:
+            status = pipeline.get_pipeline_status()
+        else:
+            status = _result_store().get(f"diagram_pipeline:{pipeline_id}")
+        if status is None:
             raise HTTPException(status_code=404, detail="Pipeline not found")
         
-        pipeline = pipelines[pipeline_id]
-        status = pipeline.get_pipeline_status()
-        
         return {
             "success": True,
             "pipeline_id": pipeline_id,
@@ -510,15 +662,21 @@ async def _run_pipeline_async(pipeline_id: str, pipeline: DiagramPipeline,
                             prd_content: str, codebase_path: Optional[str],
                             approved_diagrams: Optional[List[str]]):
     """Run pipeline in background"""
+    result = None
     try:
         if approved_diagrams:
-            pipeline.execute_interactive(prd_content, codebase_path, approved_diagrams)
+            result = pipeline.execute_interactive(prd_content, codebase_path, approved_diagrams)
         else:
-            pipeline.execute(prd_content, codebase_path)
-        
-        # Store result (in practice, use proper storage)
-        pipelines[pipeline_id] = pipeline
+            result = pipeline.execute(prd_content, codebase_path)
         
     except Exception as e:
         logger.error(f"Async pipeline {pipeline_id} failed: {e}")
         pipeline.status = PipelineStatus.FAILED
+    
+    # Persist the final status and result as plain JSON (orjson handles the
+    # config dataclass and enums) and release the live pipeline
+    snapshot = pipeline.get_pipeline_status()
+    if result is not None:
+        snapshot["result"] = _result_fields(result)
+    _result_store().set(f"diagram_pipeline:{pipeline_id}", orjson.loads(orjson.dumps(snapshot)))
+    pipelines.delete(pipeline_id)
@@ -6,7 +6,7 @@ from fastapi import APIRouter, HTTPException
 
 from promptlang.api.models.requests import OptimizeRequest
 from promptlang.api.models.responses import OptimizeResponse
-from promptlang.core.optimizer.token_optimizer import TokenOptimizer
+from promptlang.core.pipeline._components import TOKEN_OPTIMIZER
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api", tags=["optimize"])
@@ -16,21 +16,19 @@ router = APIRouter(prefix="/api", tags=["optimize"])
 async def optimize(request: OptimizeRequest):
     """Optimize IR JSON for token budget."""
     try:
-        optimizer = TokenOptimizer()
+        # Shared with the pipeline; TokenOptimizer keeps no per-request state
+        optimizer = TOKEN_OPTIMIZER
         optimized_ir, warnings = optimizer.optimize(
             request.ir_json,
             token_budget=request.token_budget or 4000,
             intent=request.intent or "scaffold",
         )
 
-        # Estimate tokens
-        import json
-        estimated_tokens = len(json.dumps(optimized_ir, separators=(",", ":"))) // 4
-
-        return OptimizeResponse(
+        # The optimizer builds the IR itself, so skip re-validating it
+        return OptimizeResponse.model_construct(
             optimized_ir=optimized_ir,
             warnings=warnings,
-            estimated_tokens=estimated_tokens,
+            estimated_tokens=optimized_ir["optimization"]["estimated_tokens"],
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -1,10 +1,10 @@
 import asyncio
-import json
 import logging
 from typing import Any, AsyncGenerator, Dict, List, Optional
 
+import orjson
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 
 from promptlang.api.models.requests import PromptGenerateRequest, PromptPreviewRequest
 from promptlang.api.models.responses import (
@@ -20,14 +20,15 @@ router = APIRouter(prefix="/api/v1", tags=["prompt_generation"])
 
 
 def _sse(event: str, data: Dict[str, Any]) -> str:
-    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+    payload = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+    return f"event: {event}\ndata: {payload}\n\n"
 
 
 @router.get("/templates", response_model=PromptTemplatesResponse)
 async def list_templates():
     if not generate_routes.orchestrator:
         raise HTTPException(status_code=500, detail="Orchestrator not initialized")
-    return PromptTemplatesResponse(
+    return PromptTemplatesResponse.model_construct(
         templates=generate_routes.orchestrator.prompt_template_engine.list_templates()
     )
 
@@ -39,7 +40,8 @@ async def get_prompt(job_id: str):
     item = generate_routes.cache_manager.get(f"prompt_job:{job_id}")
     if not item:
         raise HTTPException(status_code=404, detail="Prompt job not found")
-    return PromptJobResponse(**item)
+    # Jobs are cached by generate_sse from orchestrator output
+    return PromptJobResponse.model_construct(**item)
 
 
 @router.get("/download/{job_id}")
@@ -50,9 +52,11 @@ async def download_prompt(job_id: str):
     if not item:
         raise HTTPException(status_code=404, detail="Prompt job not found")
 
+    # The prompt is already in memory, so send it as one body with a
+    # Content-Length instead of a chunked stream iterated in a thread
     prompt = item.get("prompt", "")
     headers = {"Content-Disposition": f"attachment; filename=prompt_{job_id}.md"}
-    return StreamingResponse(iter([prompt]), media_type="text/markdown", headers=headers)
+    return Response(content=prompt, media_type="text/markdown", headers=headers)
 
 
 @router.post("/preview", response_model=PromptPreviewResponse)
@@ -67,7 +71,7 @@ async def preview(request: PromptPreviewRequest):
         urls=request.urls,
         token_budget=request.token_budget or 4000,
     )
-    return PromptPreviewResponse(
+    return PromptPreviewResponse.model_construct(
         template_name=result.get("template_name", request.template_name or "universal_cursor_prompt"),
         prompt=result.get("prompt", ""),
     )
@@ -80,8 +84,8 @@ async def generate_sse(request: PromptGenerateRequest):
     if not generate_routes.cache_manager:
         raise HTTPException(status_code=500, detail="Cache manager not initialized")
 
-    q: asyncio.Queue[Dict[str, Any]] = asyncio.Queue()
-    done = asyncio.Event()
+    # None marks the end of the job, so the stream awaits the queue directly
+    q: asyncio.Queue[Optional[Dict[str, Any]]] = asyncio.Queue()
 
     def progress(stage: str, data: Dict[str, Any]) -> None:
         try:
@@ -100,22 +104,17 @@ async def generate_sse(request: PromptGenerateRequest):
                 progress_callback=progress,
             )
             generate_routes.cache_manager.set(f"prompt_job:{result['job_id']}", result)
-            q.put_nowait({"stage": "result", "data": PromptGenerateResponse(**result).dict()})
+            payload = PromptGenerateResponse.model_construct(**result).model_dump()
+            q.put_nowait({"stage": "result", "data": payload})
         except Exception as e:
             q.put_nowait({"stage": "error", "data": {"message": str(e)}})
         finally:
-            done.set()
+            q.put_nowait(None)
 
     async def stream() -> AsyncGenerator[str, None]:
         task = asyncio.create_task(run_job())
         try:
-            while True:
-                if done.is_set() and q.empty():
-                    break
-                try:
-                    msg = await asyncio.wait_for(q.get(), timeout=0.25)
-                except asyncio.TimeoutError:
-                    continue
+            while (msg := await q.get()) is not None:
                 yield _sse(msg["stage"], msg["data"])
         finally:
             if not task.done():
@@ -6,7 +6,7 @@ from fastapi import APIRouter, HTTPException
 
 from promptlang.api.models.requests import ValidateRequest
 from promptlang.api.models.responses import ValidateResponse
-from promptlang.core.ir.validator import IRValidator
+from promptlang.core.pipeline._components import IR_VALIDATOR
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api", tags=["validate"])
@@ -16,10 +16,12 @@ router = APIRouter(prefix="/api", tags=["validate"])
 async def validate(request: ValidateRequest):
     """Validate IR JSON schema."""
     try:
-        validator = IRValidator()
+        # Shared with the pipeline; IRValidator keeps no per-request state
+        validator = IR_VALIDATOR
         is_valid, errors, repaired_ir = validator.validate(request.ir_json)
 
-        return ValidateResponse(
+        # The validator builds the repaired IR itself, so skip re-validating it
+        return ValidateResponse.model_construct(
             valid=is_valid,
             errors=errors,
             repaired_ir=repaired_ir if not is_valid else None,
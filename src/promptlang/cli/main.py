@@ -1,12 +1,12 @@
 """CLI entry point using typer."""
 
 import asyncio
-import json
 import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
+import orjson
 import typer
 from rich.console import Console
 from rich.json import JSON
@@ -17,10 +17,35 @@ from promptlang.core.ir.validator import IRValidator
 from promptlang.core.optimizer.token_optimizer import TokenOptimizer
 from promptlang.core.pipeline.orchestrator import PipelineOrchestrator
 
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 app = typer.Typer(name="promptlang", help="PromptLang Compiler Platform CLI")
 console = Console()
 
 
+def _run(coro):
+    """Run a coroutine to completion, on a uvloop event loop when available."""
+    loop_factory = uvloop.new_event_loop if UVLOOP_AVAILABLE else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(coro)
+
+
+def _read_json(path: str) -> Any:
+    """Parse a JSON file with orjson straight from its bytes."""
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
+
+
+def _write_json(path: str, data: Any) -> None:
+    """Write data as indented JSON with orjson."""
+    with open(path, "wb") as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+
+
 @app.command()
 def generate(
     input_text: str = typer.Argument(..., help="Human input text"),
@@ -51,8 +76,7 @@ def generate(
 
             # Display result
             if output_file:
-                with open(output_file, "w") as f:
-                    json.dump(result, f, indent=2)
+                _write_json(output_file, result)
                 console.print(f"[green]Result saved to:[/green] {output_file}")
             else:
                 console.print("\n[bold]Generated Output:[/bold]")
@@ -78,8 +102,10 @@ def generate(
         except Exception as e:
             console.print(f"[bold red]Error:[/bold red] {str(e)}", err=True)
             sys.exit(1)
+        finally:
+            orchestrator.close()
 
-    asyncio.run(run())
+    _run(run())
 
 
 @app.command()
@@ -90,8 +116,7 @@ def validate(
     console.print(f"[bold green]Validating IR:[/bold green] {ir_file}")
 
     try:
-        with open(ir_file, "r") as f:
-            ir_data = json.load(f)
+        ir_data = _read_json(ir_file)
 
         validator = IRValidator()
         is_valid, errors, repaired_ir = validator.validate(ir_data)
@@ -105,8 +130,7 @@ def validate(
 
             if repaired_ir:
                 repair_file = ir_file.replace(".json", "_repaired.json")
-                with open(repair_file, "w") as f:
-                    json.dump(repaired_ir, f, indent=2)
+                _write_json(repair_file, repaired_ir)
                 console.print(f"[yellow]Repaired IR saved to:[/yellow] {repair_file}")
 
             sys.exit(1)
@@ -114,7 +138,7 @@ def validate(
     except FileNotFoundError:
         console.print(f"[bold red]Error:[/bold red] File not found: {ir_file}", err=True)
         sys.exit(1)
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         console.print(f"[bold red]Error:[/bold red] Invalid JSON: {e}", err=True)
         sys.exit(1)
     except Exception as e:
@@ -133,8 +157,7 @@ def optimize(
     console.print(f"[bold green]Optimizing IR:[/bold green] {ir_file}")
 
     try:
-        with open(ir_file, "r") as f:
-            ir_data = json.load(f)
+        ir_data = _read_json(ir_file)
 
         optimizer = TokenOptimizer()
         optimized_ir, warnings = optimizer.optimize(ir_data, token_budget=budget, intent=intent)
@@ -145,12 +168,12 @@ def optimize(
                 console.print(f"  - {warning}")
 
         if output_file:
-            with open(output_file, "w") as f:
-                json.dump(optimized_ir, f, indent=2)
+            _write_json(output_file, optimized_ir)
             console.print(f"[green]Optimized IR saved to:[/green] {output_file}")
         else:
             console.print("[bold]Optimized IR:[/bold]")
-            console.print(JSON(json.dumps(optimized_ir, indent=2)))
+            # Rich re-parses and indents the JSON text itself
+            console.print(JSON(orjson.dumps(optimized_ir, option=orjson.OPT_NON_STR_KEYS).decode()))
 
     except FileNotFoundError:
         console.print(f"[bold red]Error:[/bold red] File not found: {ir_file}", err=True)
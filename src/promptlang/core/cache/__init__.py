@@ -1,7 +1,8 @@
 """Cache management for L1 (in-memory) and L2 (Redis) tiers."""
 
 from promptlang.core.cache.manager import CacheManager
-from promptlang.core.cache.l1_cache import L1Cache
+from promptlang.core.cache.l1_cache import L1Cache, SemanticL1Cache
 from promptlang.core.cache.l2_cache import L2Cache
+from promptlang.core.cache.semantic import SemanticResponseCache
 
-__all__ = ["CacheManager", "L1Cache", "L2Cache"]
+__all__ = ["CacheManager", "L1Cache", "SemanticL1Cache", "L2Cache", "SemanticResponseCache"]
@@ -1,12 +1,34 @@
 """L1 in-memory cache with LRU and TTL."""
 
+import heapq
+import logging
+import threading
 import time
-from collections import OrderedDict
-from typing import Any, Optional
+from collections import OrderedDict, deque
+from typing import Any, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    logger.warning("numpy not available, semantic L1 cache disabled")
 
 
 class L1Cache:
-    """In-memory LRU cache with TTL support."""
+    """In-memory LRU cache with TTL support.
+
+    Entries live in an ``OrderedDict`` of ``key -> (value, expiry, version)``
+    kept in LRU order. Expiry is tracked in a min-heap of
+    ``(expiry, key, version)`` so expired entries are purged in O(log n) each
+    instead of scanning the whole cache. Heap items whose version no longer
+    matches the live entry (the key was overwritten or evicted) are skipped.
+
+    Public methods hold a lock, so the cache can be shared between
+    thread-pool workers.
+    """
 
     def __init__(self, max_size: int = 100, ttl_seconds: int = 300):
         """Initialize L1 cache.
@@ -17,52 +39,253 @@ class L1Cache:
         """
         self.max_size = max_size
         self.ttl_seconds = ttl_seconds
-        self._cache: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        self._cache: OrderedDict[str, tuple[Any, float, int]] = OrderedDict()
+        self._expiry_heap: list[tuple[float, str, int]] = []
+        self._version_counter = 0
+        self._lock = threading.Lock()
+
+    def _evict_expired(self, now: float) -> None:
+        """Pop expired heap items, dropping entries whose version still matches."""
+        heap = self._expiry_heap
+        while heap and heap[0][0] < now:
+            _, key, version = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            if entry is not None and entry[2] == version:
+                del self._cache[key]
+
+    def _compact_heap(self) -> None:
+        """Rebuild the heap from live entries once stale items dominate it."""
+        self._expiry_heap = [
+            (expiry, key, version) for key, (_, expiry, version) in self._cache.items()
+        ]
+        heapq.heapify(self._expiry_heap)
 
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache if not expired."""
-        if key not in self._cache:
-            return None
+        with self._lock:
+            now = time.time()
+            if self._expiry_heap and self._expiry_heap[0][0] < now:
+                self._evict_expired(now)
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+
+            # Move to end (most recently used)
+            self._cache.move_to_end(key)
+            return entry[0]
+
+    def set(self, key: str, value: Any) -> None:
+        """Set value in cache with TTL."""
+        with self._lock:
+            now = time.time()
+            heap = self._expiry_heap
+            if heap and heap[0][0] < now:
+                self._evict_expired(now)
+            expiry = now + self.ttl_seconds
+            self._version_counter += 1
+            version = self._version_counter
+
+            cache = self._cache
+            if key in cache:
+                # Update existing
+                cache.move_to_end(key)
+            elif len(cache) >= self.max_size:
+                # Remove least recently used
+                cache.popitem(last=False)
+            cache[key] = (value, expiry, version)
+
+            heapq.heappush(heap, (expiry, key, version))
+            if len(heap) > 2 * self.max_size:
+                self._compact_heap()
+
+    def delete(self, key: str) -> bool:
+        """Remove a key; return whether it was present."""
+        with self._lock:
+            return self._cache.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """Clear all entries."""
+        with self._lock:
+            self._cache.clear()
+            self._expiry_heap.clear()
+
+    def stats(self) -> dict:
+        """Get cache statistics."""
+        with self._lock:
+            # Remove expired entries
+            self._evict_expired(time.time())
+            size = len(self._cache)
+
+        return {
+            "size": size,
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+
+class SemanticL1Cache:
+    """In-memory LRU cache keyed by embeddings instead of exact strings.
 
-        value, expiry = self._cache[key]
-        if time.time() > expiry:
-            del self._cache[key]
+    Entries are bucketed with random-projection LSH (several tables of sign
+    bits) so a lookup only compares against the few entries sharing a bucket.
+    Any candidate whose cosine similarity with the query is at or above
+    ``threshold`` counts as a hit, so paraphrased queries reuse the same entry.
+
+    Entry ids are allocated in insertion order and share one TTL, so a FIFO of
+    ``(expiry, entry_id)`` is already sorted by expiry; purging pops only the
+    expired front instead of scanning every entry.
+    """
+
+    def __init__(
+        self,
+        dim: int,
+        max_size: int = 100,
+        ttl_seconds: int = 300,
+        threshold: float = 0.95,
+        num_tables: int = 4,
+        num_bits: int = 12,
+        seed: int = 0,
+    ):
+        """Initialize semantic L1 cache.
+
+        Args:
+            dim: Embedding dimension
+            max_size: Maximum number of entries (default: 100)
+            ttl_seconds: Time to live in seconds (default: 300 = 5 minutes)
+            threshold: Minimum cosine similarity for a hit (default: 0.95)
+            num_tables: Number of LSH hash tables (default: 4)
+            num_bits: Sign bits per table signature (default: 12)
+            seed: Seed for the projection matrix (default: 0)
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("numpy is required for SemanticL1Cache. Install 'numpy' to enable it.")
+
+        self.dim = dim
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.threshold = threshold
+        self.num_tables = num_tables
+        self.num_bits = num_bits
+
+        # One (num_tables * num_bits, dim) Gaussian projection, fixed for the
+        # lifetime of the cache so signatures stay stable across calls.
+        rng = np.random.default_rng(seed)
+        self._projection = rng.standard_normal((num_tables * num_bits, dim)).astype(np.float32)
+        self._bit_weights = 1 << np.arange(num_bits, dtype=np.int64)
+
+        self._entries: OrderedDict[int, tuple[Any, Any, float]] = OrderedDict()
+        self._signatures: Dict[int, List[int]] = {}
+        self._tables: List[Dict[int, Set[int]]] = [{} for _ in range(num_tables)]
+        self._expiry_queue: deque[tuple[float, int]] = deque()
+        self._next_id = 0
+
+    def _normalize(self, embedding: Any) -> Any:
+        vec = np.asarray(embedding, dtype=np.float32).reshape(-1)
+        if vec.shape[0] != self.dim:
+            raise ValueError(f"Expected embedding of dimension {self.dim}, got {vec.shape[0]}")
+        norm = float(np.linalg.norm(vec))
+        return vec / norm if norm > 0 else vec
+
+    def _signature(self, vec: Any) -> List[int]:
+        bits = (self._projection @ vec > 0).reshape(self.num_tables, self.num_bits)
+        return [int(x) for x in bits.astype(np.int64) @ self._bit_weights]
+
+    def _remove(self, entry_id: int) -> None:
+        self._entries.pop(entry_id, None)
+        for table, sig in zip(self._tables, self._signatures.pop(entry_id, [])):
+            bucket = table.get(sig)
+            if bucket is not None:
+                bucket.discard(entry_id)
+                if not bucket:
+                    del table[sig]
+
+    def _evict_expired(self, now: float) -> None:
+        """Pop expired ids off the front of the expiry queue."""
+        queue = self._expiry_queue
+        while queue and now > queue[0][0]:
+            self._remove(queue.popleft()[1])
+
+    def _lookup(self, vec: Any, sig: List[int]) -> tuple[Optional[int], float]:
+        """Return (entry_id, similarity) of the closest live candidate."""
+        candidates: Set[int] = set()
+        for table, s in zip(self._tables, sig):
+            candidates.update(table.get(s, ()))
+        if not candidates:
+            return None, -1.0
+
+        now = time.time()
+        ids = []
+        for entry_id in candidates:
+            if now > self._entries[entry_id][2]:
+                self._remove(entry_id)
+            else:
+                ids.append(entry_id)
+        if not ids:
+            return None, -1.0
+
+        matrix = np.stack([self._entries[i][0] for i in ids])
+        sims = matrix @ vec
+        best = int(np.argmax(sims))
+        return ids[best], float(sims[best])
+
+    def get(self, embedding: Any) -> Optional[Any]:
+        """Get value of the most similar cached entry if above threshold."""
+        vec = self._normalize(embedding)
+        entry_id, similarity = self._lookup(vec, self._signature(vec))
+        if entry_id is None or similarity < self.threshold:
             return None
 
         # Move to end (most recently used)
-        self._cache.move_to_end(key)
-        return value
+        self._entries.move_to_end(entry_id)
+        return self._entries[entry_id][1]
 
-    def set(self, key: str, value: Any) -> None:
-        """Set value in cache with TTL."""
+    def set(self, embedding: Any, value: Any) -> None:
+        """Set value for an embedding with TTL.
+
+        An existing entry above the similarity threshold is replaced instead of
+        adding a near-duplicate.
+        """
+        vec = self._normalize(embedding)
+        sig = self._signature(vec)
         expiry = time.time() + self.ttl_seconds
 
-        if key in self._cache:
-            # Update existing
-            self._cache[key] = (value, expiry)
-            self._cache.move_to_end(key)
-        else:
-            # Add new
-            if len(self._cache) >= self.max_size:
-                # Remove least recently used
-                self._cache.popitem(last=False)
+        entry_id, similarity = self._lookup(vec, sig)
+        if entry_id is not None and similarity >= self.threshold:
+            self._remove(entry_id)
+        elif len(self._entries) >= self.max_size:
+            # Remove least recently used
+            self._remove(next(iter(self._entries)))
+
+        entry_id = self._next_id
+        self._next_id += 1
+        self._entries[entry_id] = (vec, value, expiry)
+        self._signatures[entry_id] = sig
+        for table, s in zip(self._tables, sig):
+            table.setdefault(s, set()).add(entry_id)
 
-            self._cache[key] = (value, expiry)
+        self._expiry_queue.append((expiry, entry_id))
+        if len(self._expiry_queue) > 2 * self.max_size:
+            # Drop ids that were replaced or evicted before expiring
+            self._expiry_queue = deque(item for item in self._expiry_queue if item[1] in self._entries)
 
     def clear(self) -> None:
         """Clear all entries."""
-        self._cache.clear()
+        self._entries.clear()
+        self._signatures.clear()
+        self._expiry_queue.clear()
+        for table in self._tables:
+            table.clear()
 
     def stats(self) -> dict:
         """Get cache statistics."""
         # Remove expired entries
-        now = time.time()
-        expired = [k for k, (_, expiry) in self._cache.items() if now > expiry]
-        for k in expired:
-            del self._cache[k]
+        self._evict_expired(time.time())
 
         return {
-            "size": len(self._cache),
+            "size": len(self._entries),
             "max_size": self.max_size,
             "ttl_seconds": self.ttl_seconds,
+            "threshold": self.threshold,
+            "num_tables": self.num_tables,
+            "num_bits": self.num_bits,
         }
@@ -1,8 +1,10 @@
 """L2 Redis cache with graceful degradation."""
 
-import json
 import logging
-from typing import Any, Optional
+import threading
+from typing import Any, Dict, Optional
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +15,29 @@ except ImportError:
     REDIS_AVAILABLE = False
     logger.warning("Redis not available, L2 cache disabled")
 
+# Connection pools shared by every L2Cache pointing at the same Redis URL, so
+# caches reuse open connections instead of each building its own pool
+_POOLS: Dict[str, Any] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def _get_pool(redis_url: str) -> Any:
+    """Get (or create) the shared connection pool for a Redis URL."""
+    with _POOLS_LOCK:
+        pool = _POOLS.get(redis_url)
+        if pool is None:
+            # Bounded pool: callers beyond max_connections wait for a free
+            # connection rather than failing
+            # Responses stay bytes; orjson parses them without a decode step
+            pool = redis.BlockingConnectionPool.from_url(redis_url, max_connections=32, timeout=5)
+            _POOLS[redis_url] = pool
+        return pool
+
+
+def _dumps(value: Any) -> bytes:
+    """Serialize a cache value; non-string dict keys become strings as with json."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
 
 class L2Cache:
     """Redis-based L2 cache with graceful degradation."""
@@ -34,7 +59,7 @@ class L2Cache:
 
         try:
             redis_url = redis_url or "redis://localhost:6379/0"
-            self._redis = redis.from_url(redis_url, decode_responses=True)
+            self._redis = redis.Redis(connection_pool=_get_pool(redis_url))
             # Test connection
             self._redis.ping()
             self._enabled = True
@@ -44,6 +69,11 @@ class L2Cache:
             self._redis = None
             self._enabled = False
 
+    @property
+    def enabled(self) -> bool:
+        """Whether a Redis connection is available."""
+        return self._enabled and self._redis is not None
+
     def get(self, key: str) -> Optional[Any]:
         """Get value from Redis cache."""
         if not self._enabled or not self._redis:
@@ -52,7 +82,7 @@ class L2Cache:
         try:
             data = self._redis.get(key)
             if data:
-                return json.loads(data)
+                return orjson.loads(data)
         except Exception as e:
             logger.warning(f"L2 cache get failed: {e}")
         return None
@@ -63,11 +93,23 @@ class L2Cache:
             return
 
         try:
-            data = json.dumps(value)
-            self._redis.setex(key, self.ttl_seconds, data)
+            self._redis.setex(key, self.ttl_seconds, _dumps(value))
         except Exception as e:
             logger.warning(f"L2 cache set failed: {e}")
 
+    def set_many(self, items: Dict[str, Any]) -> None:
+        """Set several values with TTL in one pipelined round trip."""
+        if not self._enabled or not self._redis or not items:
+            return
+
+        try:
+            with self._redis.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.setex(key, self.ttl_seconds, _dumps(value))
+                pipe.execute()
+        except Exception as e:
+            logger.warning(f"L2 cache set_many failed: {e}")
+
     def clear(self) -> None:
         """Clear all cache entries (use with caution)."""
         if not self._enabled or not self._redis:
@@ -78,6 +120,21 @@ class L2Cache:
         except Exception as e:
             logger.warning(f"L2 cache clear failed: {e}")
 
+    def close(self) -> None:
+        """Drop this cache's Redis client and disable the cache.
+
+        The shared connection pool stays open for other caches on the same URL.
+        """
+        if self._redis is None:
+            return
+
+        try:
+            self._redis.close()
+        except Exception as e:
+            logger.warning(f"L2 cache close failed: {e}")
+        self._redis = None
+        self._enabled = False
+
     def stats(self) -> dict:
         """Get cache statistics."""
         if not self._enabled or not self._redis:
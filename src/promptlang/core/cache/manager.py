@@ -1,7 +1,9 @@
 """Cache manager coordinating L1 and L2 caches."""
 
 import logging
-from typing import Any, Optional
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
 
 from promptlang.core.cache.l1_cache import L1Cache
 from promptlang.core.cache.l2_cache import L2Cache
@@ -10,7 +12,12 @@ logger = logging.getLogger(__name__)
 
 
 class CacheManager:
-    """Unified cache manager with L1 (in-memory) and L2 (Redis) tiers."""
+    """Unified cache manager with L1 (in-memory) and L2 (Redis) tiers.
+
+    L2 hits are promoted to L1 only on their second hit: the first hit records
+    the key in a bounded ghost list, so one-off reads of cold keys (e.g. a scan
+    over many pipelines) do not evict the hot L1 working set.
+    """
 
     def __init__(
         self,
@@ -18,6 +25,7 @@ class CacheManager:
         l1_ttl: int = 300,
         l2_redis_url: Optional[str] = None,
         l2_ttl: int = 3600,
+        l2_ghost_size: int = 512,
     ):
         """Initialize cache manager.
 
@@ -26,9 +34,24 @@ class CacheManager:
             l1_ttl: L1 cache TTL in seconds
             l2_redis_url: Redis URL for L2 (optional)
             l2_ttl: L2 cache TTL in seconds
+            l2_ghost_size: Max keys remembered after one L2 hit before promotion
         """
         self.l1 = L1Cache(max_size=l1_max_size, ttl_seconds=l1_ttl)
         self.l2 = L2Cache(redis_url=l2_redis_url, ttl_seconds=l2_ttl)
+        self.l2_ghost_size = l2_ghost_size
+        self._l2_ghosts: OrderedDict[str, None] = OrderedDict()
+        self._ghost_lock = threading.Lock()
+
+    def _admit_to_l1(self, key: str) -> bool:
+        """Return True on a key's second L2 hit; remember it on the first."""
+        with self._ghost_lock:
+            if key in self._l2_ghosts:
+                del self._l2_ghosts[key]
+                return True
+            self._l2_ghosts[key] = None
+            if len(self._l2_ghosts) > self.l2_ghost_size:
+                self._l2_ghosts.popitem(last=False)
+            return False
 
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache (L1 first, then L2)."""
@@ -42,8 +65,9 @@ class CacheManager:
         value = self.l2.get(key)
         if value is not None:
             logger.debug(f"Cache hit L2: {key[:16]}...")
-            # Promote to L1
-            self.l1.set(key, value)
+            # Promote to L1 once the key proves hot
+            if self._admit_to_l1(key):
+                self.l1.set(key, value)
             return value
 
         logger.debug(f"Cache miss: {key[:16]}...")
@@ -54,10 +78,22 @@ class CacheManager:
         self.l1.set(key, value)
         self.l2.set(key, value)
 
+    def set_many(self, items: Dict[str, Any]) -> None:
+        """Set several values in both caches; L2 writes share one round trip."""
+        for key, value in items.items():
+            self.l1.set(key, value)
+        self.l2.set_many(items)
+
     def clear(self) -> None:
         """Clear both caches."""
         self.l1.clear()
         self.l2.clear()
+        with self._ghost_lock:
+            self._l2_ghosts.clear()
+
+    def close(self) -> None:
+        """Release L2 connections; L1 entries stay readable."""
+        self.l2.close()
 
     def stats(self) -> dict:
         """Get statistics from both caches."""
@@ -0,0 +1,110 @@
+"""Semantic response cache keyed by sentence embeddings of the request text."""
+
+import logging
+import threading
+from typing import Any, Optional
+
+from promptlang.core.cache.l1_cache import NUMPY_AVAILABLE, SemanticL1Cache
+from promptlang.core.knowledge.retriever import KnowledgeRetriever
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticResponseCache:
+    """Reuses pipeline results for paraphrased requests.
+
+    Request text is embedded with a sentence-transformers model and looked up
+    in a ``SemanticL1Cache``; a hit needs cosine similarity of at least
+    ``threshold`` *and* identical non-text parameters (``params_key``), so a
+    paraphrase never returns a result built for another target model or
+    budget.
+
+    The model is loaded on first use and is the same instance the knowledge
+    retriever embeds queries with, so the process holds one copy. Without
+    sentence-transformers or numpy the cache stays disabled and every lookup
+    is a miss.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        threshold: float = 0.87,
+        max_size: int = 256,
+        ttl_seconds: int = 3600,
+        embedder: Optional[Any] = None,
+    ):
+        """Initialize semantic response cache.
+
+        Args:
+            model_name: sentence-transformers model used for embeddings
+            threshold: Minimum cosine similarity for a hit (default: 0.87)
+            max_size: Maximum number of entries (default: 256)
+            ttl_seconds: Time to live in seconds (default: 3600 = 1 hour)
+            embedder: Preloaded embedder with ``encode`` (optional)
+        """
+        self.model_name = model_name
+        self.threshold = threshold
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._embedder = embedder
+        self._cache: Optional[SemanticL1Cache] = None
+        self._disabled = not NUMPY_AVAILABLE
+        self._load_lock = threading.Lock()
+        # SemanticL1Cache is not thread-safe; callers run lookups off the loop
+        self._lock = threading.Lock()
+
+    def _ensure_loaded(self) -> bool:
+        """Load the embedder and size the cache once; return whether enabled."""
+        if self._cache is not None or self._disabled:
+            return not self._disabled
+
+        with self._load_lock:
+            if self._cache is not None or self._disabled:
+                return not self._disabled
+            try:
+                if self._embedder is None:
+                    self._embedder = KnowledgeRetriever.shared_embedder(self.model_name)
+                dim = self._embedder.get_sentence_embedding_dimension()
+            except Exception as e:
+                logger.warning(f"Semantic response cache disabled: {e}")
+                self._disabled = True
+                return False
+
+            self._cache = SemanticL1Cache(
+                dim=dim,
+                max_size=self.max_size,
+                ttl_seconds=self.ttl_seconds,
+                threshold=self.threshold,
+            )
+            return True
+
+    def _embed(self, text: str) -> Any:
+        return self._embedder.encode(text, normalize_embeddings=True)
+
+    def get(self, text: str, params_key: str) -> Optional[Any]:
+        """Get the cached value for a similar text with the same parameters."""
+        if not text.strip() or not self._ensure_loaded():
+            return None
+
+        embedding = self._embed(text)
+        with self._lock:
+            entry = self._cache.get(embedding)
+        if entry is None or entry[0] != params_key:
+            return None
+        return entry[1]
+
+    def set(self, text: str, params_key: str, value: Any) -> None:
+        """Cache a value for a text and its non-text parameters."""
+        if not text.strip() or not self._ensure_loaded():
+            return
+
+        embedding = self._embed(text)
+        with self._lock:
+            self._cache.set(embedding, (params_key, value))
+
+    def stats(self) -> dict:
+        """Get cache statistics."""
+        if self._cache is None:
+            return {"enabled": not self._disabled, "size": 0}
+        with self._lock:
+            return {"enabled": True, **self._cache.stats()}
@@ -1,16 +1,43 @@
 """Clarification engine for gathering missing information."""
 
 import logging
-from typing import Any, Dict, List, Optional
+import re
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 
+def _word_patterns(words: Tuple[str, ...]) -> Tuple["re.Pattern[str]", ...]:
+    """Compile one pattern per word that matches it only when no ASCII letter touches it.
+
+    Each pattern starts with the literal word, so ``re`` finds candidates with
+    its fast literal-prefix search and only then checks the boundaries; a
+    single alternation of all words is several times slower on long input.
+    """
+    return tuple(re.compile(rf"{word}(?![a-z])(?<![a-z]{word})") for word in words)
+
+
+def _contains_word(patterns: Tuple["re.Pattern[str]", ...], text_lower: str) -> bool:
+    """Return whether any word pattern matches; a plain loop beats any() on a genexpr."""
+    for pattern in patterns:
+        if pattern.search(text_lower):
+            return True
+    return False
+
+
 class ClarificationEngine:
     """Engine for asking clarification questions or making assumptions."""
 
     MAX_QUESTIONS = 3
 
+    # Hints match whole words of the lowercased input: a hint must not touch
+    # another ASCII letter, so "good" is not "go" and "golang"/"nextjs" are
+    # not hints, while "python3" and "next.js" still are.
+    _LANG_PATTERNS = _word_patterns(("python", "javascript", "typescript", "java", "go", "rust"))
+    _FW_PATTERNS = _word_patterns(("fastapi", "flask", "django", "react", "vue", "next"))
+    # Matched as substrings so compound names like "AttributeError" still count
+    _ERROR_INDICATORS = ("error", "exception", "traceback", "failed", "crash")
+
     def __init__(self, max_questions: int = MAX_QUESTIONS):
         """Initialize clarification engine.
 
@@ -35,16 +62,25 @@ class ClarificationEngine:
         questions: List[str] = []
         assumptions: Dict[str, Any] = {}
 
+        # Anything the partial IR already provides needs no text scan
+        context = (partial_ir or {}).get("context") or {}
+        stack = context.get("stack") or {}
+        inputs = context.get("inputs") or {}
+
         # Determine what needs clarification based on intent
         if intent == "scaffold":
+            needs_language = not stack.get("language")
+            needs_framework = not stack.get("framework")
+            text_lower = input_text.lower() if needs_language or needs_framework else ""
+
             # Check for missing context
-            if not self._has_language_hint(input_text):
+            if needs_language and not self._has_language_hint(text_lower):
                 if len(questions) < self.max_questions:
                     questions.append("What programming language should we use?")
                 else:
                     assumptions["language"] = "python"  # Default
 
-            if not self._has_framework_hint(input_text):
+            if needs_framework and not self._has_framework_hint(text_lower):
                 if len(questions) < self.max_questions:
                     questions.append("Which framework should we use?")
                 else:
@@ -52,7 +88,7 @@ class ClarificationEngine:
 
         elif intent == "debug":
             # Check for error context
-            if not self._has_error_context(input_text):
+            if not inputs.get("error_log") and not self._has_error_context(input_text.lower()):
                 if len(questions) < self.max_questions:
                     questions.append("Can you provide the error message or traceback?")
                 else:
@@ -66,20 +102,14 @@ class ClarificationEngine:
         logger.info(f"Making assumptions: {assumptions}")
         return [], assumptions
 
-    def _has_language_hint(self, text: str) -> bool:
-        """Check if text contains language hint."""
-        languages = ["python", "javascript", "typescript", "java", "go", "rust"]
-        text_lower = text.lower()
-        return any(lang in text_lower for lang in languages)
-
-    def _has_framework_hint(self, text: str) -> bool:
-        """Check if text contains framework hint."""
-        frameworks = ["fastapi", "flask", "django", "react", "vue", "next"]
-        text_lower = text.lower()
-        return any(fw in text_lower for fw in frameworks)
-
-    def _has_error_context(self, text: str) -> bool:
-        """Check if text contains error context."""
-        error_indicators = ["error", "exception", "traceback", "failed", "crash"]
-        text_lower = text.lower()
-        return any(indicator in text_lower for indicator in error_indicators)
+    def _has_language_hint(self, text_lower: str) -> bool:
+        """Check if lowercased text contains a language hint word."""
+        return _contains_word(self._LANG_PATTERNS, text_lower)
+
+    def _has_framework_hint(self, text_lower: str) -> bool:
+        """Check if lowercased text contains a framework hint word."""
+        return _contains_word(self._FW_PATTERNS, text_lower)
+
+    def _has_error_context(self, text_lower: str) -> bool:
+        """Check if lowercased text contains error context."""
+        return any(indicator in text_lower for indicator in self._ERROR_INDICATORS)
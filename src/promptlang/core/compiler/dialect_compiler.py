@@ -1,26 +1,57 @@
 """Dialect compiler for stage 6 - compiles optimized IR to model-specific format."""
 
-import json
+import heapq
 import logging
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import orjson
+
+from promptlang.core.cache.l1_cache import L1Cache
 from promptlang.core.compiler.dialects.claude import ClaudeDialectCompiler
 from promptlang.core.compiler.dialects.gpt import GPTDialectCompiler
 from promptlang.core.compiler.dialects.oss import OSSDialectCompiler
+from promptlang.core.utils.hashing import hash_content
+from promptlang.core.utils.tokens import get_token_encoding
 
 logger = logging.getLogger(__name__)
 
+# (model-name prefix, dialect), checked in order; anything else compiles as OSS
+_DIALECT_PREFIXES = (("claude", "claude"), ("gpt", "gpt"), ("openai", "gpt"))
+
+
+@lru_cache(maxsize=64)
+def _resolve_dialect(target_model: str) -> str:
+    """Map a target model name to its dialect, once per distinct name."""
+    target_lower = target_model.lower()
+    for prefix, dialect in _DIALECT_PREFIXES:
+        if target_lower.startswith(prefix):
+            return dialect
+    return "oss"  # Default
+
 
 class DialectCompiler:
-    """Compiles optimized IR to target model dialect."""
+    """Compiles optimized IR to target model dialect.
 
-    def __init__(self):
-        """Initialize dialect compiler."""
+    Dialect compilation is deterministic, so compiled prompts are memoized in
+    an L1 cache keyed on the dialect and a content hash of the IR; retry and
+    regenerate flows with an identical IR skip recompilation.
+    """
+
+    def __init__(self, cache_size: int = 128, cache_ttl: int = 300):
+        """Initialize dialect compiler.
+
+        Args:
+            cache_size: Maximum number of compiled prompts to keep (default: 128)
+            cache_ttl: Compiled prompt TTL in seconds (default: 300)
+        """
         self.compilers = {
             "claude": ClaudeDialectCompiler(),
             "gpt": GPTDialectCompiler(),
             "oss": OSSDialectCompiler(),
         }
+        self._cache = L1Cache(max_size=cache_size, ttl_seconds=cache_ttl)
 
     def compile(
         self,
@@ -38,21 +69,12 @@ class DialectCompiler:
         Returns:
             Compiled prompt string
         """
-        # Normalize target_model
-        target_lower = target_model.lower()
-
-        if target_lower.startswith("claude"):
-            dialect = "claude"
-        elif target_lower.startswith("gpt") or target_lower.startswith("openai"):
-            dialect = "gpt"
-        else:
-            dialect = "oss"  # Default
-
+        dialect = _resolve_dialect(target_model)
         compiler = self.compilers.get(dialect, self.compilers["oss"])
 
         logger.info(f"Compiling to {dialect} dialect for model {target_model}")
 
-        compiled_prompt = compiler.compile(ir)
+        compiled_prompt = self._compile_cached(compiler, dialect, ir)
 
         if not retrieved_knowledge:
             return compiled_prompt
@@ -65,6 +87,21 @@ class DialectCompiler:
         )
         return injected
 
+    def _compile_cached(self, compiler: Any, dialect: str, ir: Dict[str, Any]) -> str:
+        try:
+            key = f"{dialect}:{hash_content(ir)}"
+        except TypeError:
+            # Not canonically serializable; compile without caching
+            return compiler.compile(ir)
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        compiled_prompt = compiler.compile(ir)
+        self._cache.set(key, compiled_prompt)
+        return compiled_prompt
+
     def _inject_reference_knowledge(
         self,
         compiled_prompt: str,
@@ -72,19 +109,19 @@ class DialectCompiler:
         retrieved_knowledge: List[Dict[str, Any]],
         token_budget: Optional[int],
     ) -> str:
-        # Normalize, dedupe by URL, keep best scored
-        by_url: Dict[str, Dict[str, Any]] = {}
+        # Normalize, dedupe by URL, keep best scored. Each score is read and
+        # converted once; nlargest keeps the stable order of a reverse sort.
+        by_url: Dict[str, Tuple[float, Dict[str, Any]]] = {}
         for item in retrieved_knowledge:
             url = (item.get("url") or "").strip()
             if not url:
                 continue
+            score = float(item.get("score", 0.0))
             prev = by_url.get(url)
-            if prev is None or float(item.get("score", 0.0)) > float(prev.get("score", 0.0)):
-                by_url[url] = item
+            if prev is None or score > prev[0]:
+                by_url[url] = (score, item)
 
-        items = list(by_url.values())
-        items.sort(key=lambda x: float(x.get("score", 0.0)), reverse=True)
-        items = items[:6]
+        items = [item for _, item in heapq.nlargest(6, by_url.values(), key=itemgetter(0))]
 
         def make_block(chunks: List[Dict[str, Any]]) -> str:
             lines = ["REFERENCE KNOWLEDGE (retrieved from engineering docs):"]
@@ -98,32 +135,80 @@ class DialectCompiler:
 
         # If token budget is exceeded, drop lowest scored chunks first.
         if token_budget is not None and token_budget > 0:
-            # crude token estimate: chars/4
+            # Loaded at app startup; see promptlang.api.main.lifespan
+            encoding = get_token_encoding()
+            measure, apply_injection = self._make_injector(
+                compiled_prompt, dialect, measured=encoding is None
+            )
+            if encoding is not None:
+                # BPE counts; the prompt is encoded once and only the block per attempt
+                base_tokens = len(encoding.encode_ordinary(compiled_prompt))
+
+                def fits(knowledge_block: str) -> bool:
+                    block_tokens = len(encoding.encode_ordinary(knowledge_block))
+                    return base_tokens + block_tokens <= token_budget
+
+            else:
+                # crude token estimate: chars/4, measured without building the prompt
+                def fits(knowledge_block: str) -> bool:
+                    return (measure(knowledge_block) // 4) <= token_budget
+
             while items:
-                candidate = self._apply_injection(compiled_prompt, dialect, make_block(items))
-                if (len(candidate) // 4) <= token_budget:
-                    return candidate
+                knowledge_block = make_block(items)
+                if fits(knowledge_block):
+                    return apply_injection(knowledge_block)
                 items.pop()  # remove lowest score (end)
             return compiled_prompt
 
-        return self._apply_injection(compiled_prompt, dialect, make_block(items))
-
-    def _apply_injection(self, compiled_prompt: str, dialect: str, knowledge_block: str) -> str:
-        if dialect == "gpt":
-            try:
-                data = json.loads(compiled_prompt)
-                messages = data.get("messages", [])
-                # Insert after the first system message if present; else prepend.
-                insert_at = 1 if messages and messages[0].get("role") == "system" else 0
-                messages.insert(
-                    insert_at,
-                    {"role": "system", "content": knowledge_block},
-                )
-                data["messages"] = messages
-                return json.dumps(data, indent=2)
-            except Exception:
-                # Fallback: prepend plain text
-                return knowledge_block + "\n" + compiled_prompt
-
-        # OSS / Claude are plain string prompts
-        return knowledge_block + "\n" + compiled_prompt
+        _, apply_injection = self._make_injector(compiled_prompt, dialect)
+        return apply_injection(make_block(items))
+
+    def _make_injector(
+        self, compiled_prompt: str, dialect: str, measured: bool = False
+    ) -> Tuple[Optional[Callable[[str], int]], Callable[[str], str]]:
+        """Return ``(measure, inject)`` functions for a knowledge block.
+
+        ``inject`` builds the prompt with the block added; ``measure`` returns
+        the length of that prompt without building it, and is only built (else
+        None) when ``measured`` is set. To measure, the GPT prompt is serialized
+        once here with an empty block, so measuring a block only costs escaping
+        its own JSON string and the prompt is serialized once more, for the
+        block that fits the budget.
+        """
+        base_len = len(compiled_prompt) + 1
+
+        def measure_prepend(knowledge_block: str) -> int:
+            return len(knowledge_block) + base_len
+
+        def prepend(knowledge_block: str) -> str:
+            return knowledge_block + "\n" + compiled_prompt
+
+        if dialect != "gpt":
+            # OSS / Claude are plain string prompts
+            return (measure_prepend if measured else None), prepend
+
+        try:
+            data = orjson.loads(compiled_prompt)
+            messages = data.get("messages", [])
+            # Insert after the first system message if present; else prepend.
+            insert_at = 1 if messages and messages[0].get("role") == "system" else 0
+        except Exception:
+            # Fallback: prepend plain text
+            return (measure_prepend if measured else None), prepend
+
+        def inject_message(knowledge_block: str) -> str:
+            injected = messages.copy()
+            injected.insert(insert_at, {"role": "system", "content": knowledge_block})
+            return orjson.dumps({**data, "messages": injected}, option=orjson.OPT_INDENT_2).decode()
+
+        if not measured:
+            return None, inject_message
+
+        # The block only appears as one JSON string, so the injected prompt is
+        # the empty-block prompt plus the escaped block minus its "" quotes.
+        empty_len = len(inject_message("")) - 2
+
+        def measure_message(knowledge_block: str) -> int:
+            return empty_len + len(orjson.dumps(knowledge_block).decode())
+
+        return measure_message, inject_message
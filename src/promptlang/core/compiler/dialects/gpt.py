@@ -1,11 +1,14 @@
 """GPT dialect compiler using JSON messages with contract-first placement."""
 
-import json
 import logging
 from typing import Any, Dict, List
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
+_CONTRACT_PREFIX = "OUTPUT CONTRACT (MANDATORY):\n"
+
 
 class GPTDialectCompiler:
     """Compiles IR to GPT-optimized prompt format."""
@@ -18,22 +21,18 @@ class GPTDialectCompiler:
         - JSON-structured messages
         - Deterministic section ordering
         """
-        messages: List[Dict[str, str]] = []
-
-        # Contract first (CRITICAL)
         output_contract = ir.get("output_contract", {})
-        contract_msg = {
-            "role": "system",
-            "content": f"OUTPUT CONTRACT (MANDATORY):\n{self._format_contract(output_contract)}",
-        }
-        messages.append(contract_msg)
-
-        # Task
         task = ir.get("task", {})
-        task_content = f"Task: {task.get('description', '')}"
-        if task.get("scope"):
-            task_content += f"\nScope: {task['scope']}"
-        messages.append({"role": "user", "content": task_content})
+        scope = f"\nScope: {task['scope']}" if task.get("scope") else ""
+
+        # Contract first (CRITICAL), then task
+        messages: List[Dict[str, str]] = [
+            {
+                "role": "system",
+                "content": _CONTRACT_PREFIX + self._format_contract(output_contract),
+            },
+            {"role": "user", "content": f"Task: {task.get('description', '')}{scope}"},
+        ]
 
         # Constraints
         constraints = ir.get("constraints", {})
@@ -56,7 +55,7 @@ class GPTDialectCompiler:
             messages.append({"role": "user", "content": stack_str})
 
         # Format as JSON
-        return json.dumps({"messages": messages}, indent=2)
+        return orjson.dumps({"messages": messages}, option=orjson.OPT_INDENT_2).decode()
 
     def _format_contract(self, contract: Dict[str, Any]) -> str:
         """Format output contract section."""
@@ -2,43 +2,47 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 
+from promptlang.core.cache.manager import CacheManager
 from promptlang.core.knowledge import KnowledgeRetriever, build_retrieval_query
+from promptlang.core.utils.hashing import content_cache_key
+
+# A retrieved chunk counts as relevant when it mentions any of these. For a
+# handful of terms, substring checks on the lowercased text are faster than a
+# case-insensitive regex, which is ~10x slower on the usual non-matching chunk.
+_RELEVANT_KEYWORDS = ("fastapi", "pydantic", "uvicorn", "python web")
 
 
 class BestPracticesRetriever:
     def __init__(self, retriever: Optional[KnowledgeRetriever] = None, top_k: int = 6, 
-                 use_llm_refinement: bool = False, llm_client: Optional[Any] = None):
+                 use_llm_refinement: bool = False, llm_client: Optional[Any] = None,
+                 cache_manager: Optional[CacheManager] = None):
         self.retriever = retriever or KnowledgeRetriever()
         self.top_k = top_k
         self.use_llm_refinement = use_llm_refinement
         self.llm_client = llm_client
+        # Optional cache of search results keyed by (query, top_k, refinement)
+        self.cache_manager = cache_manager
 
-    def retrieve(self, ir: Dict[str, Any]) -> List[Dict[str, Any]]:
-        query = build_retrieval_query(ir)
-        query = f"Best practices. {query}"
-        
-        # Use Option C (hybrid RAG + LLM refinement) if enabled and LLM client available
-        if self.use_llm_refinement and self.llm_client:
-            results = self.retriever.search_with_llm_refinement(
-                query, 
-                top_k=self.top_k, 
-                llm_client=self.llm_client,
-                refine_top_n=min(self.top_k, 5)
-            )
-        else:
-            # Use Option B (enhanced RAG with keyword boosters and filters)
-            results = self.retriever.search(query, top_k=self.top_k)
+    def build_query(self, ir: Dict[str, Any]) -> str:
+        """Retrieval query used for plain RAG search."""
+        return f"Best practices. {build_retrieval_query(ir)}"
+
+    def retrieve(
+        self, ir: Dict[str, Any], results: Optional[List[Dict[str, Any]]] = None
+    ) -> List[Dict[str, Any]]:
+        """Retrieve best practices, optionally from already fetched search results."""
+        if results is None:
+            results = self._search(self.build_query(ir))
         
         # Check relevance and apply synthetic fallback BEFORE returning
         # This ensures synthetic content is used when RAG results are not relevant enough
         if results:
             relevant_count = 0
-            query_lower = build_retrieval_query(ir).lower()
             
             for result in results:
-                result_text = (result.get("text", "") + " " + result.get("title", "")).lower()
+                result_text = f"{result.get('text', '')} {result.get('title', '')}".lower()
                 # Check if result contains relevant keywords - be more strict
-                if any(term in result_text for term in ["fastapi", "pydantic", "uvicorn", "python web"]):
+                if any(term in result_text for term in _RELEVANT_KEYWORDS):
                     relevant_count += 1
             
             # If less than 50% of results are relevant, use synthetic content
@@ -63,6 +67,45 @@ class BestPracticesRetriever:
         
         return results[:self.top_k]
     
+    def _cache_key(self, query: str) -> Optional[str]:
+        if self.cache_manager is None:
+            return None
+        refined = bool(self.use_llm_refinement and self.llm_client)
+        return content_cache_key("best_practices", [query, self.top_k, refined])
+
+    def cached_results(self, query: str) -> Optional[List[Dict[str, Any]]]:
+        """Return cached search results for a query, or None on a miss."""
+        cache_key = self._cache_key(query)
+        if cache_key is None:
+            return None
+        return self.cache_manager.get(cache_key)
+
+    def cache_results(self, query: str, results: List[Dict[str, Any]]) -> None:
+        """Cache search results for a query, e.g. ones fetched in a batch."""
+        cache_key = self._cache_key(query)
+        if cache_key is not None:
+            self.cache_manager.set(cache_key, results)
+
+    def _search(self, query: str) -> List[Dict[str, Any]]:
+        cached = self.cached_results(query)
+        if cached is not None:
+            return cached
+
+        # Use Option C (hybrid RAG + LLM refinement) if enabled and LLM client available
+        if self.use_llm_refinement and self.llm_client:
+            results = self.retriever.search_with_llm_refinement(
+                query, 
+                top_k=self.top_k, 
+                llm_client=self.llm_client,
+                refine_top_n=min(self.top_k, 5)
+            )
+        else:
+            # Use Option B (enhanced RAG with keyword boosters and filters)
+            results = self.retriever.search(query, top_k=self.top_k)
+
+        self.cache_results(query, results)
+        return results
+
     def _generate_synthetic_best_practices(self, ir: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate synthetic best practices when RAG doesn't find relevant content."""
         task = ir.get("task", {})
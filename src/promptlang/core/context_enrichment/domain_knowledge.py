@@ -10,7 +10,10 @@ class DomainKnowledgeInjector:
         self.retriever = retriever or KnowledgeRetriever()
         self.top_k = top_k
 
-    def inject(self, ir: Dict[str, Any], knowledge_card: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    def build_query(
+        self, ir: Dict[str, Any], knowledge_card: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Retrieval query used for plain RAG search."""
         domain = ""
         if isinstance(knowledge_card, dict):
             domain = str(knowledge_card.get("domain") or "")
@@ -22,8 +25,16 @@ class DomainKnowledgeInjector:
         desc = str(task.get("description") or "")
 
         if domain:
-            query = f"Domain knowledge. {domain}. {desc}"[:500]
-        else:
-            query = f"Domain knowledge. {desc}"[:500]
-
-        return self.retriever.search(query, top_k=self.top_k)
+            return f"Domain knowledge. {domain}. {desc}"[:500]
+        return f"Domain knowledge. {desc}"[:500]
+
+    def inject(
+        self,
+        ir: Dict[str, Any],
+        knowledge_card: Optional[Dict[str, Any]] = None,
+        results: Optional[List[Dict[str, Any]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Inject domain knowledge, optionally from already fetched search results."""
+        if results is not None:
+            return results
+        return self.retriever.search(self.build_query(ir, knowledge_card), top_k=self.top_k)
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+from promptlang.core.cache.manager import CacheManager
+from promptlang.core.knowledge import KnowledgeRetriever
 
 from .models import EnrichedContext
 from .best_practices import BestPracticesRetriever
@@ -16,17 +19,73 @@ class ContextEnricher:
         domain_knowledge: Optional[DomainKnowledgeInjector] = None,
         use_llm_refinement: bool = False,
         llm_client: Optional[Any] = None,
+        cache_manager: Optional[CacheManager] = None,
     ):
-        # Initialize retrievers with LLM refinement options
+        # Initialize retrievers with LLM refinement options. Defaults share one
+        # KnowledgeRetriever so their plain searches can be batched.
+        retriever = KnowledgeRetriever()
         self.best_practices = best_practices or BestPracticesRetriever(
+            retriever=retriever,
             use_llm_refinement=use_llm_refinement, 
-            llm_client=llm_client
+            llm_client=llm_client,
+            cache_manager=cache_manager,
         )
         self.examples = examples or ExampleCollector(
+            retriever=retriever,
             use_llm_refinement=use_llm_refinement, 
             llm_client=llm_client
         )
-        self.domain_knowledge = domain_knowledge or DomainKnowledgeInjector()
+        self.domain_knowledge = domain_knowledge or DomainKnowledgeInjector(retriever=retriever)
+
+    def _prefetch(
+        self, ir: Dict[str, Any], knowledge_card: Optional[Dict[str, Any]]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Run the plain RAG searches of all sources as one batched search.
+
+        Only sources sharing a retriever and ``top_k`` (and not using LLM
+        refinement) are batched. Cached best-practices results are served
+        from the cache and left out of the batch; fresh ones are cached.
+        Returns results by source name; a missing source searches on its
+        own, so errors are still reported per source.
+        """
+        prefetched: Dict[str, List[Dict[str, Any]]] = {}
+        try:
+            sources = []
+            searchers = (("best_practices", self.best_practices), ("examples", self.examples))
+            for name, component in searchers:
+                if not (component.use_llm_refinement and component.llm_client):
+                    sources.append((name, component, component.build_query(ir)))
+            sources.append((
+                "domain_knowledge",
+                self.domain_knowledge,
+                self.domain_knowledge.build_query(ir, knowledge_card),
+            ))
+
+            if sources[0][0] == "best_practices":
+                cached = self.best_practices.cached_results(sources[0][2])
+                if cached is not None:
+                    prefetched["best_practices"] = cached
+                    sources.pop(0)
+
+            retriever = sources[0][1].retriever
+            top_k = sources[0][1].top_k
+            search_many = getattr(retriever, "search_many", None)
+            if (
+                len(sources) < 2
+                or search_many is None
+                or any(c.retriever is not retriever or c.top_k != top_k for _, c, _ in sources)
+            ):
+                return prefetched
+
+            batches = search_many([query for _, _, query in sources], top_k=top_k)
+        except Exception:
+            return prefetched
+
+        for (name, _, query), results in zip(sources, batches):
+            prefetched[name] = results
+            if name == "best_practices":
+                self.best_practices.cache_results(query, results)
+        return prefetched
 
     def enrich(self, ir: Dict[str, Any], knowledge_card: Optional[Dict[str, Any]] = None) -> EnrichedContext:
         bp = []
@@ -34,22 +93,26 @@ class ContextEnricher:
         dk = []
         meta: Dict[str, Any] = {"enabled": True}
 
+        prefetched = self._prefetch(ir, knowledge_card)
+
         try:
-            bp = self.best_practices.retrieve(ir)
+            bp = self.best_practices.retrieve(ir, results=prefetched.get("best_practices"))
             meta["best_practices_count"] = len(bp)
             meta["best_practices_method"] = "llm_refined" if self.best_practices.use_llm_refinement else "enhanced_rag"
         except Exception as e:
             meta["best_practices_error"] = str(e)
 
         try:
-            ex = self.examples.collect(ir)
+            ex = self.examples.collect(ir, results=prefetched.get("examples"))
             meta["examples_count"] = len(ex)
             meta["examples_method"] = "llm_refined" if self.examples.use_llm_refinement else "enhanced_rag"
         except Exception as e:
             meta["examples_error"] = str(e)
 
         try:
-            dk = self.domain_knowledge.inject(ir, knowledge_card=knowledge_card)
+            dk = self.domain_knowledge.inject(
+                ir, knowledge_card=knowledge_card, results=prefetched.get("domain_knowledge")
+            )
             meta["domain_knowledge_count"] = len(dk)
         except Exception as e:
             meta["domain_knowledge_error"] = str(e)
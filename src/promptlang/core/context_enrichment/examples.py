@@ -13,7 +13,8 @@ class ExampleCollector:
         self.use_llm_refinement = use_llm_refinement
         self.llm_client = llm_client
 
-    def collect(self, ir: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def build_query(self, ir: Dict[str, Any]) -> str:
+        """Retrieval query used for plain RAG search."""
         meta = ir.get("meta", {})
         task = ir.get("task", {})
         context = ir.get("context", {})
@@ -26,7 +27,16 @@ class ExampleCollector:
 
         bits = ["Examples", intent, str(lang), str(framework), str(desc)]
         query = " ".join([b for b in bits if b]).strip()
-        query = query[:500]
+        return query[:500]
+
+    def collect(
+        self, ir: Dict[str, Any], results: Optional[List[Dict[str, Any]]] = None
+    ) -> List[Dict[str, Any]]:
+        """Collect examples, optionally from already fetched search results."""
+        if results is not None:
+            return results
+
+        query = self.build_query(ir)
         
         # Use Option C (hybrid RAG + LLM refinement) if enabled and LLM client available
         if self.use_llm_refinement and self.llm_client:
@@ -9,7 +9,7 @@ from .catalog import DiagramCatalog, DiagramType
 from .analyzer import ProjectAnalyzer, ProjectContext
 from .scorer import RelevanceScorer, DiagramRecommendation
 from .generator_simple import SimpleDiagramGenerator, GeneratedDiagram, DiagramTool, DiagramFormat
-from .pipeline import DiagramPipeline
+from .pipeline import DiagramPipeline, PipelineConfig, validate_pipeline_config
 
 __all__ = [
     "DiagramCatalog",
@@ -23,4 +23,6 @@ __all__ = [
     "DiagramTool",
     "DiagramFormat",
     "DiagramPipeline",
+    "PipelineConfig",
+    "validate_pipeline_config",
 ]
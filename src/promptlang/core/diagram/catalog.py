@@ -2,6 +2,7 @@
 Diagram Catalog - Comprehensive metadata for 400+ diagram types
 """
 
+from collections import Counter
 from dataclasses import dataclass, field
 from typing import List, Dict, Set, Optional, Tuple
 from enum import Enum
@@ -387,13 +388,14 @@ class DiagramCatalog:
     
     def get_stats(self) -> Dict[str, int]:
         """Get catalog statistics"""
+        by_complexity = Counter(d.complexity for d in self._diagrams.values())
         return {
             "total_diagrams": len(self._diagrams),
             "categories": len(self._by_category),
-            "complexity_simple": len([d for d in self._diagrams.values() if d.complexity == Complexity.SIMPLE]),
-            "complexity_moderate": len([d for d in self._diagrams.values() if d.complexity == Complexity.MODERATE]),
-            "complexity_complex": len([d for d in self._diagrams.values() if d.complexity == Complexity.COMPLEX]),
-            "complexity_expert": len([d for d in self._diagrams.values() if d.complexity == Complexity.EXPERT]),
+            "complexity_simple": by_complexity[Complexity.SIMPLE],
+            "complexity_moderate": by_complexity[Complexity.MODERATE],
+            "complexity_complex": by_complexity[Complexity.COMPLEX],
+            "complexity_expert": by_complexity[Complexity.EXPERT],
         }
     
     def _add_flow_process_diagrams(self):
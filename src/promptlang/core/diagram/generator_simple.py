@@ -19,6 +19,9 @@ class DiagramTool(Enum):
     PLANTUML = "plantuml"
     MERMAID = "mermaid"
 
+SUPPORTED_TOOLS = (DiagramTool.PLANTUML, DiagramTool.MERMAID)
+SUPPORTED_FORMATS = (DiagramFormat.SVG, DiagramFormat.PNG, DiagramFormat.PDF)
+
 @dataclass
 class GeneratedDiagram:
     """Represents a generated diagram"""
@@ -33,6 +36,22 @@ class GeneratedDiagram:
     success: bool = True
     error_message: str = ""
 
+    def to_api_dict(self) -> Dict[str, Any]:
+        """Fields exposed by the diagram API, with enums as their values"""
+        return {
+            "id": self.diagram_type.id,
+            "name": self.diagram_type.name,
+            "tool": self.tool.value,
+            "format": self.format.value,
+            "content": self.content,
+            "source_code": self.source_code,
+            "success": self.success,
+            "error_message": self.error_message,
+            "file_size": self.file_size,
+            "generation_time": self.generation_time,
+            "metadata": self.metadata
+        }
+
 class SimpleDiagramGenerator:
     """Simple template-based diagram generator"""
     
@@ -63,11 +82,11 @@ class SimpleDiagramGenerator:
     
     def get_supported_tools(self) -> List[DiagramTool]:
         """Get list of supported diagram tools"""
-        return [DiagramTool.PLANTUML, DiagramTool.MERMAID]
+        return list(SUPPORTED_TOOLS)
     
     def get_supported_formats(self) -> List[DiagramFormat]:
         """Get list of supported output formats"""
-        return [DiagramFormat.SVG, DiagramFormat.PNG, DiagramFormat.PDF]
+        return list(SUPPORTED_FORMATS)
     
     def _system_context_template(self) -> str:
         """Generate System Context diagram template"""
@@ -2,6 +2,7 @@
 Diagram Pipeline - Main orchestration for diagram generation workflow
 """
 
+from collections import Counter
 from dataclasses import dataclass, field
 from typing import List, Dict, Set, Optional, Any, Tuple
 from enum import Enum
@@ -12,7 +13,14 @@ from pathlib import Path
 from .catalog import DiagramCatalog, DiagramType
 from .analyzer import ProjectAnalyzer, ProjectContext
 from .scorer import RelevanceScorer, DiagramRecommendation, SelectionTier
-from .generator_simple import SimpleDiagramGenerator, GeneratedDiagram, DiagramTool, DiagramFormat
+from .generator_simple import (
+    SUPPORTED_FORMATS,
+    SUPPORTED_TOOLS,
+    DiagramFormat,
+    DiagramTool,
+    GeneratedDiagram,
+    SimpleDiagramGenerator,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +60,34 @@ class PipelineResult:
     summary: Dict[str, Any] = field(default_factory=dict)
 
 
+def validate_pipeline_config(config: PipelineConfig) -> List[str]:
+    """Validate a pipeline configuration without building a pipeline.
+
+    Only inspects the config, so validation-only callers skip loading the
+    catalog, analyzer, scorer and generator.
+    """
+    issues = []
+    
+    if config.max_diagrams <= 0:
+        issues.append("max_diagrams must be greater than 0")
+    
+    if not (0 <= config.min_score_threshold <= 1):
+        issues.append("min_score_threshold must be between 0 and 1")
+    
+    if config.timeout_seconds <= 0:
+        issues.append("timeout_seconds must be greater than 0")
+    
+    # Check if preferred tool is supported
+    if config.preferred_tool and config.preferred_tool not in SUPPORTED_TOOLS:
+        issues.append(f"Preferred tool {config.preferred_tool.value} is not supported")
+    
+    # Check if output format is supported
+    if config.output_format not in SUPPORTED_FORMATS:
+        issues.append(f"Output format {config.output_format.value} is not supported")
+    
+    return issues
+
+
 class DiagramPipeline:
     """Main pipeline for diagram generation workflow"""
     
@@ -245,6 +281,7 @@ class DiagramPipeline:
         """Create pipeline execution summary"""
         successful_diagrams = [d for d in generated_diagrams if d.success]
         failed_diagrams = [d for d in generated_diagrams if not d.success]
+        by_tier = Counter(r.selection_tier for r in recommendations)
         
         summary = {
             "project": {
@@ -257,10 +294,10 @@ class DiagramPipeline:
             "recommendations": {
                 "total": len(recommendations),
                 "by_tier": {
-                    "must_generate": len([r for r in recommendations if r.selection_tier == SelectionTier.MUST_GENERATE]),
-                    "should_generate": len([r for r in recommendations if r.selection_tier == SelectionTier.SHOULD_GENERATE]),
-                    "could_generate": len([r for r in recommendations if r.selection_tier == SelectionTier.COULD_GENERATE]),
-                    "optional": len([r for r in recommendations if r.selection_tier == SelectionTier.OPTIONAL]),
+                    "must_generate": by_tier[SelectionTier.MUST_GENERATE],
+                    "should_generate": by_tier[SelectionTier.SHOULD_GENERATE],
+                    "could_generate": by_tier[SelectionTier.COULD_GENERATE],
+                    "optional": by_tier[SelectionTier.OPTIONAL],
                 },
                 "average_score": sum(r.relevance_score for r in recommendations) / len(recommendations) if recommendations else 0,
                 "top_5": [
@@ -333,29 +370,7 @@ class DiagramPipeline:
     
     def validate_config(self) -> List[str]:
         """Validate pipeline configuration"""
-        issues = []
-        
-        if self.config.max_diagrams <= 0:
-            issues.append("max_diagrams must be greater than 0")
-        
-        if not (0 <= self.config.min_score_threshold <= 1):
-            issues.append("min_score_threshold must be between 0 and 1")
-        
-        if self.config.timeout_seconds <= 0:
-            issues.append("timeout_seconds must be greater than 0")
-        
-        # Check if preferred tool is supported
-        if self.config.preferred_tool:
-            supported_tools = self.generator.get_supported_tools()
-            if self.config.preferred_tool not in supported_tools:
-                issues.append(f"Preferred tool {self.config.preferred_tool.value} is not supported")
-        
-        # Check if output format is supported
-        supported_formats = self.generator.get_supported_formats()
-        if self.config.output_format not in supported_formats:
-            issues.append(f"Output format {self.config.output_format.value} is not supported")
-        
-        return issues
+        return validate_pipeline_config(self.config)
     
     def estimate_execution_time(self, num_diagrams: int) -> float:
         """Estimate execution time for given number of diagrams"""
@@ -3,7 +3,7 @@ Relevance Scoring Algorithm - Scores diagram types based on project context
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Set, Optional, Tuple
+from typing import Any, List, Dict, Set, Optional, Tuple
 from enum import Enum
 import logging
 
@@ -34,6 +34,21 @@ class DiagramRecommendation:
     prerequisites_met: bool = True
     complementary_diagrams: List[str] = field(default_factory=list)
 
+    def to_api_dict(self) -> Dict[str, Any]:
+        """Fields exposed by the diagram API, with enums as their values"""
+        return {
+            "id": self.diagram.id,
+            "name": self.diagram.name,
+            "category": self.diagram.category.value,
+            "score": self.relevance_score,
+            "tier": self.selection_tier.value,
+            "reasoning": self.reasoning,
+            "confidence": self.confidence,
+            "effort": self.estimated_effort,
+            "prerequisites_met": self.prerequisites_met,
+            "complementary_diagrams": self.complementary_diagrams
+        }
+
 
 @dataclass
 class ScoringWeights:
@@ -2,10 +2,16 @@
 
 import logging
 import re
-from typing import Optional
+from typing import Any, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
 
 class IntentRouter:
     """Routes user input to appropriate intent category."""
@@ -54,6 +60,31 @@ class IntentRouter:
         ],
     }
 
+    def __init__(self):
+        """Initialize router and precompile the intent patterns."""
+        self._intent_names: Tuple[str, ...] = tuple(self.PATTERNS)
+        # (compiled pattern, index of its intent in _intent_names)
+        self._compiled: Tuple[Tuple["re.Pattern[str]", int], ...] = tuple(
+            (re.compile(pattern), intent_idx)
+            for intent_idx, intent in enumerate(self._intent_names)
+            for pattern in self.PATTERNS[intent]
+        )
+        # With RE2, one Set scan reports every matching pattern (by index into
+        # _compiled) without running the patterns one by one
+        self._pattern_set = self._compile_set() if RE2_AVAILABLE else None
+
+    def _compile_set(self) -> Optional[Any]:
+        """Compile all patterns into an unanchored ``re2.Set``, or None on failure."""
+        try:
+            pattern_set = re2.Set.SearchSet(re2.Options())
+            for rx, _ in self._compiled:
+                pattern_set.Add(rx.pattern)
+            pattern_set.Compile()
+        except Exception as e:
+            logger.warning(f"RE2 cannot compile intent patterns, using re: {e}")
+            return None
+        return pattern_set
+
     def route(self, input_text: str, explicit_intent: Optional[str] = None) -> str:
         """Route input to intent.
 
@@ -69,17 +100,21 @@ class IntentRouter:
 
         input_lower = input_text.lower()
 
-        # Score each intent
-        scores = {}
-        for intent, patterns in self.PATTERNS.items():
-            score = sum(1 for pattern in patterns if re.search(pattern, input_lower))
-            if score > 0:
-                scores[intent] = score
-
-        if scores:
-            # Return intent with highest score
-            detected = max(scores, key=scores.get)  # type: ignore
-            logger.info(f"Intent detected: {detected} (score: {scores[detected]})")
+        # Score each intent by the number of its patterns found in the input
+        scores = [0] * len(self._intent_names)
+        if self._pattern_set is not None:
+            for pattern_idx in self._pattern_set.Match(input_lower) or ():
+                scores[self._compiled[pattern_idx][1]] += 1
+        else:
+            for rx, intent_idx in self._compiled:
+                if rx.search(input_lower):
+                    scores[intent_idx] += 1
+
+        # Highest score wins; ties go to the intent listed first
+        best = max(range(len(scores)), key=scores.__getitem__)
+        if scores[best]:
+            detected = self._intent_names[best]
+            logger.info(f"Intent detected: {detected} (score: {scores[best]})")
             return detected
 
         # Default to scaffold
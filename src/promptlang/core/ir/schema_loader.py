@@ -1,13 +1,23 @@
 """IR schema loader and validation."""
 
 import json
+import logging
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 import jsonschema
 from jsonschema import Draft7Validator
 
+logger = logging.getLogger(__name__)
+
+try:
+    import jsonschema_rs
+    JSONSCHEMA_RS_AVAILABLE = True
+except ImportError:
+    JSONSCHEMA_RS_AVAILABLE = False
+
 
 def load_schema(version: str = "2.1") -> Dict[str, Any]:
     """Load IR schema from schemas directory."""
@@ -20,12 +30,35 @@ def load_schema(version: str = "2.1") -> Dict[str, Any]:
         return json.load(f)
 
 
+@lru_cache(maxsize=8)
 def get_validator(version: str = "2.1") -> Draft7Validator:
-    """Get JSON Schema validator for IR."""
+    """Get JSON Schema validator for IR.
+
+    Schemas are immutable at runtime, so the schema is checked against the
+    Draft 7 metaschema and the validator built once per version, then shared
+    across calls.
+    """
     schema = load_schema(version)
+    Draft7Validator.check_schema(schema)
     return Draft7Validator(schema)
 
 
+@lru_cache(maxsize=8)
+def get_fast_validator(version: str = "2.1") -> Optional[Any]:
+    """Get the compiled Rust validator for IR, if ``jsonschema_rs`` is installed.
+
+    Returns None when the package is missing or cannot compile the schema, in
+    which case validation uses the python-jsonschema validator only.
+    """
+    if not JSONSCHEMA_RS_AVAILABLE:
+        return None
+    try:
+        return jsonschema_rs.Draft7Validator(load_schema(version))
+    except Exception as e:
+        logger.warning(f"jsonschema_rs cannot compile IR schema v{version}, using jsonschema: {e}")
+        return None
+
+
 def validate_ir(
     ir_data: Dict[str, Any],
     version: str = "2.1",
@@ -33,9 +66,21 @@ def validate_ir(
 ) -> tuple[bool, Optional[list[str]]]:
     """Validate IR against schema with retry logic.
 
+    The compiled validator, when available, answers the common valid case.
+    Invalid IRs are re-checked with python-jsonschema so error messages keep
+    the same format regardless of which engine is installed.
+
     Returns:
         Tuple of (is_valid, list_of_errors)
     """
+    fast_validator = get_fast_validator(version)
+    if fast_validator is not None:
+        try:
+            if fast_validator.is_valid(ir_data):
+                return True, None
+        except ValueError:
+            pass  # Not representable as JSON for the Rust validator
+
     validator = get_validator(version)
     errors = list(validator.iter_errors(ir_data))
 
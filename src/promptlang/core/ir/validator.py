@@ -3,86 +3,104 @@
 import logging
 from typing import Any, Dict, Optional
 
-from promptlang.core.ir.schema_loader import validate_ir
+from promptlang.core.cache.l1_cache import L1Cache
+from promptlang.core.ir.schema_loader import get_fast_validator, get_validator, validate_ir
+from promptlang.core.utils.hashing import hash_content
 
 logger = logging.getLogger(__name__)
 
 
 class IRValidator:
-    """IR schema validator with retry and basic repair."""
-
-    def __init__(self, schema_version: str = "2.1", max_retries: int = 3):
+    """IR schema validator with retry and basic repair.
+
+    Content hashes of IRs that passed validation are remembered, so an
+    identical IR seen again skips the schema walk.
+    """
+
+    def __init__(
+        self,
+        schema_version: str = "2.1",
+        max_retries: int = 3,
+        valid_cache_size: int = 1024,
+    ):
         """Initialize validator.
 
         Args:
             schema_version: Schema version to validate against
             max_retries: Maximum retry attempts
+            valid_cache_size: Number of known-valid IR hashes to remember
         """
         self.schema_version = schema_version
         self.max_retries = max_retries
+        self._known_valid = L1Cache(max_size=valid_cache_size, ttl_seconds=3600)
+
+        # Build the shared schema validators now rather than on the first request
+        get_validator(schema_version)
+        get_fast_validator(schema_version)
 
     def validate(
-        self, ir_data: Dict[str, Any], attempt: int = 0
+        self, ir_data: Dict[str, Any]
     ) -> tuple[bool, Optional[list[str]], Dict[str, Any]]:
         """Validate IR with retry and basic repair.
 
         Returns:
             Tuple of (is_valid, errors, repaired_ir)
         """
-        is_valid, errors = validate_ir(ir_data, version=self.schema_version)
+        try:
+            ir_hash: Optional[str] = hash_content(ir_data)
+        except TypeError:
+            ir_hash = None  # Not JSON-serializable; validate without memoizing
 
-        if is_valid:
+        if ir_hash is not None and self._known_valid.get(ir_hash):
             return True, None, ir_data
 
-        if attempt >= self.max_retries:
-            logger.error(f"IR validation failed after {self.max_retries} attempts")
-            return False, errors, ir_data
+        for attempt in range(self.max_retries + 1):
+            is_valid, errors = validate_ir(ir_data, version=self.schema_version)
 
-        # Attempt basic repair
-        repaired = self._attempt_repair(ir_data, errors)
-        logger.info(f"Retrying validation (attempt {attempt + 1}/{self.max_retries})")
-        return self.validate(repaired, attempt=attempt + 1)
+            if is_valid:
+                if ir_hash is not None:
+                    # Remember the IR that actually validated, not the unrepaired input
+                    if attempt:
+                        ir_hash = hash_content(ir_data)
+                    self._known_valid.set(ir_hash, True)
+                return True, None, ir_data
 
-    def _attempt_repair(self, ir_data: Dict[str, Any], errors: list[str]) -> Dict[str, Any]:
-        """Attempt basic repair of IR based on validation errors."""
-        repaired = ir_data.copy()
+            if attempt == self.max_retries:
+                break
+
+            # Attempt basic repair. The caller's top-level dict is copied once
+            # on the first attempt; later attempts keep repairing that copy.
+            ir_data = self._attempt_repair(ir_data.copy() if attempt == 0 else ir_data, errors)
+            logger.info(f"Retrying validation (attempt {attempt + 1}/{self.max_retries})")
 
-        # Ensure required top-level fields exist
-        if "meta" not in repaired:
-            repaired["meta"] = {}
-        if "task" not in repaired:
-            repaired["task"] = {}
-        if "constraints" not in repaired:
-            repaired["constraints"] = {}
+        logger.error(f"IR validation failed after {self.max_retries} attempts")
+        return False, errors, ir_data
 
+    def _attempt_repair(self, ir_data: Dict[str, Any], errors: list[str]) -> Dict[str, Any]:
+        """Attempt basic repair of IR based on validation errors.
+
+        Repairs ``ir_data`` in place and returns it.
+        """
         # Ensure required meta fields
-        meta = repaired.setdefault("meta", {})
-        if "intent" not in meta:
-            meta["intent"] = "scaffold"  # Default
-        if "schema_version" not in meta:
-            meta["schema_version"] = "2.1.0"
-        if "compiler_version" not in meta:
-            meta["compiler_version"] = "0.1.0"
+        meta = ir_data.setdefault("meta", {})
+        meta.setdefault("intent", "scaffold")  # Default
+        meta.setdefault("schema_version", "2.1.0")
+        meta.setdefault("compiler_version", "0.1.0")
 
         # Ensure required task fields
-        task = repaired.setdefault("task", {})
-        if "description" not in task:
-            task["description"] = ""
+        ir_data.setdefault("task", {}).setdefault("description", "")
 
         # Ensure required constraints
-        constraints = repaired.setdefault("constraints", {})
-        if "must_avoid" not in constraints:
-            constraints["must_avoid"] = []
+        ir_data.setdefault("constraints", {}).setdefault("must_avoid", [])
 
         # Ensure output_contract
-        if "output_contract" not in repaired:
-            repaired["output_contract"] = {
+        if "output_contract" not in ir_data:
+            ir_data["output_contract"] = {
                 "required_sections": [],
                 "file_block_format": "strict",
             }
 
         # Ensure quality_checks
-        if "quality_checks" not in repaired:
-            repaired["quality_checks"] = {}
+        ir_data.setdefault("quality_checks", {})
 
-        return repaired
+        return ir_data
@@ -5,8 +5,57 @@ It loads artifacts created under repo-root `knowledge/`.
 """
 
 import json
+import re
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+def _compile_terms(terms: Sequence[str]) -> "re.Pattern[str]":
+    """Compile keyword terms into one alternation so a text is scanned once."""
+    return re.compile("|".join(re.escape(term) for term in terms))
+
+
+# Keyword lists used by chunk filtering. Each list is also compiled into a
+# single pattern at import time so "does any term occur" checks are one
+# C-level scan per text instead of one Python-level substring test per term.
+_FASTAPI_UNRELATED_TERMS = (
+    # Cloud platforms
+    "aws", "azure", "gcp", "google cloud", "amazon web services",
+    # Container/DevOps
+    "docker", "kubernetes", "k8s", "container", "cicd", "ci/cd",
+    "terraform", "ansible", "jenkins", "pipeline", "deployment",
+    # Frontend/Testing
+    "cypress", "selenium", "jest", "react", "vue", "angular",
+    # Databases (unless specifically mentioned)
+    "redis", "mongodb", "postgresql", "mysql", "database",
+    # AI/ML (unless specifically mentioned)
+    "llamaindex", "openai", "chatgpt", "machine learning", "ai",
+    # General architecture patterns
+    "microservices", "serverless", "lambda", "functions",
+    # Monitoring/Ops
+    "monitoring", "logging", "elk", "prometheus", "grafana",
+    # Documentation tools
+    "swagger", "openapi", "postman", "insomnia",
+    # Other languages/frameworks
+    "node.js", "express", "django", "flask", "rails", "spring",
+    # General programming concepts
+    "design patterns", "solid principles", "clean code",
+    # Cloud-specific services
+    "ec2", "s3", "lambda", "azure functions", "cloud functions",
+    # Version control/CI
+    "gitlab", "github actions", "gitlab ci", "version control",
+)
+_FASTAPI_TERMS = ("fastapi", "pydantic", "uvicorn", "python web", "asyncio", "python api")
+_GENERIC_SECURITY_TERMS = ("owasp", "cheat sheet", "security guide", "best practices", "top 10")
+_IMPLEMENTATION_TERMS = ("code", "example", "tutorial", "implementation", "fastapi", "python")
+_GENERIC_DOC_TERMS = ("welcome to", "getting started", "overview", "introduction", "documentation")
+
+_FASTAPI_UNRELATED_TERMS_RE = _compile_terms(_FASTAPI_UNRELATED_TERMS)
+_FASTAPI_TERMS_RE = _compile_terms(_FASTAPI_TERMS)
+_GENERIC_SECURITY_TERMS_RE = _compile_terms(_GENERIC_SECURITY_TERMS)
+_IMPLEMENTATION_TERMS_RE = _compile_terms(_IMPLEMENTATION_TERMS)
+_GENERIC_DOC_TERMS_RE = _compile_terms(_GENERIC_DOC_TERMS)
 
 
 class KnowledgeRetriever:
@@ -21,7 +70,10 @@ class KnowledgeRetriever:
     _shared_embedder: Optional[Any] = None
     _shared_vectorizer: Optional[Any] = None
     _shared_tfidf_matrix: Optional[Any] = None
+    _shared_embedder_name: Optional[str] = None
     _loaded: bool = False
+    _load_lock = threading.Lock()
+    _embedder_lock = threading.Lock()
 
     def __init__(
         self,
@@ -38,57 +90,96 @@ class KnowledgeRetriever:
         self.embedding_model_name = embedding_model_name
 
     @classmethod
-    def _lazy_load(cls, index_path: Path, meta_path: Path, embedding_model_name: str) -> None:
-        """Load index + chunk records once per process."""
-        if cls._loaded:
-            return
+    def shared_embedder(cls, embedding_model_name: str = "all-MiniLM-L6-v2") -> Any:
+        """Return the process-wide sentence-transformers model, loading it once.
 
-        # Load meta.json first (includes chunks list)
-        if not meta_path.exists():
-            raise FileNotFoundError(f"Knowledge metadata not found: {meta_path}")
-        with open(meta_path, "r", encoding="utf-8") as f:
-            cls._shared_meta = json.load(f)
-        cls._shared_chunks = cls._shared_meta.get("chunks", [])
+        Other components that embed text (e.g. the semantic response cache)
+        use this instead of loading a second copy of the same model. A
+        different model name gets its own, unshared instance.
 
-        # Prefer FAISS + sentence-transformers if available, but fall back to a
-        # lightweight TF-IDF retriever when heavy ML deps (torch) are broken.
-        if index_path.exists():
-            try:
-                import faiss  # type: ignore
-
-                cls._shared_index = faiss.read_index(str(index_path))
-            except Exception:
-                cls._shared_index = None
-
-        if cls._shared_index is not None:
-            try:
+        Args:
+            embedding_model_name: sentence-transformers model name
+        """
+        with cls._embedder_lock:
+            if cls._shared_embedder is not None:
+                if cls._shared_embedder_name in (None, embedding_model_name):
+                    return cls._shared_embedder
                 from sentence_transformers import SentenceTransformer  # type: ignore
 
-                cls._shared_embedder = SentenceTransformer(embedding_model_name, device="cpu")
-            except Exception:
-                cls._shared_embedder = None
+                return SentenceTransformer(embedding_model_name, device="cpu")
 
-        if cls._shared_index is None or cls._shared_embedder is None:
-            # TF-IDF fallback (no torch required)
-            try:
-                from sklearn.feature_extraction.text import TfidfVectorizer  # type: ignore
-            except Exception as e:
-                raise RuntimeError(
-                    "scikit-learn is required for TF-IDF fallback retrieval. Install 'scikit-learn' to enable RAG."
-                ) from e
+            from sentence_transformers import SentenceTransformer  # type: ignore
 
-            texts = [c.get("text", "") for c in (cls._shared_chunks or [])]
-            cls._shared_vectorizer = TfidfVectorizer(
-                max_features=20000,
-                stop_words="english",
-            )
-            cls._shared_tfidf_matrix = cls._shared_vectorizer.fit_transform(texts)
+            cls._shared_embedder = SentenceTransformer(embedding_model_name, device="cpu")
+            cls._shared_embedder_name = embedding_model_name
+            return cls._shared_embedder
+
+    @classmethod
+    def _lazy_load(cls, index_path: Path, meta_path: Path, embedding_model_name: str) -> None:
+        """Load index + chunk records once per process."""
+        if cls._loaded:
+            return
 
-        cls._loaded = True
+        # Concurrent first callers (e.g. a warm-up thread and a request) load once
+        with cls._load_lock:
+            if cls._loaded:
+                return
+
+            # Load meta.json first (includes chunks list)
+            if not meta_path.exists():
+                raise FileNotFoundError(f"Knowledge metadata not found: {meta_path}")
+            with open(meta_path, "r", encoding="utf-8") as f:
+                cls._shared_meta = json.load(f)
+            cls._shared_chunks = cls._shared_meta.get("chunks", [])
+
+            # Prefer FAISS + sentence-transformers if available, but fall back to a
+            # lightweight TF-IDF retriever when heavy ML deps (torch) are broken.
+            if index_path.exists():
+                try:
+                    import faiss  # type: ignore
+
+                    cls._shared_index = faiss.read_index(str(index_path))
+                except Exception:
+                    cls._shared_index = None
+
+            if cls._shared_index is not None:
+                try:
+                    cls._shared_embedder = cls.shared_embedder(embedding_model_name)
+                except Exception:
+                    cls._shared_embedder = None
+
+            if cls._shared_index is None or cls._shared_embedder is None:
+                # TF-IDF fallback (no torch required)
+                try:
+                    from sklearn.feature_extraction.text import TfidfVectorizer  # type: ignore
+                except Exception as e:
+                    raise RuntimeError(
+                        "scikit-learn is required for TF-IDF fallback retrieval. Install 'scikit-learn' to enable RAG."
+                    ) from e
+
+                texts = [c.get("text", "") for c in (cls._shared_chunks or [])]
+                cls._shared_vectorizer = TfidfVectorizer(
+                    max_features=20000,
+                    stop_words="english",
+                )
+                cls._shared_tfidf_matrix = cls._shared_vectorizer.fit_transform(texts)
+
+            cls._loaded = True
 
     def _ensure_loaded(self) -> None:
         self._lazy_load(self.index_path, self.meta_path, self.embedding_model_name)
 
+    def warm_up(self, query: str = "warmup") -> None:
+        """Load shared artifacts and run one throwaway search.
+
+        Meant to be called from a background thread at startup so the first
+        real search does not pay for index loading and model initialization.
+
+        Args:
+            query: Query used for the throwaway search
+        """
+        self.search(query, top_k=1)
+
     @staticmethod
     def _trim_text(text: str, max_chars: int) -> str:
         if not text:
@@ -112,10 +203,29 @@ class KnowledgeRetriever:
         Dedupes by URL and trims chunk text.
         Enhanced with keyword boosters and domain filters for better relevance.
         """
+        return self.search_many([query], top_k=top_k)[0]
+
+    def search_many(
+        self, queries: Sequence[str], top_k: Optional[int] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """Search several queries at once; returns one result list per query.
+
+        All queries are embedded in a single ``encode`` call and looked up with
+        a single batched index search (or one sparse matmul on the TF-IDF
+        fallback), instead of one model and index round trip per query.
+        Results match calling ``search`` on each query, up to float rounding
+        of the batched embedding and index matmuls.
+
+        Args:
+            queries: Query texts; blank queries get an empty result list
+            top_k: Results per query (default: retriever's top_k)
+        """
         self._ensure_loaded()
 
-        if not query.strip():
-            return []
+        results: List[List[Dict[str, Any]]] = [[] for _ in queries]
+        live = [i for i, query in enumerate(queries) if query.strip()]
+        if not live:
+            return results
 
         top_k = top_k or self.top_k
         chunks = self._shared_chunks or []
@@ -123,7 +233,7 @@ class KnowledgeRetriever:
         embedder = self._shared_embedder
 
         # Option B: Keyword boosters and domain filters
-        boosted_query = self._apply_keyword_boosters(query)
+        boosted_queries = [self._apply_keyword_boosters(queries[i]) for i in live]
         
         if index is not None and embedder is not None and chunks:
             try:
@@ -133,56 +243,55 @@ class KnowledgeRetriever:
                     "numpy is required for knowledge retrieval. Install 'numpy' to enable RAG."
                 ) from e
 
-            query_vec = embedder.encode([boosted_query], normalize_embeddings=True)
-            scores, indices = index.search(query_vec.astype(np.float32), min(top_k * 3, len(chunks)))
-
-            results: List[Dict[str, Any]] = []
-            seen_urls = set()
-            for score, idx in zip(scores[0], indices[0]):
-                if idx < 0 or idx >= len(chunks):
-                    continue
-                chunk = chunks[idx]
-                url = chunk.get("url", "")
-                if not url or url in seen_urls:
-                    continue
-                
-                # Apply domain filters
-                if self._should_filter_chunk(chunk, query):
-                    continue
-                
-                # Apply relevance boosting
-                boosted_score = self._apply_relevance_boost(chunk, query, score)
-                results.append(self._chunk_to_result(chunk, boosted_score, self.max_chunk_chars))
-                seen_urls.add(url)
-
-                if len(results) >= top_k:
-                    break
+            query_vecs = embedder.encode(boosted_queries, normalize_embeddings=True)
+            scores, indices = index.search(query_vecs.astype(np.float32), min(top_k * 3, len(chunks)))
 
+            for row, i in enumerate(live):
+                results[i] = self._rank_candidates(
+                    chunks, queries[i], zip(scores[row], indices[row]), top_k
+                )
             return results
 
         # TF-IDF fallback with enhancements
         vectorizer = self._shared_vectorizer
         matrix = self._shared_tfidf_matrix
         if vectorizer is None or matrix is None or not chunks:
-            return []
+            return results
 
         try:
             import numpy as np  # type: ignore
         except Exception as e:
             raise RuntimeError("numpy is required for TF-IDF fallback retrieval.") from e
 
-        qv = vectorizer.transform([boosted_query])
-        # cosine similarity for L2-normalized tf-idf vectors is dot product
-        scores = (matrix @ qv.T).toarray().reshape(-1)
-        # take a bit more for url de-dupe and filtering
-        k = min(top_k * 5, len(scores))
-        best = np.argpartition(-scores, range(k))[:k]
-        best = best[np.argsort(-scores[best])]
+        qv = vectorizer.transform(boosted_queries)
+        # cosine similarity for L2-normalized tf-idf vectors is dot product;
+        # one column of scores per query
+        all_scores = (matrix @ qv.T).toarray()
+        for row, i in enumerate(live):
+            scores = all_scores[:, row]
+            # take a bit more for url de-dupe and filtering
+            k = min(top_k * 5, len(scores))
+            best = np.argpartition(-scores, range(k))[:k]
+            best = best[np.argsort(-scores[best])]
+            candidates = ((float(scores[int(idx)]), int(idx)) for idx in best)
+            results[i] = self._rank_candidates(chunks, queries[i], candidates, top_k)
+
+        return results
 
+    def _rank_candidates(
+        self,
+        chunks: List[Dict[str, Any]],
+        query: str,
+        candidates: Iterable[Tuple[Any, int]],
+        top_k: int,
+    ) -> List[Dict[str, Any]]:
+        """Dedupe, filter and boost ``(score, chunk_index)`` candidates in rank order."""
         results: List[Dict[str, Any]] = []
         seen_urls = set()
-        for idx in best:
-            chunk = chunks[int(idx)]
+        for score, idx in candidates:
+            if idx < 0 or idx >= len(chunks):
+                continue
+            chunk = chunks[idx]
             url = chunk.get("url", "")
             if not url or url in seen_urls:
                 continue
@@ -192,9 +301,10 @@ class KnowledgeRetriever:
                 continue
             
             # Apply relevance boosting
-            boosted_score = self._apply_relevance_boost(chunk, query, float(scores[int(idx)]))
+            boosted_score = self._apply_relevance_boost(chunk, query, score)
             results.append(self._chunk_to_result(chunk, boosted_score, self.max_chunk_chars))
             seen_urls.add(url)
+
             if len(results) >= top_k:
                 break
 
@@ -256,60 +366,29 @@ class KnowledgeRetriever:
         
         # Comprehensive filtering for FastAPI authentication queries
         if "fastapi" in query_lower and ("auth" in query_lower or "jwt" in query_lower or "authentication" in query_lower):
-            # Filter out completely unrelated technologies
-            unrelated_terms = [
-                # Cloud platforms
-                "aws", "azure", "gcp", "google cloud", "amazon web services",
-                # Container/DevOps
-                "docker", "kubernetes", "k8s", "container", "cicd", "ci/cd",
-                "terraform", "ansible", "jenkins", "pipeline", "deployment",
-                # Frontend/Testing
-                "cypress", "selenium", "jest", "react", "vue", "angular",
-                # Databases (unless specifically mentioned)
-                "redis", "mongodb", "postgresql", "mysql", "database",
-                # AI/ML (unless specifically mentioned)
-                "llamaindex", "openai", "chatgpt", "machine learning", "ai",
-                # General architecture patterns
-                "microservices", "serverless", "lambda", "functions",
-                # Monitoring/Ops
-                "monitoring", "logging", "elk", "prometheus", "grafana",
-                # Documentation tools
-                "swagger", "openapi", "postman", "insomnia",
-                # Other languages/frameworks
-                "node.js", "express", "django", "flask", "rails", "spring",
-                # General programming concepts
-                "design patterns", "solid principles", "clean code",
-                # Cloud-specific services
-                "ec2", "s3", "lambda", "azure functions", "cloud functions",
-                # Version control/CI
-                "gitlab", "github actions", "gitlab ci", "version control"
-            ]
-            
             # But allow if chunk contains FastAPI-specific content
-            fastapi_terms = ["fastapi", "pydantic", "uvicorn", "python web", "asyncio", "python api"]
-            if any(term in chunk_text for term in fastapi_terms):
+            if _FASTAPI_TERMS_RE.search(chunk_text):
                 # Only filter if it's primarily about unrelated topics
-                unrelated_count = sum(1 for term in unrelated_terms if term in chunk_text)
-                fastapi_count = sum(1 for term in fastapi_terms if term in chunk_text)
+                unrelated_count = sum(1 for term in _FASTAPI_UNRELATED_TERMS if term in chunk_text)
+                fastapi_count = sum(1 for term in _FASTAPI_TERMS if term in chunk_text)
                 return unrelated_count > fastapi_count * 1  # Filter if mostly unrelated (reduced threshold)
             else:
                 # Filter if no FastAPI content and contains unrelated terms
-                return any(term in chunk_text or term in chunk_url for term in unrelated_terms)
+                return bool(
+                    _FASTAPI_UNRELATED_TERMS_RE.search(chunk_text)
+                    or _FASTAPI_UNRELATED_TERMS_RE.search(chunk_url)
+                )
         
         # Filter out generic security docs if we need specific implementation guides
         if "auth" in query_lower and "implementation" in query_lower:
-            generic_security = ["owasp", "cheat sheet", "security guide", "best practices", "top 10"]
-            implementation_terms = ["code", "example", "tutorial", "implementation", "fastapi", "python"]
-            
-            has_generic = any(term in chunk_text for term in generic_security)
-            has_implementation = any(term in chunk_text for term in implementation_terms)
+            has_generic = _GENERIC_SECURITY_TERMS_RE.search(chunk_text) is not None
+            has_implementation = _IMPLEMENTATION_TERMS_RE.search(chunk_text) is not None
             
             # Filter if it's generic security without implementation details
             return has_generic and not has_implementation
         
         # Filter out completely generic documentation
-        generic_docs = ["welcome to", "getting started", "overview", "introduction", "documentation"]
-        if any(term in chunk_text for term in generic_docs) and "fastapi" not in chunk_text:
+        if _GENERIC_DOC_TERMS_RE.search(chunk_text) and "fastapi" not in chunk_text:
             return True
         
         return False
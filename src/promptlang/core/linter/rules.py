@@ -1,121 +1,142 @@
 """IR linter with deterministic rules."""
 
 import logging
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple
 
 logger = logging.getLogger(__name__)
 
 
+class Finding(NamedTuple):
+    """A single lint finding; use ``_asdict()`` where a JSON object is needed."""
+
+    severity: str
+    rule: str
+    message: str
+
+
+# Kept ordered so findings are reported deterministically
+_REQUIRED_FIELDS = ("meta", "task", "context", "constraints", "output_contract", "quality_checks")
+_REQUIRED_FIELD_SET = frozenset(_REQUIRED_FIELDS)
+
+# Rules that can only ever produce warning-severity findings
+_WARNING_ONLY_RULES = frozenset({"_check_token_budget_reasonableness"})
+
+
 class IRLinter:
     """Deterministic IR linter for stage 4."""
 
     def __init__(self):
         """Initialize linter."""
         self.rules = self._load_rules()
+        # Progressive validation ignores warnings, so warning-only rules are skipped
+        self._progressive_rules = tuple(
+            rule for rule in self.rules if rule.__name__ not in _WARNING_ONLY_RULES
+        )
 
-    def _load_rules(self) -> List[Callable[[Dict[str, Any]], List[Dict[str, str]]]]:
+    def _load_rules(self) -> Tuple[Callable[[Dict[str, Any]], List[Finding]], ...]:
         """Load linting rules."""
-        return [
+        return (
             self._check_required_fields,
             self._check_constraints_validity,
             self._check_output_contract_completeness,
             self._check_token_budget_reasonableness,
-        ]
+        )
 
-    def lint(self, ir_data: Dict[str, Any]) -> tuple[bool, List[Dict[str, str]]]:
+    def lint(
+        self, ir_data: Dict[str, Any], mode: str = "strict"
+    ) -> tuple[bool, Tuple[Finding, ...]]:
         """Lint IR and return findings.
 
+        Args:
+            ir_data: IR to lint
+            mode: Validation mode (strict/progressive); progressive skips
+                rules that only report warnings
+
         Returns:
-            Tuple of (is_valid, findings_list)
+            Tuple of (is_valid, findings)
         """
-        findings: List[Dict[str, str]] = []
+        findings: List[Finding] = []
+        rules = self._progressive_rules if mode == "progressive" else self.rules
 
-        for rule in self.rules:
+        for rule in rules:
             try:
                 rule_findings = rule(ir_data)
                 findings.extend(rule_findings)
             except Exception as e:
                 logger.warning(f"Lint rule failed: {e}")
-                findings.append({
-                    "severity": "warning",
-                    "rule": rule.__name__,
-                    "message": f"Rule check failed: {e}",
-                })
+                findings.append(Finding("warning", rule.__name__, f"Rule check failed: {e}"))
 
-        is_valid = all(f.get("severity") != "error" for f in findings)
-        return is_valid, findings
+        is_valid = all(f.severity != "error" for f in findings)
+        return is_valid, tuple(findings)
 
-    def _check_required_fields(self, ir: Dict[str, Any]) -> List[Dict[str, str]]:
+    def _check_required_fields(self, ir: Dict[str, Any]) -> List[Finding]:
         """Check required fields are present."""
-        findings = []
-        required = ["meta", "task", "context", "constraints", "output_contract", "quality_checks"]
-
-        for field in required:
-            if field not in ir:
-                findings.append({
-                    "severity": "error",
-                    "rule": "required_fields",
-                    "message": f"Missing required field: {field}",
-                })
+        # Common case: one set comparison instead of a lookup per field
+        if ir.keys() >= _REQUIRED_FIELD_SET:
+            return []
 
-        return findings
+        return [
+            Finding("error", "required_fields", f"Missing required field: {field}")
+            for field in _REQUIRED_FIELDS
+            if field not in ir
+        ]
 
-    def _check_constraints_validity(self, ir: Dict[str, Any]) -> List[Dict[str, str]]:
+    def _check_constraints_validity(self, ir: Dict[str, Any]) -> List[Finding]:
         """Check constraints are valid."""
-        findings = []
+        findings: List[Finding] = []
         constraints = ir.get("constraints", {})
 
         if "must_avoid" not in constraints:
-            findings.append({
-                "severity": "error",
-                "rule": "constraints_validity",
-                "message": "constraints.must_avoid is required",
-            })
+            findings.append(Finding(
+                "error",
+                "constraints_validity",
+                "constraints.must_avoid is required",
+            ))
 
         token_budget = constraints.get("token_budget")
         if token_budget is not None:
             if not isinstance(token_budget, int) or token_budget < 100:
-                findings.append({
-                    "severity": "error",
-                    "rule": "constraints_validity",
-                    "message": "token_budget must be integer >= 100",
-                })
+                findings.append(Finding(
+                    "error",
+                    "constraints_validity",
+                    "token_budget must be integer >= 100",
+                ))
 
         return findings
 
-    def _check_output_contract_completeness(self, ir: Dict[str, Any]) -> List[Dict[str, str]]:
+    def _check_output_contract_completeness(self, ir: Dict[str, Any]) -> List[Finding]:
         """Check output contract is complete."""
-        findings = []
+        findings: List[Finding] = []
         contract = ir.get("output_contract", {})
 
         if "required_sections" not in contract:
-            findings.append({
-                "severity": "error",
-                "rule": "output_contract_completeness",
-                "message": "output_contract.required_sections is required",
-            })
+            findings.append(Finding(
+                "error",
+                "output_contract_completeness",
+                "output_contract.required_sections is required",
+            ))
 
         if "file_block_format" not in contract:
-            findings.append({
-                "severity": "error",
-                "rule": "output_contract_completeness",
-                "message": "output_contract.file_block_format is required",
-            })
+            findings.append(Finding(
+                "error",
+                "output_contract_completeness",
+                "output_contract.file_block_format is required",
+            ))
 
         return findings
 
-    def _check_token_budget_reasonableness(self, ir: Dict[str, Any]) -> List[Dict[str, str]]:
+    def _check_token_budget_reasonableness(self, ir: Dict[str, Any]) -> List[Finding]:
         """Check token budget is reasonable."""
-        findings = []
+        findings: List[Finding] = []
         constraints = ir.get("constraints", {})
         token_budget = constraints.get("token_budget")
 
         if token_budget is not None:
             if token_budget > 100000:
-                findings.append({
-                    "severity": "warning",
-                    "rule": "token_budget_reasonableness",
-                    "message": f"token_budget {token_budget} is very large",
-                })
+                findings.append(Finding(
+                    "warning",
+                    "token_budget_reasonableness",
+                    f"token_budget {token_budget} is very large",
+                ))
 
         return findings
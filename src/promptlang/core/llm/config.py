@@ -2,11 +2,21 @@
 """Configuration management for LLM providers"""
 
 from enum import Enum
-from typing import Optional, List
-from pydantic import BaseModel, Field, validator
+from functools import lru_cache
+from typing import Any, Optional, List, Tuple
+from pydantic import BaseModel, Field, model_validator
 import os
 
 
+# API key fields and the environment variables they fall back to
+_API_KEY_ENV_VARS = (
+    ("groq_api_key", "GROQ_API_KEY"),
+    ("hf_token", "HF_TOKEN"),
+    ("gemini_api_key", "GEMINI_API_KEY"),
+    ("openrouter_api_key", "OPENROUTER_API_KEY"),
+)
+
+
 class LLMProviderType(str, Enum):
     """Available LLM provider types"""
     GROQ = "groq"
@@ -64,27 +74,31 @@ class LLMConfig(BaseModel):
         env_file = ".env"
         env_file_encoding = "utf-8"
     
-    @validator("groq_api_key", pre=True, always=True)
-    def set_groq_key(cls, v):
-        return v or os.getenv("GROQ_API_KEY")
-    
-    @validator("hf_token", pre=True, always=True)
-    def set_hf_token(cls, v):
-        return v or os.getenv("HF_TOKEN")
-    
-    @validator("gemini_api_key", pre=True, always=True)
-    def set_gemini_key(cls, v):
-        return v or os.getenv("GEMINI_API_KEY")
+    @model_validator(mode="before")
+    @classmethod
+    def set_api_keys_from_env(cls, data: Any) -> Any:
+        """Fill unset API keys from the environment in one pass."""
+        if not isinstance(data, dict):
+            return data
+        missing = [(field, env) for field, env in _API_KEY_ENV_VARS if not data.get(field)]
+        if not missing:
+            return data
+        data = dict(data)
+        for field, env in missing:
+            data[field] = os.getenv(env)
+        return data
     
-    @validator("openrouter_api_key", pre=True, always=True)
-    def set_openrouter_key(cls, v):
-        return v or os.getenv("OPENROUTER_API_KEY")
-    
-    def get_provider_chain(self) -> List[LLMProviderType]:
+    def get_provider_chain(self) -> Tuple[LLMProviderType, ...]:
         """Get ordered provider chain for fallback"""
-        chain = [self.primary_provider]
-        chain.extend([p for p in self.fallback_providers if p != self.primary_provider])
-        return chain
+        return _build_provider_chain(self.primary_provider, tuple(self.fallback_providers))
+
+
+@lru_cache(maxsize=32)
+def _build_provider_chain(
+    primary: LLMProviderType, fallbacks: Tuple[LLMProviderType, ...]
+) -> Tuple[LLMProviderType, ...]:
+    """Build the fallback chain; shared across configs with the same providers."""
+    return (primary, *(p for p in fallbacks if p != primary))
 
 
 def get_zero_budget_config() -> LLMConfig:
@@ -1,17 +1,50 @@
 """Token optimizer for stage 5."""
 
-import hashlib
 import logging
-from typing import Any, Dict, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping
+
+import orjson
 
 from promptlang.core.optimizer.strategies import (
     SemanticChunkingStrategy,
     DeduplicationStrategy,
     PriorityCompressionStrategy,
 )
+from promptlang.core.utils.hashing import hash_content
 
 logger = logging.getLogger(__name__)
 
+# Intent-based budget multipliers
+_BUDGET_MULTIPLIERS: Mapping[str, float] = MappingProxyType({
+    "scaffold": 1.2,  # Highest
+    "devops": 1.1,  # High
+    "debug": 1.0,
+    "refactor": 1.0,
+    "explain": 0.9,  # Lowest
+})
+
+_PRIORITY_WEIGHTS: Mapping[str, float] = MappingProxyType({
+    "output_contract": 1.0,  # Never compress
+    "must_avoid": 1.0,  # Never compress
+    "security_constraints": 1.0,  # Never compress
+    "task_description": 0.8,
+    "context": 0.6,
+    "examples": 0.4,
+})
+
+
+@lru_cache(maxsize=256)
+def _fingerprint(intent: Any, task_scope: Any, required_sections: tuple) -> str:
+    """Hash the semantic key fields; few distinct combinations recur across requests."""
+    key_fields = {
+        "intent": intent,
+        "task_scope": task_scope,
+        "required_sections": list(required_sections),
+    }
+    return hash_content(key_fields, digest_size=8)
+
 
 class TokenOptimizer:
     """Token optimizer implementing semantic chunking, deduplication, and priority compression."""
@@ -38,7 +71,8 @@ class TokenOptimizer:
             intent: Intent for adaptive budgeting
 
         Returns:
-            Tuple of (optimized_ir, warnings_list)
+            Tuple of (optimized_ir, warnings_list). The token estimate is
+            recorded under ``optimized_ir["optimization"]["estimated_tokens"]``.
         """
         warnings: List[str] = []
 
@@ -63,8 +97,9 @@ class TokenOptimizer:
         optimization_meta["semantic_fingerprint"] = fingerprint
         optimization_meta["priority_weights"] = self._get_priority_weights(intent)
 
-        # Estimate token count (rough approximation)
+        # Estimate token count (rough approximation), kept for downstream stages
         estimated_tokens = self._estimate_tokens(optimized)
+        optimization_meta["estimated_tokens"] = estimated_tokens
 
         if estimated_tokens > adaptive_budget:
             warnings.append(f"Estimated tokens ({estimated_tokens}) exceed budget ({adaptive_budget})")
@@ -76,43 +111,33 @@ class TokenOptimizer:
 
     def _get_adaptive_budget(self, base_budget: int, intent: str) -> int:
         """Get adaptive budget based on intent."""
-        # Intent-based budget multipliers
-        multipliers = {
-            "scaffold": 1.2,  # Highest
-            "devops": 1.1,  # High
-            "debug": 1.0,
-            "refactor": 1.0,
-            "explain": 0.9,  # Lowest
-        }
-        multiplier = multipliers.get(intent, 1.0)
-        return int(base_budget * multiplier)
+        return int(base_budget * _BUDGET_MULTIPLIERS.get(intent, 1.0))
 
     def _generate_semantic_fingerprint(self, ir: Dict[str, Any]) -> str:
         """Generate semantic fingerprint for IR."""
         # Use key semantic fields
-        key_fields = {
-            "intent": ir.get("meta", {}).get("intent"),
-            "task_scope": ir.get("task", {}).get("scope"),
-            "required_sections": ir.get("output_contract", {}).get("required_sections", []),
-        }
-        import json
-        key_str = json.dumps(key_fields, sort_keys=True)
-        return hashlib.sha256(key_str.encode()).hexdigest()[:16]
+        intent = ir.get("meta", {}).get("intent")
+        task_scope = ir.get("task", {}).get("scope")
+        required_sections = ir.get("output_contract", {}).get("required_sections", [])
+        try:
+            return _fingerprint(intent, task_scope, tuple(required_sections))
+        except TypeError:
+            # Unhashable field values; hash them directly
+            key_fields = {
+                "intent": intent,
+                "task_scope": task_scope,
+                "required_sections": required_sections,
+            }
+            return hash_content(key_fields, digest_size=8)
 
     def _get_priority_weights(self, intent: str) -> Dict[str, float]:
-        """Get priority weights for compression by intent."""
-        base_weights = {
-            "output_contract": 1.0,  # Never compress
-            "must_avoid": 1.0,  # Never compress
-            "security_constraints": 1.0,  # Never compress
-            "task_description": 0.8,
-            "context": 0.6,
-            "examples": 0.4,
-        }
-        return base_weights
+        """Get priority weights for compression by intent.
+
+        Returns a fresh dict because the weights are stored in the optimized IR,
+        which callers may mutate and serialize.
+        """
+        return dict(_PRIORITY_WEIGHTS)
 
     def _estimate_tokens(self, ir: Dict[str, Any]) -> int:
         """Rough token estimation (characters / 4 approximation)."""
-        import json
-        json_str = json.dumps(ir, separators=(",", ":"))
-        return len(json_str) // 4  # Rough approximation
+        return len(orjson.dumps(ir)) // 4  # Rough approximation
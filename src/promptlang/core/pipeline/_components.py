@@ -0,0 +1,26 @@
+"""Stage components shared by every pipeline orchestrator.
+
+These components hold no per-request state (or only thread-safe caches), so a
+single instance per process is built at import and bound by each
+``PipelineOrchestrator``. Components that pick an LLM provider from the
+environment at construction time (``IRBuilder``, ``ScaffoldGenerator``) stay
+per-orchestrator.
+"""
+
+from promptlang.core.clarification.engine import ClarificationEngine
+from promptlang.core.compiler.dialect_compiler import DialectCompiler
+from promptlang.core.intent.router import IntentRouter
+from promptlang.core.ir.validator import IRValidator
+from promptlang.core.knowledge import KnowledgeRetriever
+from promptlang.core.linter.rules import IRLinter
+from promptlang.core.optimizer.token_optimizer import TokenOptimizer
+from promptlang.core.validator.output_validator import OutputValidator
+
+INTENT_ROUTER = IntentRouter()
+CLARIFICATION_ENGINE = ClarificationEngine()
+IR_VALIDATOR = IRValidator()
+IR_LINTER = IRLinter()
+TOKEN_OPTIMIZER = TokenOptimizer()
+DIALECT_COMPILER = DialectCompiler()
+KNOWLEDGE_RETRIEVER = KnowledgeRetriever()
+OUTPUT_VALIDATOR = OutputValidator()
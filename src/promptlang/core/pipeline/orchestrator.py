@@ -5,24 +5,35 @@ import hashlib
 import logging
 import os
 import uuid
-from typing import Any, Callable, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import structlog
 
 from promptlang.core.cache.manager import CacheManager
-from promptlang.core.clarification.engine import ClarificationEngine
-from promptlang.core.compiler.dialect_compiler import DialectCompiler
+from promptlang.core.cache.semantic import SemanticResponseCache
 from promptlang.core.generator.scaffold import ScaffoldGenerator
-from promptlang.core.intent.router import IntentRouter
-from promptlang.core.ir.validator import IRValidator
-from promptlang.core.knowledge import KnowledgeRetriever, build_retrieval_query
-from promptlang.core.linter.rules import IRLinter
-from promptlang.core.optimizer.token_optimizer import TokenOptimizer
+from promptlang.core.knowledge import build_retrieval_query
+from promptlang.core.linter.rules import Finding
+from promptlang.core.pipeline._components import (
+    CLARIFICATION_ENGINE,
+    DIALECT_COMPILER,
+    INTENT_ROUTER,
+    IR_LINTER,
+    IR_VALIDATOR,
+    KNOWLEDGE_RETRIEVER,
+    OUTPUT_VALIDATOR,
+    TOKEN_OPTIMIZER,
+)
 from promptlang.core.prompt_compiler import PromptTemplateEngine
 from promptlang.core.translator.ir_builder import IRBuilder
-from promptlang.core.utils.hashing import generate_cache_key, hash_ir
+from promptlang.core.utils.hashing import (
+    content_cache_key,
+    generate_cache_key,
+    hash_content,
+    hash_ir,
+)
 from promptlang.core.utils.timing import TimingContext
-from promptlang.core.validator.output_validator import OutputValidator
 from promptlang.core.llm.manager import LLMProviderManager
 from promptlang.core.llm.config import LLMConfig, LLMProviderType
 
@@ -32,6 +43,21 @@ from promptlang.core.knowledge.llm_adapter import create_llm_adapter
 
 logger = structlog.get_logger()
 
+# Stage names recorded in every result's provenance; shared, never mutated
+_TRANSFORMATION_CHAIN = (
+    "input_normalization",
+    "intent_routing",
+    "clarification",
+    "ir_translation",
+    "rag_retrieval",
+    "schema_validation",
+    "ir_linting",
+    "token_optimization",
+    "dialect_compilation",
+    "scaffold_generation",
+    "output_validation",
+)
+
 
 class PipelineOrchestrator:
     """Orchestrates the complete pipeline stages 0-8."""
@@ -40,13 +66,24 @@ class PipelineOrchestrator:
         self,
         cache_manager: Optional[CacheManager] = None,
         llm_provider: Optional[str] = None,
+        semantic_cache: Optional[SemanticResponseCache] = None,
     ):
         """Initialize orchestrator.
 
         Args:
             cache_manager: Cache manager instance
+            semantic_cache: Cache for paraphrased requests (default: none;
+                built only when PROMPTLANG_SEMANTIC_CACHE=true, since a hit
+                returns a result generated for a different request text)
         """
         self.cache_manager = cache_manager or CacheManager()
+        semantic_cache_enabled = os.getenv("PROMPTLANG_SEMANTIC_CACHE", "false").lower() == "true"
+        if semantic_cache is None and semantic_cache_enabled:
+            semantic_cache = SemanticResponseCache()
+        self.semantic_cache = semantic_cache
+
+        # Build hash only depends on the environment, so derive it once
+        self._build_hash = hashlib.sha256(os.getenv("BUILD_HASH", "dev").encode()).hexdigest()[:8]
         
         # Initialize LLM manager for Option C (hybrid RAG + LLM refinement)
         # Use only Groq provider to avoid dependency issues
@@ -66,17 +103,23 @@ class PipelineOrchestrator:
             llm_adapter = None
             use_llm_refinement = False
         
-        # Initialize stage components
-        self.intent_router = IntentRouter()
-        self.clarification_engine = ClarificationEngine()
-        self.ir_builder = IRBuilder()
-        self.ir_validator = IRValidator()
-        self.linter = IRLinter()
-        self.token_optimizer = TokenOptimizer()
-        self.dialect_compiler = DialectCompiler()
-        self.knowledge_retriever = KnowledgeRetriever()
+        # Bind the process-wide stateless stage components
+        self.intent_router = INTENT_ROUTER
+        self.clarification_engine = CLARIFICATION_ENGINE
+        self.ir_builder = IRBuilder(
+            intent_router=INTENT_ROUTER, clarification_engine=CLARIFICATION_ENGINE
+        )
+        self.ir_validator = IR_VALIDATOR
+        self.linter = IR_LINTER
+        self.token_optimizer = TOKEN_OPTIMIZER
+        self.dialect_compiler = DIALECT_COMPILER
+        self.knowledge_retriever = KNOWLEDGE_RETRIEVER
         self.scaffold_generator = ScaffoldGenerator()
-        self.output_validator = OutputValidator()
+        self.output_validator = OUTPUT_VALIDATOR
+
+        # Dedicated pool for the parallel linter + optimizer stage, so it does
+        # not compete with other run_in_executor work on the default pool
+        self._stage_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pl-stage45")
 
         self.github_parser = GitHubParser(github_token=os.getenv("GITHUB_TOKEN"))
         self.content_scraper = ContentScraper()
@@ -86,10 +129,15 @@ class PipelineOrchestrator:
         llm_adapter = create_llm_adapter(self.llm_manager) if self.llm_manager else None
         self.context_enricher = ContextEnricher(
             use_llm_refinement=False,  # Disable Option C
-            llm_client=llm_adapter  # Pass LLM adapter for refinement
+            llm_client=llm_adapter,  # Pass LLM adapter for refinement
+            cache_manager=self.cache_manager,
         )
         self.prompt_template_engine = PromptTemplateEngine()
 
+    def close(self) -> None:
+        """Shut down the stage worker pool."""
+        self._stage_pool.shutdown(wait=False, cancel_futures=True)
+
     def configure_context_enrichment(self, use_llm_refinement: bool = False, llm_client: Optional[Any] = None):
         """Configure context enrichment options.
         
@@ -99,7 +147,8 @@ class PipelineOrchestrator:
         """
         self.context_enricher = ContextEnricher(
             use_llm_refinement=use_llm_refinement,
-            llm_client=llm_client
+            llm_client=llm_client,
+            cache_manager=self.cache_manager,
         )
 
     async def execute(
@@ -129,11 +178,6 @@ class PipelineOrchestrator:
         request_id = str(uuid.uuid4())
         timing = TimingContext()
 
-        # Generate build hash
-        build_hash = hashlib.sha256(
-            f"{os.getenv('BUILD_HASH', 'dev')}".encode()
-        ).hexdigest()[:8]
-
         logger.info("Pipeline execution started", request_id=request_id)
 
         # Stage 0: Input normalization (DTO creation)
@@ -148,8 +192,21 @@ class PipelineOrchestrator:
                 "validation_mode": validation_mode,
             }
 
-        # Generate cache key
-        # First we need IR to generate cache key, so we'll generate it after stage 2
+        # Coarse cache keyed on the normalized request: an identical request
+        # skips every later stage, including IR translation
+        input_cache_key = content_cache_key("input", normalized_input)
+        cached_result = self.cache_manager.get(input_cache_key)
+        if cached_result:
+            logger.info("Input cache hit", request_id=request_id, cache_key=input_cache_key[:25])
+            return {**cached_result, "cache_hit": True}
+
+        # Paraphrases of an earlier request with the same parameters reuse its result
+        params_key = hash_content({k: v for k, v in normalized_input.items() if k != "input"})
+        cached_result = await self._semantic_get(input_text, params_key)
+        if cached_result:
+            logger.info("Semantic cache hit", request_id=request_id)
+            self.cache_manager.set(input_cache_key, cached_result)
+            return {**cached_result, "cache_hit": True}
 
         # Stage 1: Intent routing
         with timing.stage("stage_1_intent"):
@@ -168,46 +225,50 @@ class PipelineOrchestrator:
                 input_text, explicit_intent=detected_intent, context=context
             )
 
-        # Stage 2.5: Knowledge Retrieval (IR -> RAG)
-        with timing.stage("stage_2_5_rag_retrieval"):
-            retrieved_knowledge = []
-            rag_enabled = False
-            try:
-                retrieval_query = build_retrieval_query(ir)
-                retrieved_knowledge = self.knowledge_retriever.search(retrieval_query, top_k=6)
-                rag_enabled = True
-            except Exception as e:
-                logger.warning(f"RAG retrieval disabled: {e}")
-
-            # Attach to pipeline context for downstream stages
-            if isinstance(context, dict):
-                context["retrieved_knowledge"] = retrieved_knowledge
-
         # Generate cache key now that we have IR
         ir_hash = hash_ir(ir)
         schema_version = ir.get("meta", {}).get("schema_version", "2.1.0")
         compiler_version = "0.1.0"
         cache_key = generate_cache_key(ir_hash, schema_version, compiler_version, target_model)
 
-        # Check cache
+        # Check cache before retrieval; a cached result already carries its sources
         cached_result = self.cache_manager.get(cache_key)
         if cached_result:
             logger.info("Cache hit", request_id=request_id, cache_key=cache_key[:16])
-            return cached_result
+            self.cache_manager.set(input_cache_key, cached_result)
+            return {**cached_result, "cache_hit": True}
 
-        # Stage 3: Schema Validation
-        with timing.stage("stage_3_validate"):
-            is_valid, errors, ir = self.ir_validator.validate(ir)
-            if not is_valid:
-                raise ValueError(f"IR validation failed: {errors}")
+        # Stage 2.5 & 3: Knowledge retrieval (IR -> RAG) and schema validation
+        # only depend on the translated IR, so run them concurrently off the
+        # event loop. The query is built first because validation may repair
+        # nested IR fields in place.
+        try:
+            retrieval_query: Optional[str] = build_retrieval_query(ir)
+        except Exception as e:
+            logger.warning(f"RAG retrieval disabled: {e}")
+            retrieval_query = None
+
+        (retrieved_knowledge, rag_enabled), (is_valid, errors, ir) = await asyncio.gather(
+            self._run_stage(
+                timing, "stage_2_5_rag_retrieval", self._retrieve_knowledge, retrieval_query
+            ),
+            self._run_stage(timing, "stage_3_validate", self.ir_validator.validate, ir),
+        )
+        if not is_valid:
+            raise ValueError(f"IR validation failed: {errors}")
+
+        # Attach to pipeline context for downstream stages
+        if isinstance(context, dict):
+            context["retrieved_knowledge"] = retrieved_knowledge
 
         # Stage 4 & 5: Parallel execution (Linter + Optimizer)
         with timing.stage("stage_4_5_parallel"):
-            linter_task = asyncio.create_task(self._run_linter(ir))
+            linter_task = asyncio.create_task(self._run_linter(ir, validation_mode))
             optimizer_task = asyncio.create_task(self._run_optimizer(ir, token_budget, detected_intent))
 
             # Wait for both
-            linter_valid, linter_findings = await linter_task
+            linter_valid, lint_results = await linter_task
+            linter_findings = [finding._asdict() for finding in lint_results]
             optimized_ir, optimization_warnings = await optimizer_task
 
             if not linter_valid:
@@ -235,26 +296,14 @@ class PipelineOrchestrator:
         # Build provenance
         provenance = {
             "request_id": request_id,
-            "build_hash": build_hash,
+            "build_hash": self._build_hash,
             "stage_timings_ms": timing.get_timings(),
             "token_usage": {
-                "estimated": self._estimate_tokens(optimized_ir),
+                "estimated": optimized_ir["optimization"]["estimated_tokens"],
                 "budget": token_budget,
             },
             "cost_metadata": {},
-            "transformation_chain": [
-                "input_normalization",
-                "intent_routing",
-                "clarification",
-                "ir_translation",
-                "rag_retrieval",
-                "schema_validation",
-                "ir_linting",
-                "token_optimization",
-                "dialect_compilation",
-                "scaffold_generation",
-                "output_validation",
-            ],
+            "transformation_chain": _TRANSFORMATION_CHAIN,
         }
 
         # Build result
@@ -272,8 +321,9 @@ class PipelineOrchestrator:
             "rag_enabled": rag_enabled,
         }
 
-        # Cache result
-        self.cache_manager.set(cache_key, result)
+        # Cache result under both the IR key and the coarse input key
+        self.cache_manager.set_many({cache_key: result, input_cache_key: result})
+        await self._semantic_set(input_text, params_key, result)
 
         logger.info("Pipeline execution complete", request_id=request_id, status=result["status"])
         return result
@@ -317,6 +367,12 @@ class PipelineOrchestrator:
             cached["job_id"] = job_id
             return cached
 
+        params_key = hash_content({k: v for k, v in cache_payload.items() if k != "input_text"})
+        cached = await self._semantic_get(input_text, params_key)
+        if cached:
+            emit("cache_hit", {"job_id": job_id})
+            return {**cached, "job_id": job_id}
+
         emit("start", {"job_id": job_id})
 
         with timing.stage("stage_1_ir_translate"):
@@ -395,25 +451,61 @@ class PipelineOrchestrator:
         }
 
         self.cache_manager.set(cache_key, result)
+        await self._semantic_set(input_text, params_key, result)
         emit("complete", {"job_id": job_id})
         return result
 
-    async def _run_linter(self, ir: Dict[str, Any]) -> tuple[bool, List[Dict[str, str]]]:
+    @staticmethod
+    async def _run_stage(
+        timing: TimingContext, stage: str, func: Callable[..., Any], *args: Any
+    ) -> Any:
+        """Run a blocking stage in a worker thread, timing it under ``stage``."""
+        with timing.stage(stage):
+            return await asyncio.to_thread(func, *args)
+
+    def _retrieve_knowledge(
+        self, retrieval_query: Optional[str]
+    ) -> tuple[List[Dict[str, Any]], bool]:
+        """Search the knowledge index; returns (chunks, rag_enabled)."""
+        if retrieval_query is None:
+            return [], False
+        try:
+            return self.knowledge_retriever.search(retrieval_query, top_k=6), True
+        except Exception as e:
+            logger.warning(f"RAG retrieval disabled: {e}")
+            return [], False
+
+    async def _semantic_get(self, text: str, params_key: str) -> Optional[Dict[str, Any]]:
+        """Look up a paraphrased request; embedding runs off the event loop."""
+        if self.semantic_cache is None:
+            return None
+        try:
+            return await asyncio.to_thread(self.semantic_cache.get, text, params_key)
+        except Exception as e:
+            logger.warning(f"Semantic cache lookup failed: {e}")
+            return None
+
+    async def _semantic_set(self, text: str, params_key: str, result: Dict[str, Any]) -> None:
+        """Store a result for later paraphrases of the request."""
+        if self.semantic_cache is None:
+            return
+        try:
+            await asyncio.to_thread(self.semantic_cache.set, text, params_key, result)
+        except Exception as e:
+            logger.warning(f"Semantic cache store failed: {e}")
+
+    async def _run_linter(
+        self, ir: Dict[str, Any], validation_mode: str = "strict"
+    ) -> Tuple[bool, Tuple[Finding, ...]]:
         """Run linter asynchronously."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.linter.lint, ir)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._stage_pool, self.linter.lint, ir, validation_mode)
 
     async def _run_optimizer(
         self, ir: Dict[str, Any], token_budget: int, intent: str
     ) -> tuple[Dict[str, Any], List[str]]:
         """Run token optimizer asynchronously."""
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(
-            None, self.token_optimizer.optimize, ir, token_budget, intent
+            self._stage_pool, self.token_optimizer.optimize, ir, token_budget, intent
         )
-
-    def _estimate_tokens(self, ir: Dict[str, Any]) -> int:
-        """Estimate token count."""
-        import json
-        json_str = json.dumps(ir, separators=(",", ":"))
-        return len(json_str) // 4
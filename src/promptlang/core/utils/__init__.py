@@ -1,6 +1,25 @@
-"""Core utilities for hashing and timing."""
+"""Core utilities for hashing, timing and token counting."""
 
-from promptlang.core.utils.hashing import hash_ir, generate_cache_key, hash_string
+from promptlang.core.utils.hashing import (
+    canonical_json,
+    content_cache_key,
+    generate_cache_key,
+    hash_content,
+    hash_ir,
+    hash_string,
+)
 from promptlang.core.utils.timing import TimingContext, current_timestamp_ms
+from promptlang.core.utils.tokens import count_tokens, get_token_encoding
 
-__all__ = ["hash_ir", "generate_cache_key", "hash_string", "TimingContext", "current_timestamp_ms"]
+__all__ = [
+    "hash_ir",
+    "generate_cache_key",
+    "hash_string",
+    "hash_content",
+    "content_cache_key",
+    "canonical_json",
+    "TimingContext",
+    "current_timestamp_ms",
+    "count_tokens",
+    "get_token_encoding",
+]
@@ -4,6 +4,17 @@ import hashlib
 import json
 from typing import Any, Dict
 
+import orjson
+
+try:
+    from blake3 import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+# Algorithm tag for hash_content digests that become shared cache keys
+HASH_ALGORITHM = "b3" if BLAKE3_AVAILABLE else "b2"
+
 
 def hash_ir(ir_data: Dict[str, Any]) -> str:
     """Generate deterministic hash for IR data."""
@@ -37,3 +48,43 @@ def generate_cache_key(
 def hash_string(data: str) -> str:
     """Hash a string."""
     return hashlib.sha256(data.encode()).hexdigest()[:16]
+
+
+def canonical_json(data: Any) -> bytes:
+    """Serialize a JSON-compatible value to compact, key-sorted bytes."""
+    return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+
+
+def hash_content(data: Any, digest_size: int = 16) -> str:
+    """Hash a JSON-serializable value by its canonical (key-sorted) encoding.
+
+    Uses BLAKE3 when the optional ``blake3`` package is installed, otherwise
+    BLAKE2b. Either way the digest is produced at ``digest_size`` bytes
+    directly rather than truncated from a longer hex string.
+
+    The algorithm is not part of the digest; use :func:`content_cache_key`
+    for keys shared with other processes.
+
+    Args:
+        data: JSON-serializable value
+        digest_size: Digest length in bytes (default: 16)
+    """
+    payload = canonical_json(data)
+    if BLAKE3_AVAILABLE:
+        return blake3(payload).hexdigest(length=digest_size)
+    return hashlib.blake2b(payload, digest_size=digest_size).hexdigest()
+
+
+def content_cache_key(namespace: str, data: Any) -> str:
+    """Build a shared cache key from a namespace and a hashed value.
+
+    The key carries :data:`HASH_ALGORITHM`, so processes with and without the
+    ``speedups`` extra that share a Redis L2 cache use visibly distinct key
+    spaces instead of silently missing each other's entries. Install the same
+    extras on every process that shares an L2 cache.
+
+    Args:
+        namespace: Key prefix, e.g. ``"input"``
+        data: JSON-serializable value
+    """
+    return f"{namespace}:{HASH_ALGORITHM}:{hash_content(data)}"
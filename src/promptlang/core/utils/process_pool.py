@@ -0,0 +1,40 @@
+"""Shared process pool for CPU-bound validation work."""
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+# Created on first use and shared by every caller in the process
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Return the shared process pool, creating it on first use.
+
+    Workers are spawned rather than forked, since work is submitted from
+    worker threads of a running event loop.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+def reset_process_pool(broken: ProcessPoolExecutor) -> None:
+    """Drop a pool that failed so the next ``get_process_pool`` call spawns a fresh one.
+
+    Only the given pool is dropped: if another caller already replaced it,
+    the replacement is kept.
+
+    Args:
+        broken: The pool whose workers crashed or could not be spawned
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is not broken:
+            return
+        _pool = None
+    broken.shutdown(wait=False, cancel_futures=True)
@@ -1,43 +1,64 @@
 """Timing utilities for stage profiling."""
 
 import time
-from contextlib import contextmanager
 from typing import Dict, Optional
 
 
+class _Stage:
+    """Slotted context manager timing one stage of a ``TimingContext``."""
+
+    __slots__ = ("_context", "_name")
+
+    def __init__(self, context: "TimingContext", name: str):
+        self._context = context
+        self._name = name
+
+    def __enter__(self) -> None:
+        self._context.start(self._name)
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self._context.stop(self._name)
+        return False
+
+
 class TimingContext:
-    """Context manager for tracking stage timings."""
+    """Context manager for tracking stage timings.
+
+    Elapsed times are recorded as integer nanoseconds from
+    ``time.perf_counter_ns`` and only converted to milliseconds when read.
+    """
+
+    __slots__ = ("_elapsed_ns", "_start_times")
 
     def __init__(self):
-        self.timings: Dict[str, float] = {}
-        self._start_times: Dict[str, float] = {}
+        self._elapsed_ns: Dict[str, int] = {}
+        self._start_times: Dict[str, int] = {}
+
+    @property
+    def timings(self) -> Dict[str, float]:
+        """Recorded timings in milliseconds."""
+        return self.get_timings()
 
     def start(self, stage: str) -> None:
         """Start timing a stage."""
-        self._start_times[stage] = time.perf_counter()
+        self._start_times[stage] = time.perf_counter_ns()
 
     def stop(self, stage: str) -> float:
         """Stop timing a stage and return elapsed milliseconds."""
-        if stage not in self._start_times:
+        start = self._start_times.pop(stage, None)
+        if start is None:
             return 0.0
-        elapsed = time.perf_counter() - self._start_times[stage]
-        elapsed_ms = elapsed * 1000
-        self.timings[stage] = elapsed_ms
-        del self._start_times[stage]
-        return elapsed_ms
-
-    @contextmanager
-    def stage(self, stage_name: str):
+        elapsed_ns = time.perf_counter_ns() - start
+        self._elapsed_ns[stage] = elapsed_ns
+        return elapsed_ns / 1e6
+
+    def stage(self, stage_name: str) -> _Stage:
         """Context manager for timing a stage."""
-        self.start(stage_name)
-        try:
-            yield
-        finally:
-            self.stop(stage_name)
+        return _Stage(self, stage_name)
 
     def get_timings(self) -> Dict[str, float]:
         """Get all recorded timings."""
-        return self.timings.copy()
+        return {stage: elapsed / 1e6 for stage, elapsed in self._elapsed_ns.items()}
 
 
 def current_timestamp_ms() -> int:
@@ -0,0 +1,39 @@
+"""Token counting for prompt budgets."""
+
+import logging
+from functools import lru_cache
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+    logger.warning("tiktoken not available, token budgets use a chars/4 estimate")
+
+
+@lru_cache(maxsize=1)
+def get_token_encoding(name: str = "cl100k_base") -> Optional[Any]:
+    """Load a tiktoken encoding once; return None if it is unavailable.
+
+    Args:
+        name: tiktoken encoding name (default: cl100k_base)
+    """
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        return tiktoken.get_encoding(name)
+    except Exception as e:
+        # The BPE ranks are fetched on first use and may be unreachable offline
+        logger.warning(f"tiktoken encoding {name} unavailable, using chars/4 estimate: {e}")
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """Count BPE tokens in text, or estimate them as chars/4 without tiktoken."""
+    encoding = get_token_encoding()
+    if encoding is None:
+        return len(text) // 4
+    return len(encoding.encode_ordinary(text))
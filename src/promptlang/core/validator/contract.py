@@ -36,29 +36,34 @@ class ContractVerifier:
             "compliant": True,
         }
 
-        # Check required sections
-        section_names = [s["name"] for s in sections]
-        for section in required_sections:
-            if section in section_names:
-                compliance_summary["required_sections_present"].append(section)
-            else:
-                compliance_summary["required_sections_missing"].append(section)
+        # Check required sections. Present/missing are split with comprehensions
+        # over set lookups rather than set algebra so both lists keep the
+        # contract's order.
+        if required_sections:
+            section_names = {s["name"] for s in sections}
+            present = [s for s in required_sections if s in section_names]
+            compliance_summary["required_sections_present"] = present
+            if len(present) != len(required_sections):
+                compliance_summary["required_sections_missing"] = [
+                    s for s in required_sections if s not in section_names
+                ]
                 compliance_summary["compliant"] = False
 
         # Check required files
-        file_paths = [fb["path"] for fb in file_blocks]
-        for file_path in required_files:
-            if file_path in file_paths:
-                compliance_summary["required_files_present"].append(file_path)
-            else:
-                compliance_summary["required_files_missing"].append(file_path)
+        if required_files:
+            file_paths = {fb["path"] for fb in file_blocks}
+            present = [f for f in required_files if f in file_paths]
+            compliance_summary["required_files_present"] = present
+            if len(present) != len(required_files):
+                compliance_summary["required_files_missing"] = [
+                    f for f in required_files if f not in file_paths
+                ]
                 compliance_summary["compliant"] = False
 
-        # Check file block format
+        # Check file block format; one block without a language is enough
         if file_block_format == "strict":
-            for file_block in file_blocks:
-                if not file_block.get("language"):
-                    compliance_summary["file_block_format_correct"] = False
-                    compliance_summary["compliant"] = False
+            if not all(file_block.get("language") for file_block in file_blocks):
+                compliance_summary["file_block_format_correct"] = False
+                compliance_summary["compliant"] = False
 
         return compliance_summary["compliant"], compliance_summary
@@ -1,9 +1,14 @@
 """Output validator for stage 8 with concurrent validation checks."""
 
 import asyncio
+import copy
 import logging
-from typing import Any, Dict, List
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, TypeVar
 
+from promptlang.core.cache.l1_cache import L1Cache
+from promptlang.core.utils.hashing import hash_content
+from promptlang.core.utils.process_pool import get_process_pool, reset_process_pool
 from promptlang.core.utils.timing import TimingContext
 from promptlang.core.validator.parsers import OutputParser
 from promptlang.core.validator.syntax import SyntaxValidator
@@ -13,17 +18,36 @@ from promptlang.core.validator.contract import ContractVerifier
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class OutputValidator:
-    """Validates output with concurrent checks (stage 8)."""
+    """Validates output with concurrent checks (stage 8).
+
+    Syntax and quality checks hold the GIL, so for outputs of at least
+    ``PROCESS_POOL_MIN_CHARS`` characters they run in the shared process pool
+    and truly overlap; smaller outputs use threads to avoid pickling costs.
+    The security scanner fans out across processes by itself.
+
+    Validation is deterministic, so reports are memoized in an L1 cache keyed
+    on content hashes of the output and of the IR fields validation reads.
+    """
+
+    PROCESS_POOL_MIN_CHARS = 256 * 1024
 
-    def __init__(self):
-        """Initialize output validator."""
+    def __init__(self, cache_size: int = 256, cache_ttl: int = 300):
+        """Initialize output validator.
+
+        Args:
+            cache_size: Maximum number of validation reports to keep (default: 256)
+            cache_ttl: Validation report TTL in seconds (default: 300)
+        """
         self.parser = OutputParser()
         self.syntax_validator = SyntaxValidator()
         self.security_scanner = SecurityScanner()
         self.quality_checker = QualityChecker()
         self.contract_verifier = ContractVerifier()
+        self._cache = L1Cache(max_size=cache_size, ttl_seconds=cache_ttl)
 
     async def validate(
         self,
@@ -40,6 +64,39 @@ class OutputValidator:
             Validation report
         """
         timing = TimingContext()
+        timing.start("cache_hit")
+        # Only the contract and quality settings of the IR affect the report
+        try:
+            cache_key = hash_content(
+                {
+                    "output": output,
+                    "output_contract": ir.get("output_contract", {}),
+                    "quality_checks": ir.get("quality_checks", {}),
+                }
+            )
+        except TypeError:
+            cache_key = None  # Not canonically serializable; validate without caching
+
+        if cache_key is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                # Callers may mutate the report, so hand out a private copy.
+                # The original run's stage timings were not measured by this
+                # call, so report only the lookup time.
+                report = copy.deepcopy(cached)
+                timing.stop("cache_hit")
+                report["cache_hit"] = True
+                report["stage_timings_ms"] = timing.get_timings()
+                return report
+
+        report = await self._validate(output, ir)
+        if cache_key is not None:
+            self._cache.set(cache_key, copy.deepcopy(report))
+        return report
+
+    async def _validate(self, output: str, ir: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the parser, concurrent checks and contract verification."""
+        timing = TimingContext()
 
         # Parse output first
         with timing.stage("parser"):
@@ -49,36 +106,46 @@ class OutputValidator:
 
         # Run validators concurrently
         with timing.stage("concurrent_validation"):
-            syntax_task = asyncio.create_task(
-                self._run_syntax_validation(file_blocks)
-            )
-            security_task = asyncio.create_task(
-                self._run_security_scan(file_blocks)
+            checks = asyncio.gather(
+                self._run_syntax_validation(file_blocks),
+                self._run_security_scan(file_blocks),
+                self._run_quality_check(file_blocks),
             )
-            quality_task = asyncio.create_task(
-                self._run_quality_check(file_blocks)
-            )
-
-            # Wait for all concurrent tasks
-            syntax_valid, syntax_findings = await syntax_task
-            security_findings = await security_task
-            quality_findings = await quality_task
 
-        # Contract verification (depends on parsed output)
-        with timing.stage("contract_verification"):
-            contract_compliant, compliance_summary = self.contract_verifier.verify(
-                parsed_output, ir
-            )
+            # Let the checks hand their work to the thread pool, then verify the
+            # contract (depends only on parsed output) while they run
+            await asyncio.sleep(0)
+            try:
+                with timing.stage("contract_verification"):
+                    contract_compliant, compliance_summary = self.contract_verifier.verify(
+                        parsed_output, ir
+                    )
+            except BaseException:
+                # Do not leave the checks running unobserved
+                checks.cancel()
+                await asyncio.gather(checks, return_exceptions=True)
+                raise
+
+            # Wait for all concurrent checks
+            (syntax_valid, syntax_findings), security_findings, quality_findings = await checks
 
         # Merge findings
         all_findings = syntax_findings + security_findings + quality_findings
 
+        # Tally severities in one pass
+        error_count = warning_count = security_error_count = 0
+        for finding in all_findings:
+            severity = finding.get("severity")
+            if severity == "error":
+                error_count += 1
+                if finding.get("type") == "security":
+                    security_error_count += 1
+            elif severity == "warning":
+                warning_count += 1
+
         # Determine overall status
-        has_errors = any(f.get("severity") == "error" for f in all_findings)
-        has_security_errors = any(
-            f.get("type") == "security" and f.get("severity") == "error"
-            for f in all_findings
-        )
+        has_errors = error_count > 0
+        has_security_errors = security_error_count > 0
 
         # High security + strict mode → contract violations => BLOCKED
         security_level = ir.get("quality_checks", {}).get("security_level", "low")
@@ -99,13 +166,14 @@ class OutputValidator:
         report = {
             "status": status,
             "parallel": True,
+            "cache_hit": False,
             "stage_timings_ms": timing.get_timings(),
             "findings": all_findings,
             "contract_compliance": compliance_summary,
             "summary": {
                 "total_findings": len(all_findings),
-                "errors": len([f for f in all_findings if f.get("severity") == "error"]),
-                "warnings": len([f for f in all_findings if f.get("severity") == "warning"]),
+                "errors": error_count,
+                "warnings": warning_count,
                 "syntax_valid": syntax_valid,
                 "contract_compliant": contract_compliant,
             },
@@ -118,26 +186,31 @@ class OutputValidator:
         self, file_blocks: List[Dict[str, str]]
     ) -> tuple[bool, List[Dict[str, Any]]]:
         """Run syntax validation asynchronously."""
-        # Run in thread pool since it's CPU-bound
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None, self.syntax_validator.validate, file_blocks
-        )
+        return await self._offload(self.syntax_validator.validate, file_blocks)
 
     async def _run_security_scan(
         self, file_blocks: List[Dict[str, str]]
     ) -> List[Dict[str, Any]]:
         """Run security scan asynchronously."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None, self.security_scanner.scan, file_blocks
-        )
+        return await asyncio.to_thread(self.security_scanner.scan, file_blocks)
 
     async def _run_quality_check(
         self, file_blocks: List[Dict[str, str]]
     ) -> List[Dict[str, Any]]:
         """Run quality check asynchronously."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None, self.quality_checker.check, file_blocks
-        )
+        return await self._offload(self.quality_checker.check, file_blocks)
+
+    async def _offload(
+        self, check: Callable[[List[Dict[str, str]]], T], file_blocks: List[Dict[str, str]]
+    ) -> T:
+        """Run a CPU-bound check in the process pool for large outputs, else a thread."""
+        total_chars = sum(len(file_block.get("content", "")) for file_block in file_blocks)
+        if total_chars >= self.PROCESS_POOL_MIN_CHARS:
+            loop = asyncio.get_running_loop()
+            pool = get_process_pool()
+            try:
+                return await loop.run_in_executor(pool, check, file_blocks)
+            except (BrokenProcessPool, OSError) as e:
+                logger.warning(f"Process pool unavailable, checking in a thread: {e}")
+                reset_process_pool(pool)
+        return await asyncio.to_thread(check, file_blocks)
@@ -2,13 +2,83 @@
 
 import re
 import logging
-from typing import Any, Dict, List
+from bisect import bisect_right
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+
+from promptlang.core.utils.process_pool import get_process_pool, reset_process_pool
 
 logger = logging.getLogger(__name__)
 
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+_NEWLINE = re.compile(b"\n")
+_ESCAPE_OR_UPPER = re.compile(r"\\.|[A-Z]")
+
+# Characters a str pattern with re.IGNORECASE treats as ``\s`` or as an ASCII
+# letter, but which the bytes patterns (ASCII ``\s``; RE2 also drops ``\v``
+# and re drops \x1c-\x1f) would not match once encoded. They are mapped to
+# their ASCII equivalent before encoding so detection matches str semantics.
+_BYTES_FOLD = str.maketrans({
+    **{c: " " for c in "\v\x1c\x1d\x1e\x1f\x85\xa0\u1680\u2028\u2029\u202f\u205f\u3000"},
+    **{chr(c): " " for c in range(0x2000, 0x200B)},
+    "\u0130": "i",  # LATIN CAPITAL LETTER I WITH DOT ABOVE
+    "\u0131": "i",  # LATIN SMALL LETTER DOTLESS I
+    "\u017f": "s",  # LATIN SMALL LETTER LONG S
+    "\u212a": "k",  # KELVIN SIGN
+})
+_NEEDS_BYTES_FOLD = re.compile("[" + "".join(re.escape(chr(c)) for c in _BYTES_FOLD) + "]")
+
+
+def _fold_pattern(pattern: str) -> str:
+    """Lowercase a pattern's literal letters, leaving escapes like ``\\S`` intact."""
+    return _ESCAPE_OR_UPPER.sub(
+        lambda m: m.group() if m.group().startswith("\\") else m.group().lower(), pattern
+    )
+
+
+def _compile(pattern: str) -> Pattern[bytes]:
+    """Compile a case-sensitive bytes pattern for lowercased content, with RE2 when installed.
+
+    Content is lowercased once per file, so patterns are folded with
+    ``_fold_pattern`` and matched without per-character case folding.
+    RE2 matches in linear time, so backtracking-prone patterns like
+    ``SELECT\\s+.*\\s+FROM\\s+.*%s`` cannot blow up on generated output.
+    """
+    pattern_bytes = _fold_pattern(pattern).encode("ascii")
+    if RE2_AVAILABLE:
+        options = re2.Options()
+        options.encoding = re2.Options.Encoding.LATIN1
+        try:
+            return re2.compile(pattern_bytes, options)
+        except re2.error as e:
+            logger.warning(f"RE2 cannot compile {pattern!r}, using re: {e}")
+    return re.compile(pattern_bytes)
+
+
+def _newline_offsets(content: bytes) -> List[int]:
+    """Return sorted offsets of every newline, for bisecting match lines."""
+    return [match.start() for match in _NEWLINE.finditer(content)]
+
+
+def _scan_file_block_worker(file_block: Dict[str, str]) -> List[Dict[str, Any]]:
+    """Process pool entry point scanning a single file block."""
+    return SecurityScanner().scan_file_block(file_block)
+
 
 class SecurityScanner:
-    """Security scanner for common vulnerabilities (CWE-aware)."""
+    """Security scanner for common vulnerabilities (CWE-aware).
+
+    Regex matching holds the GIL, so scans of at least ``PARALLEL_MIN_FILES``
+    file blocks are spread over a shared process pool; smaller scans, where
+    process overhead would dominate, run inline.
+    """
+
+    PARALLEL_MIN_FILES = 16
 
     # CWE-798: Hardcoded secrets
     SECRET_PATTERNS = [
@@ -30,6 +100,34 @@ class SecurityScanner:
         (r'document\.write\s*\([^)]*\+', "CWE-79", "Potential XSS (document.write with concatenation)"),
     ]
 
+    # Lowercase literals, one of which must appear for each pattern to match.
+    # Aligned with the pattern tables; checked with plain substring tests so
+    # most patterns never run on files that cannot match them.
+    _SECRET_ANCHORS = ((b"password",), (b"api",), (b"secret",), (b'"', b"'"))
+    _SQL_INJECTION_ANCHORS = ((b"select", b"%("), (b"execute",))
+    _XSS_ANCHORS = ((b"innerhtml",), (b"document.write",))
+
+    # Compiled once at class creation so scans skip the re module's pattern cache
+    _SECRET_REGEXES = tuple(
+        (_compile(pattern), cwe, message, anchors)
+        for (pattern, cwe, message), anchors in zip(SECRET_PATTERNS, _SECRET_ANCHORS)
+    )
+    _SQL_INJECTION_REGEXES = tuple(
+        (_compile(pattern), cwe, message, anchors)
+        for (pattern, cwe, message), anchors in zip(SQL_INJECTION_PATTERNS, _SQL_INJECTION_ANCHORS)
+    )
+    _XSS_REGEXES = tuple(
+        (_compile(pattern), cwe, message, anchors)
+        for (pattern, cwe, message), anchors in zip(XSS_PATTERNS, _XSS_ANCHORS)
+    )
+
+    # One alternation per category, searched once as a prefilter: a clean file
+    # (the common case) costs a single pass instead of one pass per pattern.
+    # Findings still come from the individual patterns, which may overlap.
+    _SECRET_ANY = _compile("|".join(f"(?:{p})" for p, _, _ in SECRET_PATTERNS))
+    _SQL_INJECTION_ANY = _compile("|".join(f"(?:{p})" for p, _, _ in SQL_INJECTION_PATTERNS))
+    _XSS_ANY = _compile("|".join(f"(?:{p})" for p, _, _ in XSS_PATTERNS))
+
     def scan(self, file_blocks: List[Dict[str, str]]) -> List[Dict[str, Any]]:
         """Scan file blocks for security issues.
 
@@ -38,70 +136,116 @@ class SecurityScanner:
         """
         findings: List[Dict[str, Any]] = []
 
+        if len(file_blocks) >= self.PARALLEL_MIN_FILES:
+            pool = get_process_pool()
+            try:
+                for file_findings in pool.map(_scan_file_block_worker, file_blocks, chunksize=4):
+                    findings.extend(file_findings)
+                return findings
+            except (BrokenProcessPool, OSError) as e:
+                logger.warning(f"Parallel security scan failed, scanning inline: {e}")
+                reset_process_pool(pool)
+                findings.clear()
+
         for file_block in file_blocks:
-            path = file_block.get("path", "")
-            content = file_block.get("content", "")
+            findings.extend(self.scan_file_block(file_block))
 
-            # Scan for secrets
-            findings.extend(self._scan_secrets(content, path))
+        return findings
 
-            # Scan for SQL injection
-            findings.extend(self._scan_sql_injection(content, path))
+    def scan_file_block(self, file_block: Dict[str, str]) -> List[Dict[str, Any]]:
+        """Scan a single file block for security issues."""
+        path = file_block.get("path", "")
+        # Patterns are ASCII, so match on UTF-8 bytes lowercased once per file:
+        # bytes.lower() only folds ASCII and keeps every byte offset, so the
+        # compiled patterns run case-sensitively and line numbers still line up
+        text = file_block.get("content", "")
+        if _NEEDS_BYTES_FOLD.search(text):
+            text = text.translate(_BYTES_FOLD)
+        content = text.encode("utf-8", "replace")
+        folded = content.lower()
 
-            # Scan for XSS (if JavaScript/TypeScript)
-            if file_block.get("language", "").lower() in ["javascript", "typescript", "js", "ts"]:
-                findings.extend(self._scan_xss(content, path))
+        # Scan for secrets
+        findings = self._scan_secrets(content, path, folded)
 
-        return findings
-
-    def _scan_secrets(self, content: str, path: str) -> List[Dict[str, Any]]:
-        """Scan for hardcoded secrets (CWE-798)."""
-        findings = []
+        # Scan for SQL injection
+        findings.extend(self._scan_sql_injection(content, path, folded))
 
-        for pattern, cwe, message in self.SECRET_PATTERNS:
-            matches = re.finditer(pattern, content, re.IGNORECASE)
-            for match in matches:
-                line_num = content[:match.start()].count("\n") + 1
-                findings.append({
-                    "severity": "error",
-                    "type": "security",
-                    "cwe": cwe,
-                    "file": path,
-                    "message": message,
-                    "line": line_num,
-                    "suggestion": "Use environment variables or secure configuration management",
-                })
+        # Scan for XSS (if JavaScript/TypeScript)
+        if file_block.get("language", "").lower() in ["javascript", "typescript", "js", "ts"]:
+            findings.extend(self._scan_xss(content, path, folded))
 
         return findings
 
-    def _scan_sql_injection(self, content: str, path: str) -> List[Dict[str, Any]]:
+    def _scan_secrets(
+        self, content: bytes, path: str, folded: Optional[bytes] = None
+    ) -> List[Dict[str, Any]]:
+        """Scan for hardcoded secrets (CWE-798)."""
+        return self._scan_category(
+            content,
+            path,
+            folded,
+            self._SECRET_REGEXES,
+            self._SECRET_ANY,
+            "Use environment variables or secure configuration management",
+        )
+
+    def _scan_sql_injection(
+        self, content: bytes, path: str, folded: Optional[bytes] = None
+    ) -> List[Dict[str, Any]]:
         """Scan for SQL injection patterns (CWE-89)."""
-        findings = []
+        return self._scan_category(
+            content,
+            path,
+            folded,
+            self._SQL_INJECTION_REGEXES,
+            self._SQL_INJECTION_ANY,
+            "Use parameterized queries or ORM methods",
+        )
 
-        for pattern, cwe, message in self.SQL_INJECTION_PATTERNS:
-            matches = re.finditer(pattern, content, re.IGNORECASE)
-            for match in matches:
-                line_num = content[:match.start()].count("\n") + 1
-                findings.append({
-                    "severity": "error",
-                    "type": "security",
-                    "cwe": cwe,
-                    "file": path,
-                    "message": message,
-                    "line": line_num,
-                    "suggestion": "Use parameterized queries or ORM methods",
-                })
+    def _scan_xss(
+        self, content: bytes, path: str, folded: Optional[bytes] = None
+    ) -> List[Dict[str, Any]]:
+        """Scan for XSS patterns (CWE-79)."""
+        return self._scan_category(
+            content,
+            path,
+            folded,
+            self._XSS_REGEXES,
+            self._XSS_ANY,
+            "Use textContent or proper sanitization",
+        )
 
-        return findings
+    def _scan_category(
+        self,
+        content: bytes,
+        path: str,
+        folded: Optional[bytes],
+        regexes: Tuple[Tuple[Pattern[bytes], str, str, Tuple[bytes, ...]], ...],
+        any_regex: Pattern[bytes],
+        suggestion: str,
+    ) -> List[Dict[str, Any]]:
+        """Run one category's patterns whose literal anchors occur in the content."""
+        findings: List[Dict[str, Any]] = []
 
-    def _scan_xss(self, content: str, path: str) -> List[Dict[str, Any]]:
-        """Scan for XSS patterns (CWE-79)."""
-        findings = []
+        if folded is None:
+            folded = content.lower()
+        active = [
+            (regex, cwe, message)
+            for regex, cwe, message, anchors in regexes
+            if any(anchor in folded for anchor in anchors)
+        ]
+        if not active:
+            return findings
+
+        # No pattern matches before the alternation's first hit
+        first = any_regex.search(folded)
+        if first is None:
+            return findings
+        newlines = _newline_offsets(folded)
 
-        for pattern, cwe, message in self.XSS_PATTERNS:
-            matches = re.finditer(pattern, content, re.IGNORECASE)
-            for match in matches:
-                line_num = content[:match.start()].count("\n") + 1
+        for regex, cwe, message in active:
+            for match in regex.finditer(folded, first.start()):
+                line_num = bisect_right(newlines, match.start()) + 1
                 findings.append({
                     "severity": "error",
                     "type": "security",
@@ -109,7 +253,7 @@ class SecurityScanner:
                     "file": path,
                     "message": message,
                     "line": line_num,
-                    "suggestion": "Use textContent or proper sanitization",
+                    "suggestion": suggestion,
                 })
 
         return findings
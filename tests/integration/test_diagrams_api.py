@@ -0,0 +1,221 @@
+"""Integration tests for the diagram catalog endpoints."""
+
+import uuid
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from promptlang.api.main import app
+from promptlang.api.routes import diagrams as diagrams_module
+from promptlang.api.routes import generate as generate_routes
+from promptlang.core.cache.manager import CacheManager
+
+
+@pytest.mark.asyncio
+async def test_catalog_categories_count_their_diagrams():
+    """Test category counts agree with the catalog served by /catalog."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        catalog = (await client.get("/api/diagrams/catalog")).json()["data"]
+        categories = (await client.get("/api/diagrams/catalog/categories")).json()["data"]
+
+    assert sum(c["count"] for c in categories.values()) == len(catalog["diagrams"])
+    for category in categories.values():
+        assert category["count"] == len(category["diagrams"])
+
+
+@pytest.mark.asyncio
+async def test_catalog_categories_revalidate_with_etag():
+    """Test the cached categories body is served with an ETag honoured on revalidation."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        resp = await client.get("/api/diagrams/catalog/categories")
+        cached = await client.get(
+            "/api/diagrams/catalog/categories", headers={"If-None-Match": resp.headers["etag"]}
+        )
+
+    assert resp.headers["content-type"] == "application/json"
+    assert resp.json()["success"] is True
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == resp.headers["etag"]
+
+
+@pytest.mark.asyncio
+async def test_catalog_responses_are_gzip_encoded_when_accepted():
+    """Test large catalog bodies are gzipped only for clients that accept it."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        categories = await client.get("/api/diagrams/catalog/categories")
+        catalog = await client.get("/api/diagrams/catalog")
+        identity = await client.get(
+            "/api/diagrams/catalog/categories", headers={"Accept-Encoding": "identity"}
+        )
+
+    assert categories.headers["content-encoding"] == "gzip"
+    assert catalog.headers["content-encoding"] == "gzip"
+    assert "content-encoding" not in identity.headers
+    assert identity.json() == categories.json()
+
+
+@pytest.mark.asyncio
+async def test_formats_are_serialized_as_enum_values():
+    """Test formats come back as plain strings with JSON content type."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        resp = await client.get("/api/diagrams/formats")
+
+    assert resp.headers["content-type"] == "application/json"
+    names = {f["name"] for f in resp.json()["data"]}
+    assert "svg" in names
+
+
+@pytest.mark.asyncio
+async def test_download_diagram_revalidates_with_etag(tmp_path, monkeypatch):
+    """Test a matching If-None-Match short-circuits to 304 and missing files 404."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "diagrams").mkdir()
+    (tmp_path / "diagrams" / "erd.svg").write_text("<svg/>")
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        resp = await client.get("/api/diagrams/download/erd")
+        cached = await client.get(
+            "/api/diagrams/download/erd", headers={"If-None-Match": resp.headers["etag"]}
+        )
+        missing = await client.get("/api/diagrams/download/nope")
+
+    assert resp.status_code == 200
+    assert resp.text == "<svg/>"
+    assert resp.headers["content-length"] == "6"
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_export_without_directory_is_not_found(tmp_path, monkeypatch):
+    """Test a missing export directory is reported as 404, not a server error."""
+    monkeypatch.chdir(tmp_path)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        resp = await client.get("/api/diagrams/export/abc")
+
+    assert resp.status_code == 404
+    assert resp.json()["detail"] == "Export not found"
+
+
+@pytest.mark.asyncio
+async def test_async_pipeline_persists_result_snapshot(tmp_path, monkeypatch):
+    """Test a finished async pipeline is released and its result stored as JSON."""
+    monkeypatch.chdir(tmp_path)
+    cache_manager = CacheManager(l2_redis_url="redis://localhost:1/0")
+    monkeypatch.setattr(generate_routes, "cache_manager", cache_manager)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        started = await client.post(
+            "/api/diagrams/generate-async", json={"prd_content": "A REST API with users"}
+        )
+        pipeline_id = started.json()["pipeline_id"]
+        assert uuid.UUID(pipeline_id).version == 4
+        status = await client.get(f"/api/diagrams/status/{pipeline_id}")
+        missing = await client.get("/api/diagrams/status/unknown")
+
+    assert diagrams_module.pipelines.get(pipeline_id) is None
+    snapshot = status.json()["status"]
+    assert snapshot["status"] == "completed"
+    assert snapshot["config"]["output_format"] == "svg"
+    assert snapshot["result"]["recommendations"]
+    assert missing.status_code == 404
+    # Without Redis the snapshot stays in the module's bounded job cache
+    assert diagrams_module.pipelines.get(f"diagram_pipeline:{pipeline_id}") is not None
+    assert cache_manager.l1.get(f"diagram_pipeline:{pipeline_id}") is None
+    # With Redis, snapshots go to the shared L2 tier only
+    monkeypatch.setattr(cache_manager.l2, "_redis", object())
+    monkeypatch.setattr(cache_manager.l2, "_enabled", True)
+    assert diagrams_module._result_store() is cache_manager.l2
+
+
+@pytest.mark.asyncio
+async def test_upload_prd_decodes_in_chunks_and_caps_size(monkeypatch):
+    """Test chunked decoding across multi-byte boundaries, size cap and bad encodings."""
+    monkeypatch.setattr(diagrams_module, "PRD_CHUNK_SIZE", 7)
+    monkeypatch.setattr(diagrams_module, "MAX_PRD_BYTES", 4096)
+    content = "Résumé ✓ " * 100
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        ok = await client.post(
+            "/api/diagrams/upload-prd", files={"file": ("PRD.MD", content.encode("utf-8"))}
+        )
+        too_large = await client.post(
+            "/api/diagrams/upload-prd", files={"file": ("prd.md", b"x" * 5000)}
+        )
+        bad_encoding = await client.post(
+            "/api/diagrams/upload-prd", files={"file": ("prd.txt", b"ok \xff")}
+        )
+
+    body = ok.json()
+    assert body["content_length"] == len(content)
+    assert body["content_preview"] == content[:500] + "..."
+    assert too_large.status_code == 413
+    assert bad_encoding.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_generate_returns_api_dicts(tmp_path, monkeypatch):
+    """Test recommendations and diagrams are returned with enum values flattened."""
+    monkeypatch.chdir(tmp_path)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        resp = await client.post(
+            "/api/diagrams/generate",
+            json={"prd_content": "A web app with users, a REST API and a PostgreSQL database"},
+        )
+
+    body = resp.json()
+    assert resp.status_code == 200
+    rec = body["recommendations"][0]
+    assert set(rec) == {
+        "id", "name", "category", "score", "tier", "reasoning",
+        "confidence", "effort", "prerequisites_met", "complementary_diagrams",
+    }
+    assert all(isinstance(d["tool"], str) for d in body["generated_diagrams"])
+
+
+@pytest.mark.asyncio
+async def test_validate_config_does_not_build_a_pipeline(monkeypatch):
+    """Test config validation only inspects the config."""
+    def fail(*args, **kwargs):
+        raise AssertionError("DiagramPipeline should not be constructed")
+
+    monkeypatch.setattr(diagrams_module, "DiagramPipeline", fail)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        ok = await client.post("/api/diagrams/validate-config", json={})
+        bad = await client.post(
+            "/api/diagrams/validate-config",
+            json={"max_diagrams": 0, "min_score_threshold": 2, "preferred_tool": "mermaid"},
+        )
+
+    assert ok.json() == {"valid": True, "issues": []}
+    assert bad.json()["valid"] is False
+    assert bad.json()["issues"] == [
+        "max_diagrams must be greater than 0",
+        "min_score_threshold must be between 0 and 1",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_generate_endpoints_reject_invalid_config(monkeypatch):
+    """Test sync and async generation return 400 with the config issues."""
+    def fail(*args, **kwargs):
+        raise AssertionError("DiagramPipeline should not be constructed")
+
+    monkeypatch.setattr(diagrams_module, "DiagramPipeline", fail)
+    body = {"prd_content": "A REST API with users", "config": {"max_diagrams": 0}}
+    active = diagrams_module.pipelines.stats()["size"]
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        sync = await client.post("/api/diagrams/generate", json=body)
+        started = await client.post("/api/diagrams/generate-async", json=body)
+
+    for response in (sync, started):
+        assert response.status_code == 400
+        assert response.json()["detail"] == {
+            "config_issues": ["max_diagrams must be greater than 0"]
+        }
+    assert diagrams_module.pipelines.stats()["size"] == active
@@ -0,0 +1,57 @@
+"""Integration tests for the /api/generate endpoint."""
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from promptlang.api.main import app
+from promptlang.api.routes import generate as generate_module
+
+
+class _FakeOrchestrator:
+    async def execute(self, **kwargs):
+        return {
+            "status": "success",
+            "ir_json": {"meta": {"intent": "scaffold"}},
+            "optimized_ir": {"meta": {"intent": "scaffold"}, "optimization": {}},
+            "compiled_prompt": "prompt",
+            "output": "output",
+            "validation_report": {
+                "status": "success",
+                "parallel": True,
+                "stage_timings_ms": {"parser": 0.1},
+                "findings": [],
+                "contract_compliance": {"compliant": True},
+                "summary": {"total_findings": 0},
+            },
+            "warnings": [
+                "Estimated tokens exceed budget",
+                {"severity": "warning", "rule": "token_budget_reasonableness", "message": "large"},
+            ],
+            "provenance": {
+                "request_id": "req-1",
+                "build_hash": "abcd1234",
+                "stage_timings_ms": {"stage_1_intent": 0.2},
+                "token_usage": {"estimated": 10, "budget": 4000},
+                "cost_metadata": {},
+                "transformation_chain": ("input_normalization", "intent_routing"),
+            },
+            "knowledge_sources_used": [],
+            "knowledge_top_k": 6,
+            "rag_enabled": False,
+        }
+
+
+@pytest.mark.asyncio
+async def test_generate_returns_pipeline_result(monkeypatch):
+    """Test the pipeline result is returned as-is, including lint finding warnings."""
+    monkeypatch.setattr(generate_module, "orchestrator", _FakeOrchestrator(), raising=True)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        resp = await client.post("/api/generate", json={"input": "Create a FastAPI REST API"})
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["warnings"][1]["rule"] == "token_budget_reasonableness"
+    assert body["provenance"]["transformation_chain"] == ["input_normalization", "intent_routing"]
+    assert body["validation_report"]["stage_timings_ms"] == {"parser": 0.1}
+    assert body["cache_hit"] is False
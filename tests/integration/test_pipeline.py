@@ -2,11 +2,14 @@
 
 import asyncio
 import json
+import threading
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from promptlang.core.cache.manager import CacheManager
+from promptlang.core.cache.semantic import SemanticResponseCache
 from promptlang.core.pipeline.orchestrator import PipelineOrchestrator
 
 
@@ -76,6 +79,77 @@ async def test_pipeline_caching(orchestrator):
     assert result1["ir_json"] == result2["ir_json"]
 
 
+@pytest.mark.asyncio
+async def test_pipeline_input_cache_skips_translation(orchestrator, monkeypatch):
+    """Test an identical request is served before IR translation runs."""
+    await orchestrator.execute(input_text="Create a cached project", target_model="oss")
+
+    async def fail_build(*args, **kwargs):
+        raise AssertionError("IR translation should be skipped on input cache hit")
+
+    monkeypatch.setattr(orchestrator.ir_builder, "build", fail_build)
+    result = await orchestrator.execute(input_text="Create a cached project", target_model="oss")
+    assert "ir_json" in result
+    assert result["cache_hit"] is True
+
+
+class _KeywordEmbedder:
+    """Embeds text as normalized counts of a few keywords."""
+
+    _VOCAB = ("fastapi", "api", "rest", "react", "ui")
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return len(self._VOCAB)
+
+    def encode(self, text: str, normalize_embeddings: bool = True):
+        words = text.lower().split()
+        vec = np.array([words.count(w) for w in self._VOCAB], dtype=np.float32) + 1e-3
+        return vec / np.linalg.norm(vec)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_semantic_cache_serves_paraphrases(monkeypatch):
+    """Test a paraphrased request with the same parameters skips translation."""
+    orchestrator = PipelineOrchestrator(
+        cache_manager=CacheManager(),
+        semantic_cache=SemanticResponseCache(threshold=0.95, embedder=_KeywordEmbedder()),
+    )
+    first = await orchestrator.execute(input_text="Create a FastAPI REST API", target_model="oss")
+
+    async def fail_build(*args, **kwargs):
+        raise AssertionError("IR translation should be skipped on semantic cache hit")
+
+    monkeypatch.setattr(orchestrator.ir_builder, "build", fail_build)
+    paraphrase = "Please create a REST API in FastAPI"
+    result = await orchestrator.execute(input_text=paraphrase, target_model="oss")
+    assert result["cache_hit"] is True
+    assert result["ir_json"] == first["ir_json"]
+
+    # Same text but another target model must not reuse the result
+    with pytest.raises(AssertionError):
+        await orchestrator.execute(input_text=paraphrase, target_model="gpt")
+    orchestrator.close()
+
+
+def test_pipeline_semantic_cache_is_opt_in(monkeypatch):
+    """Test the semantic cache is off by default and shares the retriever's embedder."""
+    from promptlang.core.knowledge.retriever import KnowledgeRetriever
+
+    monkeypatch.delenv("PROMPTLANG_SEMANTIC_CACHE", raising=False)
+    default = PipelineOrchestrator(cache_manager=CacheManager())
+    assert default.semantic_cache is None
+    default.close()
+
+    embedder = _KeywordEmbedder()
+    monkeypatch.setattr(KnowledgeRetriever, "_shared_embedder", embedder)
+    monkeypatch.setenv("PROMPTLANG_SEMANTIC_CACHE", "true")
+    enabled = PipelineOrchestrator(cache_manager=CacheManager())
+    assert isinstance(enabled.semantic_cache, SemanticResponseCache)
+    enabled.semantic_cache.set("Create a FastAPI REST API", "oss", {"ok": True})
+    assert enabled.semantic_cache._embedder is embedder
+    enabled.close()
+
+
 @pytest.mark.asyncio
 async def test_pipeline_stage_4_5_parallelism(orchestrator):
     """Test that stages 4 and 5 run concurrently."""
@@ -89,3 +163,37 @@ async def test_pipeline_stage_4_5_parallelism(orchestrator):
     # Both stage_4 and stage_5 should have timings
     assert "stage_4_5_parallel" in timings
     # Parallel stage should complete faster than sequential would
+
+
+@pytest.mark.asyncio
+async def test_pipeline_runs_retrieval_and_validation_concurrently(orchestrator, monkeypatch):
+    """Test RAG retrieval and schema validation overlap in worker threads."""
+    barrier = threading.Barrier(2, timeout=5)
+    validate = orchestrator.ir_validator.validate
+
+    class _Retriever:
+        def search(self, query, top_k=6):
+            barrier.wait()
+            return [{"url": "https://example.com/doc", "text": "doc", "title": "", "score": 1.0}]
+
+    def validate_after_barrier(ir):
+        barrier.wait()
+        return validate(ir)
+
+    monkeypatch.setattr(orchestrator, "knowledge_retriever", _Retriever())
+    monkeypatch.setattr(orchestrator.ir_validator, "validate", validate_after_barrier)
+
+    result = await orchestrator.execute(input_text="Create a concurrent project", target_model="oss")
+    assert result["rag_enabled"] is True
+    assert result["knowledge_sources_used"] == ["https://example.com/doc"]
+    timings = result["provenance"]["stage_timings_ms"]
+    assert "stage_2_5_rag_retrieval" in timings and "stage_3_validate" in timings
+
+
+def test_orchestrators_share_stateless_components(orchestrator):
+    """Test stateless stage components are built once and shared."""
+    other = PipelineOrchestrator(cache_manager=CacheManager())
+    assert other.ir_validator is orchestrator.ir_validator
+    assert other.dialect_compiler is orchestrator.dialect_compiler
+    assert other.ir_builder.intent_router is orchestrator.intent_router
+    other.close()
@@ -0,0 +1,219 @@
+"""Unit tests for the L1, L2 and semantic cache tiers."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from promptlang.core.cache.l1_cache import L1Cache, SemanticL1Cache
+from promptlang.core.cache.manager import CacheManager
+from promptlang.core.cache.semantic import SemanticResponseCache
+
+
+def test_l1_cache_lru_eviction():
+    """Test least recently used entry is evicted first."""
+    cache = L1Cache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_l1_cache_delete_frees_capacity():
+    """Test a deleted key is gone and frees room without evicting others."""
+    cache = L1Cache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.delete("a") is True
+    assert cache.delete("a") is False
+    cache.set("c", 3)
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.get("c") == 3
+
+
+def test_l1_cache_concurrent_access():
+    """Test concurrent get/set from worker threads keeps the cache consistent."""
+    cache = L1Cache(max_size=16)
+
+    def worker(n: int) -> None:
+        for i in range(2000):
+            key = str((n * 7 + i) % 40)
+            cache.set(key, i)
+            cache.get(key)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(worker, range(8)))
+
+    assert cache.stats()["size"] == 16
+
+
+def test_semantic_cache_hits_similar_embedding():
+    """Test near-identical embeddings share an entry."""
+    rng = np.random.default_rng(1)
+    emb = rng.standard_normal(32)
+    cache = SemanticL1Cache(dim=32)
+    cache.set(emb, "value")
+    assert cache.get(emb + rng.standard_normal(32) * 0.01) == "value"
+
+
+def test_semantic_cache_misses_dissimilar_embedding():
+    """Test unrelated embeddings do not hit."""
+    rng = np.random.default_rng(2)
+    cache = SemanticL1Cache(dim=32)
+    cache.set(rng.standard_normal(32), "value")
+    assert cache.get(rng.standard_normal(32)) is None
+
+
+def test_semantic_cache_eviction_and_dimension_check():
+    """Test max_size eviction and dimension validation."""
+    rng = np.random.default_rng(3)
+    cache = SemanticL1Cache(dim=16, max_size=2)
+    embs = [rng.standard_normal(16) for _ in range(3)]
+    for i, emb in enumerate(embs):
+        cache.set(emb, i)
+    assert cache.stats()["size"] == 2
+    assert cache.get(embs[0]) is None
+    assert cache.get(embs[2]) == 2
+    with pytest.raises(ValueError):
+        cache.get(np.zeros(8))
+
+
+def test_l1_cache_expired_entries_purged(monkeypatch):
+    """Test expired entries are dropped without touching live ones."""
+    clock = [1000.0]
+    monkeypatch.setattr("promptlang.core.cache.l1_cache.time.time", lambda: clock[0])
+    cache = L1Cache(max_size=10, ttl_seconds=10)
+    cache.set("old", 1)
+    clock[0] += 5
+    cache.set("new", 2)
+    cache.set("old2", 3)
+    clock[0] += 6
+    assert cache.stats()["size"] == 2
+    assert cache.get("old") is None
+    assert cache.get("new") == 2
+    clock[0] += 10
+    assert cache.stats()["size"] == 0
+
+
+def test_semantic_cache_expired_entries_purged(monkeypatch):
+    """Test stats drops expired semantic entries in expiry order."""
+    clock = [1000.0]
+    monkeypatch.setattr("promptlang.core.cache.l1_cache.time.time", lambda: clock[0])
+    rng = np.random.default_rng(4)
+    cache = SemanticL1Cache(dim=16, max_size=10, ttl_seconds=10)
+    old, new = rng.standard_normal(16), rng.standard_normal(16)
+    cache.set(old, "old")
+    clock[0] += 5
+    cache.set(new, "new")
+    clock[0] += 6
+    assert cache.stats()["size"] == 1
+    assert cache.get(new) == "new"
+    clock[0] += 10
+    assert cache.stats()["size"] == 0
+
+
+class _KeywordEmbedder:
+    """Embeds text as normalized counts of a few keywords."""
+
+    _VOCAB = ("fastapi", "api", "rest", "flask", "react", "ui")
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return len(self._VOCAB)
+
+    def encode(self, text: str, normalize_embeddings: bool = True):
+        words = text.lower().split()
+        vec = np.array([words.count(w) for w in self._VOCAB], dtype=np.float32)
+        return vec / np.linalg.norm(vec)
+
+
+def test_semantic_response_cache_requires_matching_params():
+    """Test paraphrases hit only when the non-text parameters match."""
+    cache = SemanticResponseCache(threshold=0.9, embedder=_KeywordEmbedder())
+    cache.set("build a fastapi rest api", "params-a", {"output": "x"})
+
+    assert cache.get("please build a rest api with fastapi", "params-a") == {"output": "x"}
+    assert cache.get("please build a rest api with fastapi", "params-b") is None
+    assert cache.get("build a react ui", "params-a") is None
+
+
+class _FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def setex(self, key, ttl, data):
+        self.commands.append((key, ttl, data))
+
+    def execute(self):
+        self.client.round_trips += 1
+        for key, _, data in self.commands:
+            self.client.store[key] = data
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.store = {}
+        self.round_trips = 0
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    def get(self, key):
+        self.round_trips += 1
+        return self.store.get(key)
+
+
+def test_cache_manager_set_many_pipelines_l2_writes():
+    """Test set_many fills L1 and writes every L2 key in one round trip."""
+    manager = CacheManager()
+    fake = _FakeRedis()
+    manager.l2._redis, manager.l2._enabled = fake, True
+
+    manager.set_many({"a": {"x": 1}, "b": [1, 2], "c": {1: "one"}})
+
+    assert fake.round_trips == 1
+    assert manager.l1.get("a") == {"x": 1}
+    assert manager.l2.get("b") == [1, 2]
+    # Payloads are orjson bytes; like json, non-string keys come back as strings
+    assert fake.store["a"] == b'{"x":1}'
+    assert manager.l2.get("c") == {"1": "one"}
+
+
+def test_cache_manager_promotes_l2_hits_on_second_hit():
+    """Test L2 hits reach L1 only after a repeat hit, with a bounded ghost list."""
+    manager = CacheManager(l2_ghost_size=2)
+    fake = _FakeRedis()
+    manager.l2._redis, manager.l2._enabled = fake, True
+    manager.l2.set_many({"hot": 1, "a": 2, "b": 3, "c": 4})
+
+    assert manager.get("hot") == 1
+    assert manager.l1.get("hot") is None
+    assert manager.get("hot") == 1
+    assert manager.l1.get("hot") == 1
+
+    # "a" falls out of the two-key ghost list before its second hit
+    for key in ("a", "b", "c", "a"):
+        manager.get(key)
+    assert manager.l1.get("a") is None
+    assert manager.get("a") == 2
+    assert manager.l1.get("a") == 2
+
+
+def test_l2_pools_are_shared_per_url():
+    """Test caches on the same Redis URL reuse one connection pool."""
+    pytest.importorskip("redis")
+    from promptlang.core.cache.l2_cache import _get_pool
+
+    url = "redis://localhost:6399/7"
+    assert _get_pool(url) is _get_pool(url)
+    assert _get_pool(url) is not _get_pool("redis://localhost:6399/8")
@@ -0,0 +1,57 @@
+"""Unit tests for clarification engine."""
+
+from promptlang.core.clarification.engine import ClarificationEngine
+
+
+def test_clarify_scaffold_with_hints():
+    """Test no questions when language and framework are given."""
+    engine = ClarificationEngine()
+    questions, _ = engine.clarify("Create a Python FastAPI service", "scaffold")
+    assert questions == []
+
+
+def test_clarify_scaffold_matches_whole_words():
+    """Test language hints match words, not substrings of other words."""
+    engine = ClarificationEngine()
+    questions, _ = engine.clarify("Build a good django app", "scaffold")
+    assert questions == ["What programming language should we use?"]
+
+
+def test_clarify_hints_are_whole_words():
+    """Test fused names are not hints, but digits and punctuation end a word."""
+    engine = ClarificationEngine()
+    questions, _ = engine.clarify("Build a golang service with nextjs", "scaffold")
+    assert questions == [
+        "What programming language should we use?",
+        "Which framework should we use?",
+    ]
+    questions, _ = engine.clarify("Build a python3 app with Next.js", "scaffold")
+    assert questions == []
+
+
+def test_clarify_debug_error_context():
+    """Test compound error names count as error context."""
+    engine = ClarificationEngine()
+    questions, _ = engine.clarify("Fix AttributeError in my code", "debug")
+    assert questions == []
+    questions, _ = engine.clarify("My code is slow", "debug")
+    assert questions == ["Can you provide the error message or traceback?"]
+
+
+def test_clarify_non_ascii_splits_words():
+    """Test non-ASCII characters separate words instead of joining them."""
+    engine = ClarificationEngine()
+    questions, _ = engine.clarify("Créer un projet Python avec Django", "scaffold")
+    assert questions == []
+    questions, _ = engine.clarify("Build a gö app with flask", "scaffold")
+    assert questions == ["What programming language should we use?"]
+
+
+def test_clarify_skips_hints_known_from_partial_ir():
+    """Test stack and error log from the partial IR suppress questions."""
+    engine = ClarificationEngine()
+    partial_ir = {"context": {"stack": {"language": "go"}, "inputs": {"error_log": "panic"}}}
+    questions, _ = engine.clarify("Create a new service", "scaffold", partial_ir)
+    assert questions == ["Which framework should we use?"]
+    questions, _ = engine.clarify("It is broken", "debug", partial_ir)
+    assert questions == []
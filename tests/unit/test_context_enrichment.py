@@ -1,5 +1,6 @@
 import pytest
 
+from promptlang.core.cache.manager import CacheManager
 from promptlang.core.context_enrichment.best_practices import BestPracticesRetriever
 from promptlang.core.context_enrichment.examples import ExampleCollector
 from promptlang.core.context_enrichment.domain_knowledge import DomainKnowledgeInjector
@@ -27,6 +28,20 @@ def test_best_practices_retriever_builds_query():
     assert "Best practices" in r.queries[0][0]
 
 
+def test_best_practices_retriever_caches_search_results():
+    r = FakeRetriever()
+    bp = BestPracticesRetriever(retriever=r, top_k=3, cache_manager=CacheManager())
+    ir = {"meta": {"intent": "scaffold"}, "task": {"description": "Build an API"}, "context": {"stack": {}}}
+
+    first = bp.retrieve(ir)
+    second = bp.retrieve(ir)
+    assert first == second
+    assert len(r.queries) == 1
+
+    BestPracticesRetriever(retriever=r, top_k=4, cache_manager=bp.cache_manager).retrieve(ir)
+    assert len(r.queries) == 2
+
+
 def test_example_collector_builds_query():
     r = FakeRetriever()
     ex = ExampleCollector(retriever=r, top_k=2)
@@ -70,3 +85,97 @@ def test_context_enricher_aggregates_results():
     assert enriched.best_practices
     assert enriched.examples
     assert enriched.domain_knowledge
+
+
+class BatchingRetriever(FakeRetriever):
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def search_many(self, queries, top_k: int = 6):
+        self.batches.append((list(queries), top_k))
+        return [self.search(q, top_k=top_k) for q in queries]
+
+
+def test_context_enricher_batches_shared_retriever_searches():
+    r = BatchingRetriever()
+    enricher = ContextEnricher(
+        best_practices=BestPracticesRetriever(retriever=r),
+        examples=ExampleCollector(retriever=r),
+        domain_knowledge=DomainKnowledgeInjector(retriever=r),
+    )
+
+    ir = {"meta": {"intent": "scaffold"}, "task": {"description": "Build"}, "context": {"stack": {}}}
+    enriched = enricher.enrich(ir, knowledge_card={"domain": "general"})
+
+    assert len(r.batches) == 1
+    queries, top_k = r.batches[0]
+    assert top_k == 6
+    assert [q.split(".")[0].split(" ")[0] for q in queries] == ["Best", "Examples", "Domain"]
+    assert len(r.queries) == 3
+    assert enriched.examples and enriched.domain_knowledge
+
+
+def test_context_enricher_caches_batched_best_practices():
+    r = BatchingRetriever()
+    cache = CacheManager()
+    enricher = ContextEnricher(
+        best_practices=BestPracticesRetriever(retriever=r, cache_manager=cache),
+        examples=ExampleCollector(retriever=r),
+        domain_knowledge=DomainKnowledgeInjector(retriever=r),
+    )
+
+    ir = {"meta": {"intent": "scaffold"}, "task": {"description": "Build"}, "context": {"stack": {}}}
+    first = enricher.enrich(ir, knowledge_card={"domain": "general"})
+    second = enricher.enrich(ir, knowledge_card={"domain": "general"})
+
+    assert cache.l1.stats()["size"] == 1
+    assert first.best_practices == second.best_practices
+    # The second batch only carries the uncached examples and domain queries
+    assert [len(queries) for queries, _ in r.batches] == [3, 2]
+    assert not any(q.startswith("Best practices") for q in r.batches[1][0])
+
+
+def test_knowledge_retriever_search_many_matches_search(monkeypatch):
+    np = pytest.importorskip("numpy")
+    from promptlang.core.knowledge.retriever import KnowledgeRetriever
+
+    vocab = ["fastapi", "jwt", "docker", "payments", "python"]
+
+    class Embedder:
+        def encode(self, texts, normalize_embeddings=True):
+            counts = [[t.lower().count(w) + 0.1 for w in vocab] for t in texts]
+            vecs = np.array(counts, dtype=np.float32)
+            return vecs / np.linalg.norm(vecs, axis=1, keepdims=True)
+
+    chunks = [
+        {"text": f"{w} guide {i}", "title": w, "url": f"https://example.com/{w}/{i}"}
+        for i in range(3)
+        for w in vocab
+    ]
+    matrix = Embedder().encode([c["text"] for c in chunks])
+
+    class Index:
+        def search(self, q, k):
+            scores = q @ matrix.T
+            order = np.argsort(-scores, axis=1)[:, :k]
+            return np.take_along_axis(scores, order, axis=1), order
+
+    for name, value in {
+        "_shared_chunks": chunks,
+        "_shared_index": Index(),
+        "_shared_embedder": Embedder(),
+        "_loaded": True,
+    }.items():
+        monkeypatch.setattr(KnowledgeRetriever, name, value)
+
+    retriever = KnowledgeRetriever(top_k=3)
+    queries = ["FastAPI JWT auth", "", "payments in python"]
+    batched = retriever.search_many(queries)
+
+    single = [retriever.search(q) for q in queries]
+    assert batched[1] == []
+    assert batched[0] and batched[2]
+    for got, expected in zip(batched, single):
+        assert [r["url"] for r in got] == [r["url"] for r in expected]
+        assert [r["score"] for r in got] == pytest.approx([r["score"] for r in expected])
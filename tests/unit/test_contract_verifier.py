@@ -0,0 +1,32 @@
+"""Unit tests for contract verifier."""
+
+from promptlang.core.validator.contract import ContractVerifier
+
+
+def test_verify_reports_present_and_missing_in_contract_order():
+    """Test required sections and files are split into present and missing."""
+    parsed_output = {
+        "sections": [{"name": "Setup"}, {"name": "Usage"}],
+        "file_blocks": [{"path": "main.py", "language": "python"}],
+    }
+    ir = {
+        "output_contract": {
+            "required_sections": ["Usage", "Testing", "Setup"],
+            "required_files": ["main.py", "README.md"],
+        }
+    }
+    compliant, summary = ContractVerifier().verify(parsed_output, ir)
+    assert not compliant
+    assert summary["required_sections_present"] == ["Usage", "Setup"]
+    assert summary["required_sections_missing"] == ["Testing"]
+    assert summary["required_files_present"] == ["main.py"]
+    assert summary["required_files_missing"] == ["README.md"]
+
+
+def test_verify_without_requirements_checks_only_block_format():
+    """Test an empty contract still enforces strict file block languages."""
+    parsed_output = {"sections": [], "file_blocks": [{"path": "a"}, {"path": "b"}]}
+    compliant, summary = ContractVerifier().verify(parsed_output, {})
+    assert not compliant
+    assert not summary["file_block_format_correct"]
+    assert summary["required_sections_missing"] == []
@@ -0,0 +1,104 @@
+"""Unit tests for dialect compiler."""
+
+from promptlang.core.compiler import dialect_compiler
+from promptlang.core.compiler.dialect_compiler import DialectCompiler
+
+
+def _ir(scope: str = "Build a REST API") -> dict:
+    return {
+        "meta": {"intent": "scaffold", "schema_version": "2.1"},
+        "task": {"goal": "Create service", "scope": scope},
+        "output_contract": {"format": "markdown"},
+    }
+
+
+def test_compile_reuses_cached_output(monkeypatch):
+    """Test identical IRs are compiled once per dialect."""
+    compiler = DialectCompiler()
+    calls = []
+    claude = compiler.compilers["claude"]
+    original = claude.compile
+    monkeypatch.setattr(claude, "compile", lambda ir: calls.append(ir) or original(ir))
+
+    first = compiler.compile(_ir(), target_model="claude-3")
+    second = compiler.compile(_ir(), target_model="claude-3")
+
+    assert first == second
+    assert len(calls) == 1
+
+
+def test_compile_cache_distinguishes_ir_and_dialect():
+    """Test cache keys include IR content and dialect."""
+    compiler = DialectCompiler()
+    claude = compiler.compile(_ir(), target_model="claude")
+    gpt = compiler.compile(_ir(), target_model="gpt-4")
+    other = compiler.compile(_ir("Build a CLI"), target_model="claude")
+
+    assert claude != gpt
+    assert "Build a CLI" in other
+
+
+def _knowledge() -> list:
+    return [
+        {"url": f"https://docs.example/{i}", "score": 1 - i / 10, "text": 'é "quoted"\n' * 40}
+        for i in range(4)
+    ]
+
+
+def test_knowledge_budget_trims_using_measured_length(monkeypatch):
+    """Test budget trimming measures injected prompts exactly, without building them."""
+    monkeypatch.setattr(dialect_compiler, "get_token_encoding", lambda: None)
+    compiler = DialectCompiler()
+    knowledge = _knowledge()
+    for model in ("gpt-4", "claude"):
+        base = compiler.compile(_ir(), target_model=model)
+        dialect = "gpt" if model == "gpt-4" else "claude"
+        assert compiler._make_injector(base, dialect)[0] is None
+        measure, inject = compiler._make_injector(base, dialect, measured=True)
+        block = "REFERENCE 日本\t\"x\"\n"
+        assert measure(block) == len(inject(block))
+
+        full = compiler.compile(_ir(), target_model=model, retrieved_knowledge=knowledge)
+        budget = len(full) // 4 - 1
+        trimmed = compiler.compile(
+            _ir(), target_model=model, retrieved_knowledge=knowledge, token_budget=budget
+        )
+        assert "https://docs.example/3" in full
+        assert "https://docs.example/3" not in trimmed
+        assert "https://docs.example/0" in trimmed
+
+
+class _WordEncoding:
+    """Stand-in BPE encoding counting whitespace-separated words."""
+
+    def encode_ordinary(self, text: str) -> list:
+        return text.split()
+
+
+def test_knowledge_budget_uses_token_encoding(monkeypatch):
+    """Test budget trimming counts prompt and block tokens with the encoding."""
+    encoding = _WordEncoding()
+    monkeypatch.setattr(dialect_compiler, "get_token_encoding", lambda: encoding)
+    compiler = DialectCompiler()
+    base = compiler.compile(_ir(), target_model="claude")
+    full = compiler.compile(_ir(), target_model="claude", retrieved_knowledge=_knowledge())
+    budget = len(encoding.encode_ordinary(full)) - 1
+
+    trimmed = compiler.compile(
+        _ir(), target_model="claude", retrieved_knowledge=_knowledge(), token_budget=budget
+    )
+
+    assert "https://docs.example/2" in trimmed
+    assert "https://docs.example/3" not in trimmed
+    assert len(encoding.encode_ordinary(trimmed)) <= budget
+    assert trimmed.endswith(base)
+
+
+def test_resolve_dialect_prefixes():
+    """Test model names map to dialects by case-insensitive prefix."""
+    resolve = dialect_compiler._resolve_dialect
+    assert resolve("Claude-3-Opus") == "claude"
+    assert resolve("gpt-4o") == "gpt"
+    assert resolve("OpenAI/o1") == "gpt"
+    assert resolve("llama-3") == "oss"
+    assert resolve("my-claude") == "oss"
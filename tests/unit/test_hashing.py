@@ -0,0 +1,21 @@
+"""Unit tests for hashing utilities."""
+
+from promptlang.core.utils.hashing import HASH_ALGORITHM, content_cache_key, hash_content
+
+
+def test_hash_content_is_canonical():
+    """Test key order does not change the hash, but content does."""
+    assert hash_content({"a": 1, "b": [1, 2]}) == hash_content({"b": [1, 2], "a": 1})
+    assert hash_content({"a": 1}) != hash_content({"a": 2})
+    assert len(hash_content({})) == 32
+
+
+def test_hash_content_digest_size():
+    """Test digest size controls the hex length."""
+    assert len(hash_content({"a": 1}, digest_size=8)) == 16
+
+
+def test_content_cache_key_is_tagged_with_algorithm():
+    """Test shared cache keys name their algorithm, so mixed installs never collide."""
+    key = content_cache_key("input", {"a": 1})
+    assert key == f"input:{HASH_ALGORITHM}:{hash_content({'a': 1})}"
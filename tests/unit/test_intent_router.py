@@ -31,3 +31,26 @@ def test_route_default():
     router = IntentRouter()
     intent = router.route("random text without intent markers")
     assert intent == "scaffold"
+
+
+def test_route_counts_multiple_pattern_hits():
+    """Test intent with the most matching patterns wins."""
+    router = IntentRouter()
+    intent = router.route("Deploy with docker to production, fix error later")
+    assert intent == "devops"
+
+
+def test_route_pattern_set_matches_per_pattern_search():
+    """Test the RE2 set scan scores intents like per-pattern searches."""
+    router = IntentRouter()
+    if router._pattern_set is None:
+        pytest.skip("re2 not installed")
+    fallback = IntentRouter()
+    fallback._pattern_set = None
+    for text in [
+        "Deploy with docker to production, fix error later",
+        "Explain how the\nbuild works, then refactor and clean up",
+        "nothing relevant here",
+        "créer un new application; why does it not work?",
+    ]:
+        assert router.route(text) == fallback.route(text)
@@ -40,3 +40,62 @@ def test_validate_repair():
     is_valid, errors, repaired = validator.validate(invalid_ir)
     # Should attempt repair
     assert "task" in repaired
+
+
+def test_get_validator_is_shared():
+    """Test the schema validator is built once per version."""
+    from promptlang.core.ir.schema_loader import get_validator
+
+    assert get_validator("2.1") is get_validator("2.1")
+
+
+def test_repair_does_not_modify_caller_dict():
+    """Test repair works on a copy of the caller's top-level IR."""
+    from promptlang.core.ir.validator import IRValidator
+
+    invalid_ir = {"task": {"goal": "x"}}
+    _, _, repaired = IRValidator(max_retries=2).validate(invalid_ir)
+    assert repaired is not invalid_ir
+    assert set(invalid_ir) == {"task"}
+    assert repaired["constraints"]["must_avoid"] == []
+
+
+def test_validate_memoizes_valid_ir(valid_ir, monkeypatch):
+    """Test an IR already known to be valid skips schema validation."""
+    from promptlang.core.ir import validator as validator_module
+
+    validator = validator_module.IRValidator()
+    assert validator.validate(valid_ir)[0]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("schema validation should be skipped")
+
+    monkeypatch.setattr(validator_module, "validate_ir", fail)
+    assert validator.validate(dict(valid_ir))[0]
+
+
+def test_validate_does_not_memoize_unrepaired_input(valid_ir):
+    """Test only the repaired IR, not the invalid input, is remembered as valid."""
+    invalid_ir = {k: v for k, v in valid_ir.items() if k != "quality_checks"}
+    validator = IRValidator(max_retries=1)
+
+    is_valid, _, repaired = validator.validate(invalid_ir)
+    assert is_valid
+    assert "quality_checks" in repaired
+
+    _, _, again = validator.validate(invalid_ir)
+    assert "quality_checks" in again
+
+
+def test_validate_ir_matches_python_jsonschema(valid_ir, monkeypatch):
+    """Test results are the same with and without the compiled validator."""
+    from promptlang.core.ir import schema_loader
+
+    invalid_ir = {"meta": {"intent": "scaffold"}}
+    with_fast = [schema_loader.validate_ir(ir) for ir in (valid_ir, invalid_ir)]
+
+    monkeypatch.setattr(schema_loader, "get_fast_validator", lambda version="2.1": None)
+    without_fast = [schema_loader.validate_ir(ir) for ir in (valid_ir, invalid_ir)]
+
+    assert with_fast == without_fast
+    assert with_fast[0] == (True, None)
@@ -0,0 +1,44 @@
+"""Unit tests for IR linter."""
+
+from promptlang.core.linter.rules import IRLinter
+
+
+def test_lint_reports_missing_fields_in_order():
+    """Test missing required fields are reported in schema order."""
+    is_valid, findings = IRLinter().lint({"task": {}})
+    missing = [f.message for f in findings if f.rule == "required_fields"]
+    assert not is_valid
+    assert missing == [
+        "Missing required field: meta",
+        "Missing required field: context",
+        "Missing required field: constraints",
+        "Missing required field: output_contract",
+        "Missing required field: quality_checks",
+    ]
+
+
+def test_lint_complete_ir():
+    """Test a complete IR has no findings."""
+    ir = {
+        "meta": {},
+        "task": {},
+        "context": {},
+        "constraints": {"must_avoid": []},
+        "output_contract": {"required_sections": [], "file_block_format": "strict"},
+        "quality_checks": {},
+    }
+    assert IRLinter().lint(ir) == (True, ())
+
+
+def test_lint_progressive_skips_warning_only_rules():
+    """Test progressive mode drops warning-only rules but keeps errors."""
+    ir = {
+        "task": {},
+        "constraints": {"must_avoid": [], "token_budget": 500000},
+    }
+    _, strict = IRLinter().lint(ir)
+    is_valid, progressive = IRLinter().lint(ir, mode="progressive")
+    assert any(f.rule == "token_budget_reasonableness" for f in strict)
+    assert not any(f.rule == "token_budget_reasonableness" for f in progressive)
+    assert not is_valid
+    assert [f for f in strict if f.severity == "error"] == list(progressive)
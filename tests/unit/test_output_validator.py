@@ -0,0 +1,119 @@
+"""Unit tests for output validator."""
+
+import asyncio
+import gc
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from promptlang.core.utils import process_pool
+from promptlang.core.validator import output_validator
+from promptlang.core.validator.output_validator import OutputValidator
+
+OUTPUT = """## Setup
+Install deps.
+
+FILE: app.py
+```python
+def main():
+    password = "hunter2"
+    return 1  # TODO: real value
+```
+
+FILE: broken.py
+```python
+def broken(:
+```
+"""
+
+
+def _comparable(report):
+    return {key: value for key, value in report.items() if key != "stage_timings_ms"}
+
+
+@pytest.mark.asyncio
+async def test_validate_same_report_in_process_pool():
+    """Test offloading checks to worker processes does not change the report."""
+    ir = {"output_contract": {"required_sections": ["Setup"]}}
+    threaded = await OutputValidator().validate(OUTPUT, ir)
+
+    pooled_validator = OutputValidator()
+    pooled_validator.PROCESS_POOL_MIN_CHARS = 0
+    pooled = await pooled_validator.validate(OUTPUT, ir)
+
+    assert _comparable(pooled) == _comparable(threaded)
+    assert not threaded["summary"]["syntax_valid"]
+    assert any(f.get("type") == "security" for f in threaded["findings"])
+
+
+@pytest.mark.asyncio
+async def test_validate_memoizes_report(monkeypatch):
+    """Test identical output and contract reuse the report without re-parsing."""
+    validator = OutputValidator()
+    ir = {"output_contract": {"required_sections": ["Setup"]}, "optimization": {"a": 1}}
+    first = await validator.validate(OUTPUT, ir)
+
+    def fail(output):
+        raise AssertionError("output should not be parsed again")
+
+    monkeypatch.setattr(validator.parser, "parse", fail)
+    second = await validator.validate(OUTPUT, {**ir, "optimization": {"a": 2}})
+    assert first["cache_hit"] is False
+    assert second["cache_hit"] is True
+    assert list(second["stage_timings_ms"]) == ["cache_hit"]
+    assert _comparable(second) == {**_comparable(first), "cache_hit": True}
+    assert second is not first
+    second["findings"].clear()
+    assert (await validator.validate(OUTPUT, ir))["findings"] == first["findings"]
+
+
+@pytest.mark.asyncio
+async def test_validate_contract_error_settles_concurrent_checks(monkeypatch):
+    """Test a failing contract verification still retrieves the concurrent checks."""
+    loop_errors = []
+    asyncio.get_running_loop().set_exception_handler(lambda loop, ctx: loop_errors.append(ctx))
+    validator = OutputValidator()
+
+    def fail_verify(parsed_output, ir):
+        raise ValueError("bad contract")
+
+    async def fail_scan(file_blocks):
+        raise RuntimeError("scan failed")
+
+    monkeypatch.setattr(validator.contract_verifier, "verify", fail_verify)
+    monkeypatch.setattr(validator, "_run_security_scan", fail_scan)
+    with pytest.raises(ValueError):
+        await validator.validate(OUTPUT, {"output_contract": {}})
+
+    await asyncio.sleep(0.05)
+    gc.collect()
+    assert loop_errors == []
+
+
+def test_reset_process_pool_replaces_only_the_broken_pool():
+    """Test a broken pool is dropped once and a replacement is kept."""
+    broken = process_pool.get_process_pool()
+    process_pool.reset_process_pool(broken)
+    fresh = process_pool.get_process_pool()
+    assert fresh is not broken
+
+    process_pool.reset_process_pool(broken)
+    assert process_pool.get_process_pool() is fresh
+
+
+@pytest.mark.asyncio
+async def test_offload_resets_broken_pool_and_falls_back(monkeypatch):
+    """Test a crashed pool is reset and the check still runs in a thread."""
+    class BrokenPool:
+        def submit(self, *args, **kwargs):
+            raise BrokenProcessPool("worker died")
+
+    pool = BrokenPool()
+    resets = []
+    monkeypatch.setattr(output_validator, "get_process_pool", lambda: pool)
+    monkeypatch.setattr(output_validator, "reset_process_pool", resets.append)
+    validator = OutputValidator()
+    validator.PROCESS_POOL_MIN_CHARS = 0
+
+    assert await validator._offload(len, [{"content": "x"}]) == 1
+    assert resets == [pool]
@@ -0,0 +1,59 @@
+"""Unit tests for security scanner."""
+
+from promptlang.core.validator.security import SecurityScanner
+
+
+def test_scan_reports_secrets_with_line_numbers():
+    """Test hardcoded secrets are reported with CWE and line number."""
+    content = 'import os\n\npassword = "hunter2"\napi_key = "abc"\n'
+    findings = SecurityScanner().scan([{"path": "app.py", "content": content}])
+    assert [(f["cwe"], f["message"], f["line"]) for f in findings] == [
+        ("CWE-798", "Hardcoded password", 3),
+        ("CWE-798", "Hardcoded API key", 4),
+    ]
+
+
+def test_scan_xss_only_for_javascript():
+    """Test XSS patterns only apply to JavaScript/TypeScript blocks."""
+    block = {"path": "a.js", "content": "document.write('<b>' + name)"}
+    scanner = SecurityScanner()
+    assert scanner.scan([{**block, "language": "python"}]) == []
+    findings = scanner.scan([{**block, "language": "js"}])
+    assert [f["cwe"] for f in findings] == ["CWE-79"]
+
+
+def test_scan_keeps_overlapping_findings():
+    """Test a match covered by two patterns is reported by both."""
+    content = 'secret = "' + "a" * 40 + '"'
+    findings = SecurityScanner().scan([{"path": "a.py", "content": content}])
+    assert [f["message"] for f in findings] == ["Hardcoded secret", "Potential hardcoded token"]
+
+
+def test_scan_is_ascii_case_insensitive_on_utf8_content():
+    """Test patterns match any ASCII case and lines count past non-ASCII text."""
+    content = '# héllo wörld\nPassWord = "ünïcode"'
+    findings = SecurityScanner().scan([{"path": "a.py", "content": content}])
+    assert [(f["message"], f["line"]) for f in findings] == [("Hardcoded password", 2)]
+
+
+def test_scan_matches_unicode_whitespace_and_case_variants():
+    """Test non-ASCII whitespace and case variants still match like str patterns."""
+    content = 'password\xa0=\xa0"hunter2secret"\napı_key\u3000= "k"\nsecret\v=\x1c"s"'
+    findings = SecurityScanner().scan([{"path": "a.py", "content": content}])
+    assert [(f["message"], f["line"]) for f in findings] == [
+        ("Hardcoded password", 1),
+        ("Hardcoded API key", 2),
+        ("Hardcoded secret", 3),
+    ]
+
+
+def test_scan_parallel_matches_inline():
+    """Test scanning many file blocks in worker processes keeps results and order."""
+    blocks = [
+        {"path": f"f{i}.py", "content": f'x = 1\npassword = "p{i}"\n'}
+        for i in range(20)
+    ]
+    inline = SecurityScanner()
+    inline.PARALLEL_MIN_FILES = len(blocks) + 1
+    assert SecurityScanner().scan(blocks) == inline.scan(blocks)
+    assert [f["file"] for f in inline.scan(blocks)] == [b["path"] for b in blocks]
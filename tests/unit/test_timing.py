@@ -0,0 +1,20 @@
+"""Unit tests for timing utilities."""
+
+import pytest
+
+from promptlang.core.utils.timing import TimingContext
+
+
+def test_stage_records_timing_even_on_error():
+    """Test stages are timed in milliseconds, including failing ones."""
+    timing = TimingContext()
+    with timing.stage("ok"):
+        pass
+    with pytest.raises(ValueError):
+        with timing.stage("failing"):
+            raise ValueError("boom")
+
+    timings = timing.get_timings()
+    assert set(timings) == {"ok", "failing"}
+    assert all(isinstance(ms, float) and ms >= 0 for ms in timings.values())
+    assert timing.stop("never_started") == 0.0
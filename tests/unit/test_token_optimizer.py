@@ -22,6 +22,7 @@ def test_optimize(sample_ir):
     optimized, warnings = optimizer.optimize(sample_ir, token_budget=4000, intent="scaffold")
     assert "optimization" in optimized
     assert "semantic_fingerprint" in optimized["optimization"]
+    assert optimized["optimization"]["estimated_tokens"] > 0
 
 
 def test_optimize_adaptive_budget():
@@ -45,3 +46,21 @@ def test_optimize_large_scope():
     optimizer = TokenOptimizer()
     with pytest.raises(ValueError, match="Scope too large"):
         optimizer.optimize(large_ir, token_budget=1000, intent="scaffold")
+
+
+def test_semantic_fingerprint_is_memoized(sample_ir):
+    """Test the cached fingerprint matches hashing the key fields directly."""
+    from promptlang.core.utils.hashing import hash_content
+
+    fingerprint = TokenOptimizer()._generate_semantic_fingerprint(sample_ir)
+    expected = hash_content(
+        {
+            "intent": sample_ir["meta"].get("intent"),
+            "task_scope": sample_ir["task"].get("scope"),
+            "required_sections": sample_ir["output_contract"].get("required_sections", []),
+        },
+        digest_size=8,
+    )
+    assert fingerprint == expected
+    assert len(fingerprint) == 16
+    assert TokenOptimizer()._generate_semantic_fingerprint(sample_ir) == fingerprint